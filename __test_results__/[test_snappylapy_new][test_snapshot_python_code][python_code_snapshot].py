@@ -0,0 +1 @@
+print('Hello World')
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Atomic writes of snapshots and test results, so an interrupted run never leaves a truncated file behind.
+
+Files are written to a temporary file in the same directory, which then replaces the destination with `os.replace`.
+Readers see either the previous or the complete new file. How durable the writes are after a crash of the machine
+is chosen with the fsync policy:
+
+- `none`: leave flushing to the operating system, the fastest.
+- `file`: fsync every file and its directory when it is written, the most durable.
+- `session`: fsync the files written in the session once at the end of the session.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import pathlib
+import secrets
+import contextlib
+from collections.abc import Generator
+from typing import BinaryIO, Literal, TypeAlias
+
+FsyncPolicy: TypeAlias = Literal["none", "file", "session"]
+
+FSYNC_POLICIES: tuple[FsyncPolicy, ...] = ("none", "file", "session")
+"""Available fsync policies, in order from the fastest to the most durable per write."""
+
+TEMPORARY_FILE_SUFFIX = ".tmp"
+"""Suffix of the temporary files, which are named `.<file name>.<random token>.tmp` next to the destination."""
+
+_fsync_policy: FsyncPolicy = "none"
+_pending_paths: set[pathlib.Path] = set()
+"""Paths written with the `session` policy, which are not fsynced yet."""
+
+
+def set_fsync_policy(policy: FsyncPolicy) -> None:
+    """Set the fsync policy for the writes of the process."""
+    global _fsync_policy  # noqa: PLW0603
+    if policy not in FSYNC_POLICIES:
+        msg = f"Invalid fsync policy {policy!r}, expected one of {', '.join(FSYNC_POLICIES)}."
+        raise ValueError(msg)
+    _fsync_policy = policy
+
+
+def is_temporary_file(path: pathlib.Path) -> bool:
+    """Check if a file is the temporary file of an atomic write, e.g. one left behind by a process that was killed."""
+    return path.name.startswith(".") and path.name.endswith(TEMPORARY_FILE_SUFFIX)
+
+
+def _fsync_directory(directory: pathlib.Path) -> None:
+    """Fsync a directory, so a file replaced in it is durable. Only possible on POSIX systems."""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_file(file: BinaryIO) -> None:
+    """Flush and fsync an open file."""
+    file.flush()
+    os.fsync(file.fileno())
+
+
+@contextlib.contextmanager
+def open_atomic(path: pathlib.Path) -> Generator[BinaryIO, None, None]:
+    """
+    Open a file for writing, which replaces the file at the path when closed without an error.
+
+    Yields:
+        A temporary file in the same directory as the path, removed if an error is raised while writing.
+
+    """
+    temporary_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}{TEMPORARY_FILE_SUFFIX}")
+    # Created with the default permissions, unlike tempfile which only gives the owner access
+    fd = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            yield file
+            if _fsync_policy == "file":
+                _fsync_file(file)
+        os.replace(temporary_path, path)  # noqa: PTH105
+    except BaseException:
+        with contextlib.suppress(OSError):
+            temporary_path.unlink()
+        raise
+    _sync_replaced_file(path)
+
+
+def _sync_replaced_file(path: pathlib.Path) -> None:
+    """Make a file replaced by a rename durable, as chosen by the fsync policy."""
+    if _fsync_policy == "file":
+        _fsync_directory(path.parent)
+    elif _fsync_policy == "session":
+        _pending_paths.add(path)
+
+
+def write_bytes_atomic(path: pathlib.Path, data: bytes) -> None:
+    """Write bytes to a file atomically."""
+    with open_atomic(path) as file:
+        file.write(data)
+
+
+def copy_file_atomic(source: pathlib.Path, destination: pathlib.Path) -> None:
+    """Copy the content of a file atomically, without reading it into memory."""
+    with source.open("rb") as source_file, open_atomic(destination) as destination_file:
+        shutil.copyfileobj(source_file, destination_file)
+
+
+def replace_file(source: pathlib.Path, destination: pathlib.Path) -> None:
+    """Move a file written atomically to another path in the same file system, e.g. out of a namespace directory."""
+    os.replace(source, destination)  # noqa: PTH105
+    _sync_replaced_file(destination)
+
+
+def sync_pending_writes() -> None:
+    """Fsync the files written with the `session` policy and their directories, skipping files deleted since."""
+    directories: set[pathlib.Path] = set()
+    for path in sorted(_pending_paths):
+        try:
+            with path.open("rb+") as file:
+                _fsync_file(file)
+        except FileNotFoundError:
+            continue
+        directories.add(path.parent)
+    for directory in sorted(directories):
+        with contextlib.suppress(FileNotFoundError):
+            _fsync_directory(directory)
+    _pending_paths.clear()
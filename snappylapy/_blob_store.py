@@ -0,0 +1,128 @@
+"""
+Content-addressed blob store for deduplicating identical snapshot payloads.
+
+When deduplication is enabled, the payload of a snapshot is stored once in the `__blobs__` directory in the root
+directory of the session, named by its sha256 digest. The snapshot file itself only contains a small pointer to the
+blob, so identical snapshots (e.g. from parametrized tests or the case folders of `foreach_folder_in`) only take up
+space once. Pointers are resolved against the closest `__blobs__` directory in the snapshot directory or one of its
+parents, which also finds blobs stored next to the snapshots by earlier versions.
+"""
+
+from __future__ import annotations
+
+import os
+import hashlib
+import pathlib
+from collections.abc import Iterable
+from snappylapy._atomic_write import write_bytes_atomic
+from snappylapy._utils_directories import ensure_directory_exists
+from snappylapy.constants import DIRECTORY_NAMES
+
+BLOB_POINTER_PREFIX = b"snappylapy-blob:sha256:"
+_SHA256_HEX_LENGTH = 64
+_POINTER_LENGTH = len(BLOB_POINTER_PREFIX) + _SHA256_HEX_LENGTH
+_POINTER_FILE_SIZES = (_POINTER_LENGTH + 1, _POINTER_LENGTH + 2)
+"""Sizes of pointer files, ending with a line feed or a carriage return and line feed."""
+
+_blob_store_root: pathlib.Path | None = None
+"""Directory of the shared blob store, the current working directory if not set."""
+
+
+def set_blob_store_root(root: pathlib.Path) -> None:
+    """Set the directory the shared blob store is created in, e.g. the root directory of the pytest session."""
+    global _blob_store_root  # noqa: PLW0603
+    _blob_store_root = pathlib.Path(os.path.abspath(root))  # noqa: PTH100
+
+
+def get_blob_dir(snapshot_dir: pathlib.Path) -> pathlib.Path:
+    """Get the blob directory new blobs of a snapshot directory are written to, in it if it is outside of the root."""
+    root = _blob_store_root or pathlib.Path.cwd()
+    if not pathlib.Path(os.path.abspath(snapshot_dir)).is_relative_to(root):  # noqa: PTH100
+        return snapshot_dir / DIRECTORY_NAMES.blob_dir_name
+    return root / DIRECTORY_NAMES.blob_dir_name
+
+
+def calculate_digest(data: bytes) -> str:
+    """Calculate the digest used for addressing blobs."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_blob_path(snapshot_path: pathlib.Path, digest: str) -> pathlib.Path:
+    """Get the path of a blob a snapshot file points to, in the closest blob directory containing it."""
+    snapshot_dir = pathlib.Path(os.path.abspath(snapshot_path.parent))  # noqa: PTH100
+    for directory in (snapshot_dir, *snapshot_dir.parents):
+        blob_path = directory / DIRECTORY_NAMES.blob_dir_name / digest
+        if blob_path.exists():
+            return blob_path
+    return get_blob_dir(snapshot_path.parent) / digest
+
+
+def read_pointer_digest(snapshot_path: pathlib.Path) -> str | None:
+    """Get the digest the snapshot file points to, None if the snapshot is stored as a regular file."""
+    # Only files of the size of a pointer are opened, so regular snapshots cost a stat call
+    if snapshot_path.stat().st_size not in _POINTER_FILE_SIZES:
+        return None
+    with snapshot_path.open("rb") as file:
+        head = file.read(_POINTER_LENGTH + 1)
+    if not head.startswith(BLOB_POINTER_PREFIX):
+        return None
+    return head[len(BLOB_POINTER_PREFIX) : _POINTER_LENGTH].decode("ascii")
+
+
+def read_snapshot_bytes(snapshot_path: pathlib.Path) -> bytes:
+    """Read the payload of a snapshot file, following the pointer to the blob if the snapshot is deduplicated."""
+    data = snapshot_path.read_bytes()
+    if not data.startswith(BLOB_POINTER_PREFIX):
+        return data
+    digest = data[len(BLOB_POINTER_PREFIX) : _POINTER_LENGTH].decode("ascii")
+    return get_blob_path(snapshot_path, digest).read_bytes()
+
+
+def write_deduplicated_snapshot(snapshot_path: pathlib.Path, data: bytes) -> None:
+    """Write the payload to the blob store, unless it is already there, and point the snapshot file to it."""
+    digest = calculate_digest(data)
+    blob_path = get_blob_dir(snapshot_path.parent) / digest
+    if not blob_path.exists():
+        ensure_directory_exists(blob_path.parent)
+        write_bytes_atomic(blob_path, data)
+    write_bytes_atomic(snapshot_path, BLOB_POINTER_PREFIX + digest.encode("ascii") + b"\n")
+
+
+def get_snapshot_size(snapshot_path: pathlib.Path) -> int:
+    """Get the size of the payload of a snapshot, the size of the blob for deduplicated snapshots."""
+    digest = read_pointer_digest(snapshot_path)
+    if digest is not None:
+        return get_blob_path(snapshot_path, digest).stat().st_size
+    return snapshot_path.stat().st_size
+
+
+def get_snapshot_digest(snapshot_path: pathlib.Path) -> str:
+    """Get the digest of the payload of a snapshot, without reading the blob for deduplicated snapshots."""
+    digest = read_pointer_digest(snapshot_path)
+    if digest is not None:
+        return digest
+    return calculate_digest(snapshot_path.read_bytes())
+
+
+def remove_unreferenced_blobs(snapshot_dirs: Iterable[pathlib.Path]) -> list[pathlib.Path]:
+    """
+    Delete blobs no snapshot file in the snapshot directories points to, and return the deleted paths.
+
+    Since the blob store is shared, the snapshot directories must be all the snapshot directories using it.
+    """
+    snapshot_dirs = list(snapshot_dirs)
+    referenced_digests = {
+        read_pointer_digest(snapshot_file)
+        for snapshot_dir in snapshot_dirs
+        for snapshot_file in snapshot_dir.iterdir()
+        if snapshot_file.is_file()
+    }
+    blob_dirs = {get_blob_dir(snapshot_dir) for snapshot_dir in snapshot_dirs}
+    blob_dirs.update(snapshot_dir / DIRECTORY_NAMES.blob_dir_name for snapshot_dir in snapshot_dirs)
+    removed_blobs: list[pathlib.Path] = []
+    for blob_dir in sorted(blob_dirs):
+        if blob_dir.is_dir():
+            removed_blobs.extend(blob for blob in blob_dir.iterdir() if blob.name not in referenced_digests)
+    for blob in removed_blobs:
+        blob.unlink()
+    return removed_blobs
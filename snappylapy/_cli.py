@@ -2,10 +2,21 @@
 
 import re
 import typer
+import shutil
 import pathlib
+import tempfile
 import subprocess  # noqa: S404
 from enum import Enum
-from snappylapy._utils_directories import DirectoryNamesUtil
+from snappylapy._atomic_write import copy_file_atomic
+from snappylapy._blob_store import (
+    calculate_digest,
+    read_pointer_digest,
+    read_snapshot_bytes,
+    remove_unreferenced_blobs,
+    write_deduplicated_snapshot,
+)
+from snappylapy._utils_directories import DirectoryNamesUtil, clear_known_directories, ensure_directory_exists
+from snappylapy.compression import decompress_for_path, get_codec, strip_codec_extension
 from snappylapy.constants import DIRECTORY_NAMES
 
 app = typer.Typer(
@@ -99,13 +110,20 @@ def clear(
 
 
 @app.command()
-def update() -> None:
+def update(
+    deduplicate: bool = typer.Option(
+        False,
+        "--deduplicate",
+        help="Store the snapshots in a content-addressed blob store, so identical snapshots are stored once",
+    ),
+) -> None:
     """
     Use this command to update all snapshot files with the latest test results.
 
     This will overwrite existing snapshots with current test outputs, ensuring your snapshots reflect the latest changes.
 
     The file contents of any files in any of the `__test_results__` folders will be copied to the corresponding `__snapshots__` folder.
+    Snapshots that are already deduplicated are kept deduplicated, and blobs no longer used by any snapshot are deleted.
     """  # noqa: E501
     files_test_results = DirectoryNamesUtil().get_all_file_paths_test_results()
     if not files_test_results:
@@ -124,9 +142,15 @@ def update() -> None:
     )
     for file in files_to_update:
         snapshot_file = file.parent.parent / DIRECTORY_NAMES.snapshot_dir_name / file.name
-        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
-        snapshot_file.write_bytes(file.read_bytes())
+        ensure_directory_exists(snapshot_file.parent)
+        if deduplicate or (snapshot_file.exists() and read_pointer_digest(snapshot_file) is not None):
+            write_deduplicated_snapshot(snapshot_file, file.read_bytes())
+        else:
+            copy_file_atomic(file, snapshot_file)
         typer.echo(f"Updated snapshot: {snapshot_file}")
+    # The blob store is shared by all snapshot directories, so all of them are checked for references
+    for blob in remove_unreferenced_blobs(DirectoryNamesUtil().get_all_directories_for_snapshots()):
+        typer.echo(f"Deleted unused blob: {blob}")
 
 
 @app.command()
@@ -155,7 +179,10 @@ def diff() -> None:
     typer.echo(f"Opening diffs for {len(files_to_diff)} changed files.")
     for file in files_to_diff:
         snapshot_file = file.parent.parent / DIRECTORY_NAMES.snapshot_dir_name / file.name
-        success: bool = _try_open_diff(file, snapshot_file)
+        file_to_show, snapshot_file_to_show = file, snapshot_file
+        if get_codec(file) is not None or read_pointer_digest(snapshot_file) is not None:
+            file_to_show, snapshot_file_to_show = _write_temporary_files_for_diff(file, snapshot_file)
+        success: bool = _try_open_diff(file_to_show, snapshot_file_to_show)
         if not success:
             typer.secho(
                 f"Could not open diff tool. Files to compare:\n"
@@ -171,12 +198,42 @@ def delete_files(list_of_files_to_delete: list[pathlib.Path]) -> None:
     for file in list_of_files_to_delete:
         file.unlink()
     # Delete directories
+    for blob_dir in pathlib.Path().rglob(DIRECTORY_NAMES.blob_dir_name):
+        for blob in blob_dir.iterdir():
+            blob.unlink()
+        blob_dir.rmdir()
+    for test_results_dir in pathlib.Path().rglob(DIRECTORY_NAMES.test_results_dir_name):
+        # Test results of pytest-xdist workers are left behind when a session is interrupted before they are merged
+        shutil.rmtree(test_results_dir / DIRECTORY_NAMES.worker_dir_name, ignore_errors=True)
     for dir_name in [
         DIRECTORY_NAMES.test_results_dir_name,
         DIRECTORY_NAMES.snapshot_dir_name,
     ]:
         for root_dir in pathlib.Path().rglob(dir_name):
             root_dir.rmdir()
+    clear_known_directories()
+
+
+def _write_temporary_files_for_diff(
+    test_result_file: pathlib.Path,
+    snapshot_file: pathlib.Path,
+) -> tuple[pathlib.Path, pathlib.Path]:
+    """
+    Write the decompressed and deduplicated content of a test result and snapshot to temporary files for a diff tool.
+
+    The files are not deleted afterwards, since the diff tool reads them after this command has finished.
+    """
+    temporary_dir = pathlib.Path(tempfile.mkdtemp(prefix="snappylapy_diff_"))
+    decompressed_files: list[pathlib.Path] = []
+    for file, dir_name in [
+        (test_result_file, DIRECTORY_NAMES.test_results_dir_name),
+        (snapshot_file, DIRECTORY_NAMES.snapshot_dir_name),
+    ]:
+        decompressed_file = temporary_dir / dir_name / strip_codec_extension(file).name
+        decompressed_file.parent.mkdir(parents=True)
+        decompressed_file.write_bytes(decompress_for_path(file, read_snapshot_bytes(file)))
+        decompressed_files.append(decompressed_file)
+    return decompressed_files[0], decompressed_files[1]
 
 
 def _try_open_diff(file1: pathlib.Path, file2: pathlib.Path) -> bool:
@@ -219,6 +276,20 @@ def check_file_statuses(
         snapshot_file = file_path.parent.parent / DIRECTORY_NAMES.snapshot_dir_name / file_path.name
         if not snapshot_file.exists():
             file_statuses[file_path] = FileStatus.NOT_FOUND
+        elif (snapshot_digest := read_pointer_digest(snapshot_file)) is not None:
+            # Deduplicated snapshots are compared by digest, without reading the blob
+            is_unchanged = snapshot_digest == calculate_digest(file_path.read_bytes())
+            file_statuses[file_path] = FileStatus.UNCHANGED if is_unchanged else FileStatus.CHANGED
+        elif get_codec(file_path) is not None:
+            # Compressed files are compared on their content, since the compressed bytes can differ between versions
+            # of the compression library for the same content.
+            snapshot_bytes = snapshot_file.read_bytes()
+            file_bytes = file_path.read_bytes()
+            is_unchanged = snapshot_bytes == file_bytes or decompress_for_path(
+                snapshot_file,
+                snapshot_bytes,
+            ) == decompress_for_path(file_path, file_bytes)
+            file_statuses[file_path] = FileStatus.UNCHANGED if is_unchanged else FileStatus.CHANGED
         elif snapshot_file.stat().st_size != file_path.stat().st_size:
             # TODO: This is not foolproof, does not catch content swaps and byte flips.
             file_statuses[file_path] = FileStatus.CHANGED
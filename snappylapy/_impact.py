@@ -0,0 +1,128 @@
+"""
+Test impact selection, skipping tests whose inputs are unchanged since they last passed.
+
+The inputs of a test are the source of its test module, the case folder of `foreach_folder_in` tests, its own
+snapshots and the snapshots of the tests it depends on. Changes to the code under test are not detected, so the full
+test suite should still be run e.g. in CI.
+
+Upstream tests, which other tests depend on, can also be skipped when the code of the test function and its case
+folder are unchanged since it last passed, and its snapshots are the ones it produced then. The tests depending on it
+load the recorded snapshots instead.
+"""
+
+from __future__ import annotations
+
+import os
+import hashlib
+import pathlib
+from snappylapy.constants import DIRECTORY_NAMES
+from snappylapy.models import Settings
+
+TEST_DIGESTS_CACHE_KEY = "snappylapy/changed/test_digests"
+"""Key in the pytest cache for the digest of the inputs of each test, recorded when the test passed."""
+
+UPSTREAM_RESULTS_CACHE_KEY = "snappylapy/upstream_results"
+"""Key in the pytest cache for the digests of the code and the produced snapshots of upstream tests that passed."""
+
+FILE_DIGESTS_CACHE_KEY = "snappylapy/changed/file_digests"
+"""Key in the pytest cache for the digests of input files, with the size and modification time they were read at."""
+
+_FILE_READ_CHUNK_SIZE = 1024 * 1024
+
+
+class InputDigester:
+    """
+    Calculate digests of the inputs of tests.
+
+    Files are only read when their size or modification time changed since their digest was calculated, and directory
+    listings are reused until the modification time of the directory changes.
+    """
+
+    def __init__(self, file_digests: dict[str, list]) -> None:
+        """Initialize with the file digests recorded in earlier runs, by path as `[size, mtime_ns, digest]`."""
+        self._recorded_file_digests = file_digests
+        self.file_digests: dict[str, list] = {}
+        """File digests used in this session, to be recorded for the next run."""
+        self._listings: dict[str, tuple[int, list[os.DirEntry[str]]]] = {}
+
+    def _list_directory(self, directory: pathlib.Path) -> list[os.DirEntry[str]]:
+        """List a directory sorted by name, empty if it does not exist."""
+        key = str(directory)
+        try:
+            modified_time = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        cached = self._listings.get(key)
+        if cached is None or cached[0] != modified_time:
+            with os.scandir(directory) as entries:
+                cached = (modified_time, sorted(entries, key=lambda entry: entry.name))
+            self._listings[key] = cached
+        return cached[1]
+
+    def file_digest(self, path: str) -> str:
+        """Get the digest of the content of a file."""
+        stat = os.stat(path)  # noqa: PTH116
+        recorded = self.file_digests.get(path) or self._recorded_file_digests.get(path)
+        if recorded and recorded[0] == stat.st_size and recorded[1] == stat.st_mtime_ns:
+            self.file_digests[path] = recorded
+            return recorded[2]
+        file_hash = hashlib.sha256()
+        with open(path, "rb") as file:  # noqa: PTH123
+            while chunk := file.read(_FILE_READ_CHUNK_SIZE):
+                file_hash.update(chunk)
+        self.file_digests[path] = [stat.st_size, stat.st_mtime_ns, file_hash.hexdigest()]
+        return file_hash.hexdigest()
+
+    def _update_with_directory(self, digest: hashlib._Hash, directory: pathlib.Path, relative_to: str) -> None:
+        """Add the names and digests of the files in a directory and its subdirectories, except snappylapy's own."""
+        for entry in self._list_directory(directory):
+            if entry.is_dir():
+                if entry.name not in DIRECTORY_NAMES:
+                    self._update_with_directory(digest, pathlib.Path(entry.path), relative_to)
+            elif entry.is_file():
+                digest.update(f"{os.path.relpath(entry.path, relative_to)}:{self.file_digest(entry.path)}\n".encode())
+
+    def list_snapshots(self, snapshot_dir: pathlib.Path, filename_prefix: str) -> list[os.DirEntry[str]]:
+        """List the snapshot files starting with the prefix, e.g. all snapshots of a test."""
+        return [
+            entry
+            for entry in self._list_directory(snapshot_dir)
+            if entry.name.startswith(filename_prefix) and entry.is_file()
+        ]
+
+    def _update_with_snapshots(self, digest: hashlib._Hash, snapshot_dir: pathlib.Path, filename_prefix: str) -> None:
+        """Add the names and digests of the snapshot files starting with the prefix."""
+        for entry in self.list_snapshots(snapshot_dir, filename_prefix):
+            digest.update(f"{entry.name}:{self.file_digest(entry.path)}\n".encode())
+
+    def test_digest(self, settings: Settings, source_path: pathlib.Path, case_directory: pathlib.Path | None) -> str:
+        """Get the digest of the inputs of a test."""
+        digest = hashlib.sha256()
+        digest.update(f"source:{self.file_digest(str(source_path))}\n".encode())
+        if case_directory is not None:
+            digest.update(b"case:\n")
+            self._update_with_directory(digest, case_directory, str(case_directory))
+        digest.update(b"snapshots:\n")
+        self._update_with_snapshots(digest, settings.snapshot_dir, settings.filename_prefix)
+        for depending in settings.depending_tests:
+            digest.update(f"depends:{depending.filename_prefix}\n".encode())
+            self._update_with_snapshots(
+                digest,
+                pathlib.Path(depending.snapshots_base_dir) / DIRECTORY_NAMES.snapshot_dir_name,
+                depending.filename_prefix,
+            )
+        return digest.hexdigest()
+
+    def code_digest(self, source_path: pathlib.Path, case_directory: pathlib.Path | None) -> str:
+        """Get the digest of the module of a test and its case folder, so changes to helpers in the module count."""
+        digest = hashlib.sha256(f"source:{self.file_digest(str(source_path))}\n".encode())
+        if case_directory is not None:
+            digest.update(b"case:\n")
+            self._update_with_directory(digest, case_directory, str(case_directory))
+        return digest.hexdigest()
+
+    def result_digest(self, settings: Settings) -> str:
+        """Get the digest of the snapshots of a test."""
+        digest = hashlib.sha256()
+        self._update_with_snapshots(digest, settings.snapshot_dir, settings.filename_prefix)
+        return digest.hexdigest()
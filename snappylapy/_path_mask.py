@@ -0,0 +1,138 @@
+"""
+Compiled paths for masking volatile values, e.g. timestamps and ids, when serializing snapshots.
+
+Paths are keys separated by dots, with list indices in brackets, e.g. `"meta.created_at"` or `"items[0].id"`. A `*`
+matches any single key or index, e.g. `"items[*].id"`, and `**` matches any number of keys, e.g. `"**.created_at"`.
+The paths are compiled to a tree once, which is walked together with the data, so only the parts of the data a path
+can reach are checked.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, TypeAlias
+
+Matcher: TypeAlias = type | tuple[type, ...] | Callable[[Any], bool]
+"""A type or tuple of types the value must be an instance of, or a function returning True for matching values."""
+
+_WILDCARD = "*"
+_RECURSIVE_WILDCARD = "**"
+_INDEX_PATTERN = re.compile(r"\[([^\]]*)\]")
+
+
+class _MaskNode:
+    """Node in the compiled tree of paths, representing the paths sharing the same first keys."""
+
+    __slots__ = ("children", "exclude", "is_recursive", "matcher", "path", "recursive", "wildcard")
+
+    def __init__(self, *, is_recursive: bool = False) -> None:
+        self.children: dict[str, _MaskNode] = {}
+        self.wildcard: _MaskNode | None = None
+        self.recursive: _MaskNode | None = None
+        self.is_recursive = is_recursive
+        self.exclude = False
+        self.matcher: Matcher | None = None
+        self.path = ""
+
+
+def split_path(path: str) -> list[str]:
+    """Split a path into its keys, e.g. `"items[0].id"` into `["items", "0", "id"]`."""
+    keys = _INDEX_PATTERN.sub(r".\1", path).split(".")
+    if not path or not all(keys):
+        msg = f"Invalid path: {path!r}. Use keys separated by dots and list indices in brackets, e.g. 'items[0].id'."
+        raise ValueError(msg)
+    return keys
+
+
+def describe_matcher(matcher: Matcher) -> str:
+    """Describe a matcher, used as the placeholder written to the snapshot instead of the value."""
+    if isinstance(matcher, type):
+        return f"<{matcher.__name__}>"
+    if isinstance(matcher, tuple):
+        return f"<{' | '.join(cls.__name__ for cls in matcher)}>"
+    return f"<{getattr(matcher, '__name__', repr(matcher))}>"
+
+
+class PathMask:
+    """
+    Compiled paths of values to exclude, and of values to replace with a placeholder after checking them.
+
+    Excluded values are left out of the snapshot. Values matched by a matcher are written as a placeholder describing
+    the matcher, e.g. `"<datetime>"`, and an AssertionError is raised if the value does not match.
+    """
+
+    def __init__(self, exclude_paths: Iterable[str] = (), matchers: Mapping[str, Matcher] | None = None) -> None:
+        """Compile the paths."""
+        self._root = _MaskNode()
+        for path in exclude_paths:
+            self._add_path(path).exclude = True
+        for path, matcher in (matchers or {}).items():
+            self._add_path(path).matcher = matcher
+        self.root_nodes = self._expand((self._root,))
+
+    def _add_path(self, path: str) -> _MaskNode:
+        """Add the nodes for a path to the tree, and return the node at the end of the path."""
+        node = self._root
+        for key in split_path(path):
+            if key == _RECURSIVE_WILDCARD:
+                if node.recursive is None:
+                    node.recursive = _MaskNode(is_recursive=True)
+                node = node.recursive
+            elif key == _WILDCARD:
+                if node.wildcard is None:
+                    node.wildcard = _MaskNode()
+                node = node.wildcard
+            else:
+                node = node.children.setdefault(key, _MaskNode())
+        node.path = path
+        return node
+
+    @staticmethod
+    def _expand(nodes: Iterable[_MaskNode]) -> tuple[_MaskNode, ...]:
+        """Add the nodes reached by a `**` matching zero keys."""
+        expanded: list[_MaskNode] = []
+        for start_node in nodes:
+            node: _MaskNode | None = start_node
+            while node is not None and node not in expanded:
+                expanded.append(node)
+                node = node.recursive
+        return tuple(expanded)
+
+    def step(self, nodes: tuple[_MaskNode, ...], key: str) -> tuple[_MaskNode, ...]:
+        """Get the nodes reached from the given nodes by a key, empty when no path can match below the key."""
+        next_nodes: list[_MaskNode] = []
+        for node in nodes:
+            child = node.children.get(key)
+            if child is not None:
+                next_nodes.append(child)
+            if node.wildcard is not None:
+                next_nodes.append(node.wildcard)
+            if node.is_recursive:
+                next_nodes.append(node)
+        if not next_nodes:
+            return ()
+        return self._expand(next_nodes)
+
+    @staticmethod
+    def is_excluded(nodes: tuple[_MaskNode, ...]) -> bool:
+        """Check if the value reached by the nodes should be excluded."""
+        return any(node.exclude for node in nodes)
+
+    @staticmethod
+    def apply_matcher(nodes: tuple[_MaskNode, ...], value: Any) -> str | None:  # noqa: ANN401
+        """
+        Get the placeholder for a value reached by a path with a matcher, None if no matcher applies.
+
+        Raises AssertionError if the value does not match the matcher.
+        """
+        for node in nodes:
+            matcher = node.matcher
+            if matcher is None:
+                continue
+            is_matching = isinstance(value, matcher) if isinstance(matcher, (type, tuple)) else bool(matcher(value))
+            if not is_matching:
+                msg = f"Value at path {node.path!r} does not match {describe_matcher(matcher)}: {value!r}"
+                raise AssertionError(msg)
+            return describe_matcher(matcher)
+        return None
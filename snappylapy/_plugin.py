@@ -7,15 +7,48 @@ import re
 import pytest
 import pathlib
 import _pytest.mark
+from _pytest.terminal import TerminalReporter
 from collections.abc import Callable
+from dataclasses import dataclass
 from snappylapy import Expect, LoadSnapshot
-from snappylapy._utils_directories import DirectoryNamesUtil
+from snappylapy._atomic_write import FSYNC_POLICIES, set_fsync_policy, sync_pending_writes
+from snappylapy._blob_store import set_blob_store_root
+from snappylapy._impact import (
+    FILE_DIGESTS_CACHE_KEY,
+    TEST_DIGESTS_CACHE_KEY,
+    UPSTREAM_RESULTS_CACHE_KEY,
+    InputDigester,
+)
+from snappylapy._scheduling import (
+    TEST_DURATIONS_CACHE_KEY,
+    find_dependency_chains,
+    get_chain_group_name,
+    get_test_key,
+    order_by_chain_duration,
+)
+from snappylapy._sharding import (
+    CASE_DURATIONS_CACHE_KEY,
+    Shard,
+    get_case_directory,
+    get_case_key,
+    parse_shard,
+    select_shard,
+)
+from snappylapy._utils_directories import (
+    DirectoryNamesUtil,
+    clear_known_directories,
+    get_file_paths_from_directories,
+    list_case_directories,
+    merge_namespace_directory,
+    remove_namespace_directories,
+    remove_temporary_files,
+)
 from snappylapy.constants import DEFAULT_SNAPSHOT_BASE_DIR
 from snappylapy.exceptions import TestDirectoryNotParametrizedError
 from snappylapy.fixtures import Settings
 from snappylapy.models import DependingSettings
 from snappylapy.session import SnapshotSession
-from typing import Any
+from typing import Any, cast
 
 
 def _extract_module_name(module_path: str) -> str:
@@ -56,23 +89,105 @@ def _get_args_from_depend_function(
     return None
 
 
-@pytest.fixture
-def snappylapy_settings(request: pytest.FixtureRequest) -> Settings:
-    """Initialize the Settings object for the test."""
-    update_snapshots = request.config.getoption("--snapshot-update")
-    marker = request.node.get_closest_marker("snappylapy")
-    match = re.search(r"\[(.*?)\]", request.node.name)
+@dataclass(frozen=True)
+class _MarkerSettings:
+    """Configuration of a test function from its snappylapy marker, the same for all its tests."""
+
+    output_dir: pathlib.Path | None
+    canonical_json: bool
+    depends: tuple[tuple[str, str, pathlib.Path | None], ...]
+    """Module, name and output dir of each test depended on, the output dir carried over from earlier depends."""
+
+
+def _get_marker_settings(marker: _pytest.mark.structures.Mark | None) -> _MarkerSettings:
+    """Get the configuration from the snappylapy marker of a test function, walking the markers of its depends."""
+    if not marker:
+        return _MarkerSettings(output_dir=None, canonical_json=False, depends=())
+    output_dir: str | pathlib.Path | None = marker.kwargs.get("output_dir", None)
+    depends: list[tuple[str, str, pathlib.Path | None]] = []
+    depend_output_dir: pathlib.Path | None = None
+    for depend in marker.kwargs.get("depends", []):
+        input_dir_from_depends = _get_kwargs_from_depend_function(depend, "snappylapy", "output_dir")
+        if input_dir_from_depends:
+            depend_output_dir = pathlib.Path(input_dir_from_depends)
+        depends.append((_extract_module_name(depend.__module__), depend.__name__, depend_output_dir))
+    return _MarkerSettings(
+        output_dir=pathlib.Path(output_dir) if output_dir else None,
+        canonical_json=bool(marker.kwargs.get("canonical_json", False)),
+        depends=tuple(depends),
+    )
+
+
+def _get_worker_id(config: pytest.Config) -> str | None:
+    """Get the id of the pytest-xdist worker running the tests, e.g. `gw0`, None when not running in a worker."""
+    workerinput: dict[str, Any] | None = getattr(config, "workerinput", None)
+    return workerinput["workerid"] if workerinput else None
+
+
+def _create_settings(
+    item: pytest.Function,
+    path_output_dir: pathlib.Path | None,
+    marker_settings: _MarkerSettings | None = None,
+) -> Settings:
+    """Create the settings of a test, with the case folder it is parametrized with for `foreach_folder_in` tests."""
+    if marker_settings is None:
+        marker_settings = _get_marker_settings(item.get_closest_marker("snappylapy"))
+    match = re.search(r"\[(.*?)\]", item.name)
     param_name: str | None = match.group(1) if match else None
     settings = Settings(
-        test_filename=request.module.__name__,
-        test_function=request.node.originalname,
+        test_filename=item.module.__name__,
+        test_function=item.originalname,
         custom_name=param_name,
-        snapshot_update=update_snapshots,
+        snapshot_update=item.config.getoption("--snapshot-update"),
+        snapshot_deduplicate=item.config.getoption("--snapshot-deduplicate"),
+        snapshot_canonical_json=item.config.getoption("--snapshot-canonical-json") or marker_settings.canonical_json,
+        test_results_namespace=_get_worker_id(item.config),
     )
-    if marker:
-        output_dir: str | pathlib.Path = marker.kwargs.get("output_dir", None)
-        if output_dir:
-            settings.snapshots_base_dir = pathlib.Path(output_dir)
+    if marker_settings.output_dir:
+        settings.snapshots_base_dir = marker_settings.output_dir
+    if path_output_dir is not None:
+        settings.snapshots_base_dir = pathlib.Path(path_output_dir)
+        settings.custom_name = path_output_dir.name
+    for test_filename, test_function, depend_output_dir in marker_settings.depends:
+        dependency_setting = DependingSettings(
+            test_filename=test_filename,
+            test_function=test_function,
+            snapshots_base_dir=depend_output_dir or path_output_dir or DEFAULT_SNAPSHOT_BASE_DIR,
+            custom_name=settings.custom_name,
+        )
+        settings.depending_tests.append(dependency_setting)
+    if settings.test_results_namespace is not None:
+        item.config.stash.setdefault(_namespace_directories_key, set()).add(settings.test_results_dir)
+    return settings
+
+
+def _create_settings_templates(items: list[pytest.Function]) -> None:
+    """
+    Create the settings of each test at collection, copied by the `snappylapy_settings` fixture.
+
+    The configuration from the snappylapy marker is only read once per test function.
+    """
+    marker_settings_by_function: dict[Callable, tuple[_pytest.mark.structures.Mark | None, _MarkerSettings]] = {}
+    for item in items:
+        function = getattr(item, "function", None)
+        if function is None or "snappylapy_settings" not in getattr(item, "fixturenames", ()):
+            continue
+        case_directory = get_case_directory(item)
+        callspec = getattr(item, "callspec", None)
+        if case_directory is None and callspec is not None and "snappylapy_settings" in callspec.params:
+            # Parametrized with something else than a case folder, leave it to the fixture
+            continue
+        marker = item.get_closest_marker("snappylapy")
+        cached = marker_settings_by_function.get(function)
+        if cached is None or cached[0] is not marker:
+            cached = (marker, _get_marker_settings(marker))
+            marker_settings_by_function[function] = cached
+        item.stash[_settings_template_key] = _create_settings(item, case_directory, cached[1])
+
+
+@pytest.fixture
+def snappylapy_settings(request: pytest.FixtureRequest) -> Settings:
+    """Initialize the Settings object for the test, as a copy of the settings created at collection."""
     path_output_dir: pathlib.Path | None = None
     if hasattr(request, "param"):
         path_output_dir = request.param
@@ -80,25 +195,10 @@ def snappylapy_settings(request: pytest.FixtureRequest) -> Settings:
             # TODO: Add a better error message
             msg = "Path output directory cannot be None"
             raise ValueError(msg)
-        # settings.depending_snapshots_base_dir = pathlib.Path(path_output_dir)
-        settings.snapshots_base_dir = pathlib.Path(path_output_dir)
-        settings.custom_name = path_output_dir.name
-    # If not parametrized, get the depends from the marker
-    depends: list = marker.kwargs.get("depends", []) if marker else []
-    if depends:
-        for depend in depends:
-            input_dir_from_depends = _get_kwargs_from_depend_function(depend, "snappylapy", "output_dir")
-            if input_dir_from_depends:
-                path_output_dir = pathlib.Path(input_dir_from_depends)
-            dependency_setting = DependingSettings(
-                test_filename=_extract_module_name(depend.__module__),
-                test_function=depend.__name__,
-                snapshots_base_dir=path_output_dir or DEFAULT_SNAPSHOT_BASE_DIR,
-                custom_name=settings.custom_name,
-            )
-            settings.depending_tests.append(dependency_setting)
-
-    return settings
+    template = request.node.stash.get(_settings_template_key, None)
+    if template is not None:
+        return template.copy()
+    return _create_settings(cast("pytest.Function", request.node), path_output_dir)
 
 
 @pytest.fixture
@@ -123,8 +223,9 @@ def pytest_collection_modifyitems(
     config: pytest.Config,
     items: list[pytest.Function],
 ) -> None:
-    """Sort the tests based on the dependencies."""
-    del config, session  # Unused
+    """Sort the tests based on the dependencies, and group them by dependency chain with `--dist loadgroup`."""
+    del session  # Unused
+    _create_settings_templates(items)
     for item in items:
         marker = item.get_closest_marker("snappylapy")
         if not marker:
@@ -141,13 +242,138 @@ def pytest_collection_modifyitems(
                 # Move the test to the position after the dependency
                 items.insert(i + 1, items.pop(items.index(item)))
                 break
+    if config.getoption("snappylapy_changed"):
+        _deselect_unchanged_tests(config, items)
+    if config.getoption("snappylapy_reuse_upstream"):
+        _mark_reusable_upstream_tests(config, items)
+    if _get_worker_id(config) is not None and getattr(config.option, "loadgroup", False):
+        # Only the pytest-xdist workers collect, the option is set by xdist for workers of `--dist loadgroup`
+        _group_dependency_chains(config, items)
+
+
+def _get_cache(config: pytest.Config) -> pytest.Cache | None:
+    """Get the pytest cache, None when the cacheprovider plugin is disabled with `-p no:cacheprovider`."""
+    return getattr(config, "cache", None)
+
+
+def _read_from_cache(config: pytest.Config, cache_key: str) -> dict[str, Any]:
+    """Read the values recorded in earlier runs from the pytest cache, empty when the cache is disabled."""
+    cache = _get_cache(config)
+    return cache.get(cache_key, {}) if cache is not None else {}
+
+
+def _get_input_digester(config: pytest.Config) -> InputDigester:
+    """Get the digester of the inputs of tests for the session, using the file digests recorded in earlier runs."""
+    if _input_digester_key not in config.stash:
+        file_digests = _read_from_cache(config, FILE_DIGESTS_CACHE_KEY)
+        config.stash[_input_digester_key] = InputDigester(file_digests)
+    return config.stash[_input_digester_key]
+
+
+def _get_test_digest(item: pytest.Function) -> str:
+    """Get the digest of the inputs of a test, from the settings created at collection."""
+    return _get_input_digester(item.config).test_digest(
+        item.stash[_settings_template_key],
+        item.path,
+        get_case_directory(item),
+    )
+
+
+def _mark_reusable_upstream_tests(config: pytest.Config, items: list[pytest.Function]) -> None:
+    """
+    Mark the upstream tests to skip, whose module and case folder are unchanged since they last passed.
+
+    The snapshots of the upstream test must also be the ones it produced then, so the tests depending on it load the
+    same snapshots as if it had run.
+    """
+    upstream_functions: set[Callable] = set()
+    for item in items:
+        marker = item.get_closest_marker("snappylapy")
+        if marker:
+            upstream_functions.update(marker.kwargs.get("depends", []))
+    recorded_results: dict[str, dict[str, str]] = _read_from_cache(config, UPSTREAM_RESULTS_CACHE_KEY)
+    digester = _get_input_digester(config)
+    for item in items:
+        if item.function not in upstream_functions:
+            continue
+        if _settings_template_key not in item.stash:
+            continue
+        item.stash[_record_digests_key] = True
+        code_digest = digester.code_digest(item.path, get_case_directory(item))
+        item.stash[_code_digest_key] = code_digest
+        recorded_result = recorded_results.get(get_test_key(item))
+        if recorded_result == {
+            "code": code_digest,
+            "snapshots": digester.result_digest(item.stash[_settings_template_key]),
+        }:
+            item.stash[_reuse_snapshots_key] = True
+
+
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """Skip upstream tests whose recorded snapshots are reused, counting the snapshots as visited."""
+    if not item.stash.get(_reuse_snapshots_key, False):
+        return
+    settings = item.stash[_settings_template_key]
+    snappylapy_session: SnapshotSession | None = getattr(item.config, "snappylapy_session", None)
+    if snappylapy_session is not None:
+        for entry in _get_input_digester(item.config).list_snapshots(settings.snapshot_dir, settings.filename_prefix):
+            snappylapy_session.add_reused_snapshot(entry.name)
+    pytest.skip("Code and case folder are unchanged, reusing the recorded snapshots of the upstream test.")
+
+
+def _deselect_unchanged_tests(config: pytest.Config, items: list[pytest.Function]) -> None:
+    """
+    Deselect snappylapy tests whose inputs are unchanged since they last passed.
+
+    Tests depending on a selected test are also selected, since the snapshots they depend on might change.
+    """
+    recorded_digests: dict[str, str] = _read_from_cache(config, TEST_DIGESTS_CACHE_KEY)
+    selected: list[pytest.Function] = []
+    deselected: list[pytest.Function] = []
+    selected_functions: set[Callable] = set()
+    for item in items:
+        marker = item.get_closest_marker("snappylapy")
+        if not marker:
+            selected.append(item)
+            continue
+        if _settings_template_key not in item.stash:
+            selected.append(item)
+            continue
+        item.stash[_record_digests_key] = True
+        is_upstream_selected = any(depend in selected_functions for depend in marker.kwargs.get("depends", []))
+        if not is_upstream_selected and recorded_digests.get(get_test_key(item)) == _get_test_digest(item):
+            deselected.append(item)
+        else:
+            selected.append(item)
+            selected_functions.add(item.function)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def _group_dependency_chains(config: pytest.Config, items: list[pytest.Function]) -> None:
+    """
+    Mark each dependency chain as a xdist group, so it runs in order on one worker with `--dist loadgroup`.
+
+    The chains are ordered by their recorded durations, so the longest chains start first.
+    """
+    chains = find_dependency_chains(items)
+    for chain in chains:
+        group_name = get_chain_group_name(chain)
+        for item in chain:
+            item.add_marker(pytest.mark.xdist_group(name=group_name))
+            item.stash[_chain_group_key] = group_name
+    durations: dict[str, float] = _read_from_cache(config, TEST_DURATIONS_CACHE_KEY)
+    items[:] = order_by_chain_duration(items, chains, durations)
 
 
 def pytest_configure(config: pytest.Config) -> None:
-    """Register the markers used."""
+    """Register the markers used, set the fsync policy and put the shared blob store in the root directory."""
+    set_fsync_policy(config.getoption("snapshot_fsync"))
+    set_blob_store_root(config.rootpath)
     config.addinivalue_line(
         "markers",
-        "snappylapy(foreach_folder_in=None, output_dir=None, depends=None): Mark the test to use snappylapy plugin functionalities.",  # noqa: E501
+        "snappylapy(foreach_folder_in=None, output_dir=None, depends=None, canonical_json=False): Mark the test to use snappylapy plugin functionalities.",  # noqa: E501
     )  # TODO: Add link to documentation
 
 
@@ -161,19 +387,139 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="update snapshots.",
     )
+    group.addoption(
+        "--snapshot-deduplicate",
+        action="store_true",
+        dest="snapshot_deduplicate",
+        default=False,
+        help="store updated snapshots in a content-addressed blob store, so identical snapshots are stored once.",
+    )
+    group.addoption(
+        "--snapshot-canonical-json",
+        action="store_true",
+        dest="snapshot_canonical_json",
+        default=False,
+        help="write json snapshots canonically, with sorted keys, normalized floats and sorted sets.",
+    )
+    group.addoption(
+        "--snapshot-fsync",
+        action="store",
+        dest="snapshot_fsync",
+        default="none",
+        choices=FSYNC_POLICIES,
+        help="fsync written snapshots and test results: none (default), per file, or once at the end of the session.",
+    )
+    group.addoption(
+        "--snappylapy-changed",
+        action="store_true",
+        dest="snappylapy_changed",
+        default=False,
+        help="only run snappylapy tests whose test module, case folder or snapshots changed since they last passed.",
+    )
+    group.addoption(
+        "--snappylapy-reuse-upstream",
+        action="store_true",
+        dest="snappylapy_reuse_upstream",
+        default=False,
+        help="skip tests other tests depend on, if their code, case folder and snapshots are unchanged since passing.",
+    )
+    group.addoption(
+        "--snappylapy-shard",
+        action="store",
+        dest="snappylapy_shard",
+        default=None,
+        type=parse_shard,
+        metavar="INDEX/COUNT",
+        help="only run the foreach_folder_in case folders of one shard, e.g. 1/4 on the first of four machines.",
+    )
+    group.addoption(
+        "--snappylapy-shard-by-duration",
+        action="store_true",
+        dest="snappylapy_shard_by_duration",
+        default=False,
+        help="balance the shards by the durations of the case folders recorded in the pytest cache.",
+    )
+
+
+_case_durations_key = pytest.StashKey[dict[str, float]]()
+"""Durations in seconds of the case folders run in this session, summed over all tests and test phases."""
+
+_test_durations_key = pytest.StashKey[dict[str, float]]()
+"""Durations in seconds of the tests in dependency chains run in this session, summed over all test phases."""
+
+_chain_group_key = pytest.StashKey[str]()
+"""Name of the xdist group of the dependency chain of a test."""
+
+_input_digester_key = pytest.StashKey[InputDigester]()
+"""Digester of the inputs of tests, when only running tests with changed inputs."""
+
+_test_digests_key = pytest.StashKey[dict[str, str]]()
+"""Digests of the inputs of the tests passing in this session."""
+
+_settings_template_key = pytest.StashKey[Settings]()
+"""Settings of a test created at collection, copied by the `snappylapy_settings` fixture for each run of the test."""
+
+_record_digests_key = pytest.StashKey[bool]()
+"""Flag for a test whose inputs or snapshots are recorded when it passes."""
+
+_upstream_results_key = pytest.StashKey[dict[str, dict[str, str]]]()
+"""Digests of the code and the snapshots of the upstream tests passing in this session."""
+
+_code_digest_key = pytest.StashKey[str]()
+"""Digest of the code and the case folder of an upstream test, which other tests depend on."""
+
+_reuse_snapshots_key = pytest.StashKey[bool]()
+"""Flag for an upstream test to skip, since its recorded snapshots can be reused."""
 
+_worker_recorded_values_key = pytest.StashKey[list[dict[str, dict[str, Any]]]]()
+"""Values recorded by the pytest-xdist workers by cache key, received by the main process when a worker finishes."""
 
+_WORKER_OUTPUT_KEY = "snappylapy_recorded_values"
+"""Key of the recorded values in the output a pytest-xdist worker sends to the main process."""
+
+_RECORDED_VALUES_CACHE_KEYS: tuple[tuple[pytest.StashKey[dict[str, Any]], str], ...] = (
+    (_case_durations_key, CASE_DURATIONS_CACHE_KEY),
+    (_test_durations_key, TEST_DURATIONS_CACHE_KEY),
+    (_test_digests_key, TEST_DIGESTS_CACHE_KEY),
+    (_upstream_results_key, UPSTREAM_RESULTS_CACHE_KEY),
+)
+"""Values recorded in the session by their stash key, and the key in the pytest cache they are stored with."""
+
+_namespace_directories_key = pytest.StashKey[set[pathlib.Path]]()
+"""Namespace directories of the pytest-xdist worker the test results are written to, merged at session end."""
+
+_item_failed_key = pytest.StashKey[bool]()
+"""Flag for a test failing or being skipped in one of its phases, so its inputs are not recorded."""
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_sessionstart(session: pytest.Session) -> None:
-    """Initialize the snapshot session before running tests."""
+    """
+    Initialize the snapshot session before running tests.
+
+    The test results of earlier runs are deleted by the main process only, before any pytest-xdist worker starts, since
+    the workers write their test results to a namespace directory of their own. Temporary files left in the snapshot
+    directories by a run that was killed while writing are removed as well.
+    """
     # Check if we're in discovery/collection mode
     if getattr(session.config.option, "collectonly", False) or getattr(session.config.option, "collect_only", False):
         return
 
-    session.config.snappylapy_session = SnapshotSession()  # type: ignore[attr-defined]
+    session.config.snappylapy_session = SnapshotSession(  # type: ignore[attr-defined]
+        shard=session.config.getoption("snappylapy_shard"),
+    )
+    if _get_worker_id(session.config) is not None:
+        return
     directory_util: DirectoryNamesUtil = DirectoryNamesUtil()
-    files_to_delete: list[pathlib.Path] = directory_util.get_all_file_paths_test_results()
+    test_results_directories = directory_util.get_all_directories_for_test_results()
+    remove_namespace_directories(test_results_directories)
+    files_to_delete: list[pathlib.Path] = get_file_paths_from_directories(
+        test_results_directories,
+        include_temporary_files=True,
+    )
     for file_path in files_to_delete:
         file_path.unlink()
+    remove_temporary_files(directory_util.get_all_directories_for_snapshots())
 
 
 class ExceptionDuringTestSetupError(Exception):
@@ -207,6 +553,25 @@ def test_directory(snappylapy_settings: Settings) -> pathlib.Path:
         raise TestDirectoryNotParametrizedError from e
 
 
+def _get_case_directories(config: pytest.Config, foreach_folder_in: str | pathlib.Path) -> list[pathlib.Path]:
+    """Get the case folders to run, only the ones of the selected shard if the tests are sharded."""
+    case_directories = list_case_directories(foreach_folder_in)
+    shard: Shard | None = config.getoption("snappylapy_shard")
+    if shard is None:
+        return case_directories
+    durations: dict[str, float] | None = None
+    cache = _get_cache(config)
+    if config.getoption("snappylapy_shard_by_duration") and cache is not None:
+        durations = cache.get(CASE_DURATIONS_CACHE_KEY, {})
+    selected_case_directories = select_shard(case_directories, shard, durations)
+    snappylapy_session: SnapshotSession | None = getattr(config, "snappylapy_session", None)
+    if snappylapy_session is not None:
+        snappylapy_session.add_case_directories_in_other_shards(
+            [case for case in case_directories if case not in selected_case_directories],
+        )
+    return selected_case_directories
+
+
 def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
     """Generate parametrized tests for the pipeline output and input."""
     marker = metafunc.definition.get_closest_marker("snappylapy")
@@ -214,7 +579,7 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
         return
     foreach_folder_in: str | pathlib.Path | None = marker.kwargs.get("foreach_folder_in", None)
     if foreach_folder_in:
-        test_cases = [p for p in pathlib.Path(foreach_folder_in).iterdir() if p.is_dir()]
+        test_cases = _get_case_directories(metafunc.config, foreach_folder_in)
         ids = [p.name for p in test_cases]
         metafunc.parametrize("snappylapy_settings", test_cases, indirect=True, ids=ids)
     depends = marker.kwargs.get("depends", []) if marker else []
@@ -233,6 +598,117 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
             foreach_folder_in = _get_kwargs_from_depend_function(depends[0], "snappylapy", "foreach_folder_in")
             if not foreach_folder_in:
                 return
-            test_cases = [p for p in pathlib.Path(foreach_folder_in).iterdir() if p.is_dir()]
+            test_cases = _get_case_directories(metafunc.config, foreach_folder_in)
             ids = [p.name for p in test_cases]
             metafunc.parametrize("snappylapy_settings", test_cases, indirect=True, ids=ids)
+
+
+def _add_duration(
+    config: pytest.Config,
+    stash_key: pytest.StashKey[dict[str, float]],
+    key: str,
+    duration: float,
+) -> None:
+    """Add a duration to the durations recorded in this session."""
+    durations = config.stash.setdefault(stash_key, {})
+    durations[key] = durations.get(key, 0.0) + duration
+
+
+def _get_recorded_values(config: pytest.Config) -> dict[str, dict[str, Any]]:
+    """Get the values recorded in this session by cache key, together with the ones received from xdist workers."""
+    recorded_values: dict[str, dict[str, Any]] = {}
+    for stash_key, cache_key in _RECORDED_VALUES_CACHE_KEYS:
+        values: dict[str, Any] = config.stash.get(stash_key, {})
+        recorded_values[cache_key] = dict(values)
+    if _input_digester_key in config.stash:
+        recorded_values[FILE_DIGESTS_CACHE_KEY] = dict(config.stash[_input_digester_key].file_digests)
+    for worker_values in config.stash.get(_worker_recorded_values_key, []):
+        for cache_key, values in worker_values.items():
+            recorded_values.setdefault(cache_key, {}).update(values)
+    return recorded_values
+
+
+def _store_in_cache(config: pytest.Config, recorded_values: dict[str, dict[str, Any]]) -> None:
+    """
+    Store the values recorded in this session in the pytest cache, keeping the ones not run in this session.
+
+    The file digests replace the recorded ones, so digests of files no longer read do not pile up.
+    """
+    cache = _get_cache(config)
+    if cache is None:
+        return
+    for cache_key, values in recorded_values.items():
+        if not values:
+            continue
+        if cache_key == FILE_DIGESTS_CACHE_KEY:
+            cache.set(cache_key, values)
+        else:
+            cache.set(cache_key, {**cache.get(cache_key, {}), **values})
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: object | None) -> None:  # noqa: ANN401
+    """Receive the values recorded by a pytest-xdist worker, stored in the cache by the main process."""
+    del error  # Unused, a worker that crashed sends no output
+    worker_values = getattr(node, "workeroutput", {}).get(_WORKER_OUTPUT_KEY)
+    if worker_values:
+        node.config.stash.setdefault(_worker_recorded_values_key, []).append(worker_values)
+
+
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) -> None:
+    """Record the durations of case folders for balancing shards, and of dependency chains for scheduling them."""
+    case_directory = get_case_directory(item)
+    if case_directory is not None:
+        _add_duration(item.config, _case_durations_key, get_case_key(case_directory), call.duration)
+    if _chain_group_key in item.stash:
+        _add_duration(item.config, _test_durations_key, get_test_key(item), call.duration)
+    if item.stash.get(_record_digests_key, False):
+        _record_digests(cast("pytest.Function", item), call)
+
+
+def _record_digests(item: pytest.Function, call: pytest.CallInfo[None]) -> None:
+    """Record the digests of the inputs and the snapshots of a test after its last phase, if all phases passed."""
+    if call.excinfo is not None:
+        item.stash[_item_failed_key] = True
+        return
+    if call.when != "teardown" or item.stash.get(_item_failed_key, False):
+        return
+    if item.config.getoption("snappylapy_changed"):
+        item.config.stash.setdefault(_test_digests_key, {})[get_test_key(item)] = _get_test_digest(item)
+    if _code_digest_key in item.stash:
+        result_digest = _get_input_digester(item.config).result_digest(item.stash[_settings_template_key])
+        item.config.stash.setdefault(_upstream_results_key, {})[get_test_key(item)] = {
+            "code": item.stash[_code_digest_key],
+            "snapshots": result_digest,
+        }
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, config: pytest.Config) -> None:
+    """Write the summary of the snapshot tests, e.g. the created snapshots and the snapshots no test visited."""
+    snappylapy_session: SnapshotSession | None = getattr(config, "snappylapy_session", None)
+    if snappylapy_session is not None:
+        snappylapy_session.write_summary(terminalreporter)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Store the recorded durations and the digests of passing tests in the pytest cache, in the main process only.
+
+    The files written in the session are fsynced with the `session` fsync policy. In a pytest-xdist worker the test
+    results written to its namespace directories are merged into the test results directories.
+    """
+    config = session.config
+    namespace_directories = config.stash.get(_namespace_directories_key, set())
+    for directory in sorted(namespace_directories):
+        merge_namespace_directory(directory)
+    if namespace_directories:
+        clear_known_directories()
+    # After the merge, so the moved files are synced in the test results directories they were moved to
+    sync_pending_writes()
+    recorded_values = _get_recorded_values(config)
+    workeroutput: dict[str, Any] | None = getattr(config, "workeroutput", None)
+    if workeroutput is not None:
+        # Sent to the main process, which stores the values of all workers at once, so they do not overwrite each other
+        workeroutput[_WORKER_OUTPUT_KEY] = recorded_values
+        return
+    _store_in_cache(config, recorded_values)
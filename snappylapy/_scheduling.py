@@ -0,0 +1,90 @@
+"""
+Scheduling of tests depending on other tests, for running them in parallel with pytest-xdist.
+
+Tests connected by `depends` form a chain, which must run in order on the same worker. For `foreach_folder_in` tests
+each case folder is a chain of its own, so the case folders can still run in parallel. The chains are exposed as
+`xdist_group` markers, and ordered by the durations recorded in earlier runs, so the longest chains start first.
+"""
+
+from __future__ import annotations
+
+import re
+import pytest
+from collections.abc import Sequence
+from snappylapy._sharding import get_case_directory
+from typing import TypeVar
+
+ItemT = TypeVar("ItemT", bound=pytest.Item)
+
+_GROUP_NAME_RESERVED_CHARACTERS = re.compile(r"[\[\]@]")
+
+TEST_DURATIONS_CACHE_KEY = "snappylapy/test_durations"
+"""Key in the pytest cache for the recorded duration in seconds of each test in a dependency chain."""
+
+
+def get_test_key(item: pytest.Item) -> str:
+    """Get the key of a test for recording durations, the same with and without the xdist group in the node id."""
+    return f"{item.location[0]}::{item.location[2]}"
+
+
+def get_chain_group_name(chain: Sequence[pytest.Item]) -> str:
+    """
+    Get the name of the xdist group of a chain, named by its first test.
+
+    Brackets and `@` are replaced, since xdist only reads the group from node ids ending in `@<group>` after the last
+    bracket of the parameters.
+    """
+    return "snappylapy:" + _GROUP_NAME_RESERVED_CHARACTERS.sub("_", get_test_key(chain[0]))
+
+
+def _find_root(parents: list[int], index: int) -> int:
+    """Find the root of the chain of an item, compressing the path on the way."""
+    while parents[index] != index:
+        parents[index] = parents[parents[index]]
+        index = parents[index]
+    return index
+
+
+def find_dependency_chains(items: Sequence[ItemT]) -> list[list[ItemT]]:
+    """
+    Find the chains of tests connected by `depends`, with more than one test.
+
+    A test parametrized with a case folder is only connected to the tests of the dependency with the same case folder.
+    The tests of each chain are in the order of the items, and the chains in the order of their first test.
+    """
+    indices_by_function: dict[object, list[int]] = {}
+    for index, item in enumerate(items):
+        indices_by_function.setdefault(getattr(item, "function", None), []).append(index)
+    parents = list(range(len(items)))
+    for index, item in enumerate(items):
+        marker = item.get_closest_marker("snappylapy")
+        if not marker:
+            continue
+        case_directory = get_case_directory(item)
+        for depend in marker.kwargs.get("depends", []):
+            for depend_index in indices_by_function.get(depend, []):
+                depend_case_directory = get_case_directory(items[depend_index])
+                if case_directory and depend_case_directory and case_directory != depend_case_directory:
+                    continue
+                parents[_find_root(parents, index)] = _find_root(parents, depend_index)
+    chains_by_root: dict[int, list[ItemT]] = {}
+    for index, item in enumerate(items):
+        chains_by_root.setdefault(_find_root(parents, index), []).append(item)
+    return [chain for chain in chains_by_root.values() if len(chain) > 1]
+
+
+def order_by_chain_duration(
+    items: Sequence[ItemT],
+    chains: list[list[ItemT]],
+    durations: dict[str, float],
+) -> list[ItemT]:
+    """Order the chains by their recorded duration, the longest first, followed by the tests not in a chain."""
+    ordered_chains = sorted(
+        chains,
+        key=lambda chain: -sum(durations.get(get_test_key(item), 0.0) for item in chain),
+    )
+    chained_item_ids = {id(item) for chain in chains for item in chain}
+    return [
+        *(item for chain in ordered_chains for item in chain),
+        *(item for item in items if id(item) not in chained_item_ids),
+    ]
@@ -0,0 +1,95 @@
+"""
+Partition the case folders of `foreach_folder_in` tests into shards, for running them on several machines.
+
+Case folders are assigned to shards by a stable hash of their name, so every machine computes the same partition
+without coordination, and tests depending on a `foreach_folder_in` test get the same cases. Optionally the case
+folders are balanced by the durations recorded in earlier runs, which must then be the same on all machines, e.g.
+by restoring the same pytest cache.
+"""
+
+from __future__ import annotations
+
+import pytest
+import hashlib
+import pathlib
+import argparse
+from dataclasses import dataclass
+
+CASE_DURATIONS_CACHE_KEY = "snappylapy/case_durations"
+"""Key in the pytest cache for the recorded duration in seconds of each case folder."""
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A shard selected with `--snappylapy-shard=index/count`, the index starts at 1."""
+
+    index: int
+    count: int
+
+    def __str__(self) -> str:
+        """Format the shard the same way as the command line option."""
+        return f"{self.index}/{self.count}"
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse the value of the `--snappylapy-shard` option, e.g. `"2/4"` for the second of four shards."""
+    index_str, _, count_str = value.partition("/")
+    try:
+        shard = Shard(int(index_str), int(count_str))
+    except ValueError:
+        shard = Shard(0, 0)
+    if not 1 <= shard.index <= shard.count:
+        msg = f"Invalid shard {value!r}, expected 'index/count' with 1 <= index <= count, e.g. '1/4'."
+        raise argparse.ArgumentTypeError(msg)
+    return shard
+
+
+def get_case_key(case_directory: pathlib.Path) -> str:
+    """Get the key of a case folder, used for hashing and for recording durations."""
+    return case_directory.as_posix()
+
+
+def get_case_directory(item: pytest.Item) -> pathlib.Path | None:
+    """Get the case folder a `foreach_folder_in` test is parametrized with, None for other tests."""
+    callspec = getattr(item, "callspec", None)
+    case_directory = callspec.params.get("snappylapy_settings") if callspec else None
+    return case_directory if isinstance(case_directory, pathlib.Path) else None
+
+
+def _stable_hash(key: str) -> int:
+    """Hash a string the same way on every machine and python process, unlike the builtin hash."""
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+
+
+def _assign_by_duration(
+    case_directories: list[pathlib.Path],
+    shard_count: int,
+    durations: dict[str, float],
+) -> dict[pathlib.Path, int]:
+    """
+    Assign case folders to shards by recorded duration, the longest case first to the least loaded shard.
+
+    Cases without a recorded duration are estimated to take the mean of the recorded durations.
+    """
+    known_durations = [durations[key] for key in map(get_case_key, case_directories) if key in durations]
+    default_duration = sum(known_durations) / len(known_durations) if known_durations else 1.0
+    estimated = {case: durations.get(get_case_key(case), default_duration) for case in case_directories}
+    loads = [0.0] * shard_count
+    assignments: dict[pathlib.Path, int] = {}
+    for case in sorted(case_directories, key=lambda case: (-estimated[case], _stable_hash(case.name))):
+        shard_index = loads.index(min(loads))
+        loads[shard_index] += estimated[case]
+        assignments[case] = shard_index
+    return assignments
+
+
+def select_shard(
+    case_directories: list[pathlib.Path],
+    shard: Shard,
+    durations: dict[str, float] | None = None,
+) -> list[pathlib.Path]:
+    """Select the case folders of a shard, in the original order, balanced by the durations if given."""
+    if durations is not None:
+        assignments = _assign_by_duration(case_directories, shard.count, durations)
+        return [case for case in case_directories if assignments[case] == shard.index - 1]
+    return [case for case in case_directories if _stable_hash(case.name) % shard.count == shard.index - 1]
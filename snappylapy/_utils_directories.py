@@ -1,7 +1,81 @@
 """Utility functions for handling directories in snappylapy."""
+import os
+import shutil
 import pathlib
+import contextlib
+from snappylapy._atomic_write import is_temporary_file, replace_file
 from snappylapy.constants import DIRECTORY_NAMES
 
+_known_existing_directories: set[str] = set()
+"""Absolute paths of directories known to exist, shared by the whole process to avoid redundant mkdir calls."""
+
+
+def ensure_directory_exists(directory: pathlib.Path) -> None:
+    """Create the directory and its parents, unless it is already known to exist."""
+    key = os.path.abspath(directory)  # noqa: PTH100, cheaper than resolve() since it does not touch the filesystem
+    if key in _known_existing_directories:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _known_existing_directories.add(key)
+
+
+def clear_known_directories() -> None:
+    """Forget all directories known to exist, must be called when snappylapy directories are deleted."""
+    _known_existing_directories.clear()
+
+
+_case_directories: dict[str, tuple[int, list[pathlib.Path]]] = {}
+"""Cached listings of subdirectories by absolute path, with the modification time of the directory when listed."""
+
+
+def list_case_directories(directory: str | pathlib.Path) -> list[pathlib.Path]:
+    """
+    List the subdirectories of a directory, e.g. the test cases of `foreach_folder_in`.
+
+    Listings are cached for the process and listed again when the modification time of the directory changes. The
+    listing uses `os.scandir`, which gets the type of each entry from the directory listing without a stat call.
+    """
+    key = os.path.abspath(directory)  # noqa: PTH100, cheaper than resolve() since it does not touch the filesystem
+    modified_time = os.stat(directory).st_mtime_ns  # noqa: PTH116
+    cached = _case_directories.get(key)
+    if cached is None or cached[0] != modified_time:
+        with os.scandir(directory) as entries:
+            case_directories = [pathlib.Path(directory) / entry.name for entry in entries if entry.is_dir()]
+        cached = (modified_time, case_directories)
+        _case_directories[key] = cached
+    return list(cached[1])
+
+
+def clear_case_directories() -> None:
+    """Forget all cached listings of subdirectories."""
+    _case_directories.clear()
+
+
+def merge_namespace_directory(directory: pathlib.Path) -> None:
+    """
+    Move the test results of a namespace directory into the test results directory it is in, and remove it.
+
+    Each file is moved with `os.replace`, so other processes see either the previous or the complete new file. The
+    moved files are made durable as chosen by the fsync policy.
+    """
+    test_results_dir = directory.parent.parent
+    if not directory.is_dir():
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and not is_temporary_file(pathlib.Path(entry.path)):
+                replace_file(pathlib.Path(entry.path), test_results_dir / entry.name)
+    shutil.rmtree(directory, ignore_errors=True)
+    # The directory of the namespaces is left when other namespaces are not merged yet
+    with contextlib.suppress(OSError):
+        directory.parent.rmdir()
+
+
+def remove_namespace_directories(test_results_directories: list[pathlib.Path]) -> None:
+    """Remove the namespace directories left in test results directories, e.g. by a pytest-xdist worker that crashed."""
+    for directory in test_results_directories:
+        shutil.rmtree(directory / DIRECTORY_NAMES.worker_dir_name, ignore_errors=True)
+
 
 def find_directories(directory_names: list[str]) -> list[pathlib.Path]:
     """Find directories with the given names."""
@@ -11,17 +85,34 @@ def find_directories(directory_names: list[str]) -> list[pathlib.Path]:
     return found_dirs
 
 
-def get_file_paths_from_directories(list_of_directories: list[pathlib.Path]) -> list[pathlib.Path]:
-    """Get file paths from directories."""
+def get_file_paths_from_directories(
+    list_of_directories: list[pathlib.Path],
+    *,
+    include_temporary_files: bool = False,
+) -> list[pathlib.Path]:
+    """Get file paths from directories, leaving out the temporary files of interrupted atomic writes unless included."""
     list_of_files_to_delete: list[pathlib.Path] = []
     for directory in list_of_directories:
         if not directory.is_dir():
             error_msg = f"{directory} is not a directory."
             raise ValueError(error_msg)
-        list_of_files_to_delete.extend(file for file in directory.iterdir() if file.is_file())
+        list_of_files_to_delete.extend(
+            file
+            for file in directory.iterdir()
+            if file.is_file() and (include_temporary_files or not is_temporary_file(file))
+        )
     return list_of_files_to_delete
 
 
+def remove_temporary_files(directories: list[pathlib.Path]) -> None:
+    """Remove the temporary files left in directories by atomic writes of a process that was killed."""
+    for directory in directories:
+        for file in directory.iterdir():
+            if is_temporary_file(file):
+                with contextlib.suppress(FileNotFoundError):
+                    file.unlink()
+
+
 class DirectoryNamesUtil:
     """
     Utility class to handle directory names and operations related to them.
@@ -57,7 +148,8 @@ class DirectoryNamesUtil:
         return find_directories(self.get_all_directory_names())
 
     def get_all_file_paths_created_by_snappylapy(self) -> list[pathlib.Path]:
-        """Get all file paths created by snappylapy."""
+        """Get all file paths created by snappylapy, including temporary files of interrupted writes."""
         return get_file_paths_from_directories(
             self.get_all_directories_created_by_snappylapy(),
+            include_temporary_files=True,
         )
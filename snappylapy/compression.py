@@ -0,0 +1,154 @@
+"""
+Compression codecs for storing snapshots compressed on disk.
+
+Compression is opt-in and chosen by the file extension of the snapshot, e.g. `dict.json.gz` or `dataframe.csv.zst`.
+The codecs sit between the serializers and the disk, comparisons are always done on the decompressed content.
+"""
+
+from __future__ import annotations
+
+import io
+import gzip
+import pathlib
+import contextlib
+from abc import ABC, abstractmethod
+from collections.abc import Generator
+from types import ModuleType
+from typing import BinaryIO
+
+
+class Codec(ABC):
+    """Base class for compression codecs."""
+
+    extension: str
+    """File extension (without the dot) that selects the codec."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress bytes."""
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress bytes."""
+
+    def open_decompressed(self, path: pathlib.Path) -> BinaryIO:
+        """Open a compressed file for reading the decompressed content, override to decompress as a stream."""
+        return io.BytesIO(self.decompress(path.read_bytes()))
+
+    @contextlib.contextmanager
+    def open_compressed(self, file: BinaryIO) -> Generator[BinaryIO, None, None]:
+        """
+        Wrap a file opened for writing, compressing the content written to it. Override to compress as a stream.
+
+        Yields:
+            A buffer, compressed into the file when the context is left.
+
+        """
+        buffer = io.BytesIO()
+        try:
+            yield buffer
+        finally:
+            file.write(self.compress(buffer.getvalue()))
+
+
+class GzipCodec(Codec):
+    """Compress and decompress using gzip from the standard library."""
+
+    extension = "gz"
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress bytes the same way as when compressing as a stream."""
+        buffer = io.BytesIO()
+        with self.open_compressed(buffer) as file:
+            file.write(data)
+        return buffer.getvalue()
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress gzip bytes."""
+        return gzip.decompress(data)
+
+    def open_decompressed(self, path: pathlib.Path) -> BinaryIO:
+        """Open a gzip file for reading the decompressed content as a stream."""
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+
+    @contextlib.contextmanager
+    def open_compressed(self, file: BinaryIO) -> Generator[BinaryIO, None, None]:
+        """
+        Compress the content written as a stream.
+
+        Yields:
+            A gzip file with no file name and a fixed timestamp in the header, so the same content gives the same file.
+
+        """
+        with gzip.GzipFile(filename="", mode="wb", fileobj=file, mtime=0) as compressed_file:
+            yield compressed_file  # type: ignore[misc]
+
+
+def _import_zstandard() -> ModuleType:
+    """Import zstandard, raising an error with how to install it if it is missing."""
+    try:
+        # Lazy import to avoid dependency issues if zstandard is not installed
+        import zstandard  # noqa: PLC0415
+    except ImportError as e:
+        msg = "zstandard is required for .zst compressed snapshots, install it with `pip install snappylapy[zstd]`"
+        raise ImportError(msg) from e
+    return zstandard
+
+
+class ZstdCodec(Codec):
+    """Compress and decompress using zstandard."""
+
+    extension = "zst"
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress bytes using zstandard."""
+        zstandard = _import_zstandard()
+        return zstandard.ZstdCompressor().compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress zstandard bytes."""
+        zstandard = _import_zstandard()
+        # Frames compressed as a stream have no content size in the header, which decompress() requires
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+    @contextlib.contextmanager
+    def open_compressed(self, file: BinaryIO) -> Generator[BinaryIO, None, None]:
+        """
+        Compress the content written as a stream.
+
+        Yields:
+            A zstandard stream writer, which leaves the file open when closed.
+
+        """
+        zstandard = _import_zstandard()
+        with zstandard.ZstdCompressor().stream_writer(file, closefd=False) as compressed_file:
+            yield compressed_file
+
+
+CODECS: dict[str, Codec] = {codec.extension: codec for codec in (GzipCodec(), ZstdCodec())}
+"""Available codecs by file extension."""
+
+
+def get_codec(path: pathlib.Path | str) -> Codec | None:
+    """Get the codec for a file based on its last extension, None if the file is not compressed."""
+    extension = str(path).rsplit(".", maxsplit=1)[-1]
+    return CODECS.get(extension)
+
+
+def strip_codec_extension(path: pathlib.Path) -> pathlib.Path:
+    """Get the path without the compression extension, e.g. for showing the decompressed file in an editor."""
+    if get_codec(path) is None:
+        return path
+    return path.with_suffix("")
+
+
+def compress_for_path(path: pathlib.Path, data: bytes) -> bytes:
+    """Compress the data if the file extension of the path selects a codec."""
+    codec = get_codec(path)
+    return codec.compress(data) if codec else data
+
+
+def decompress_for_path(path: pathlib.Path, data: bytes) -> bytes:
+    """Decompress the data if the file extension of the path selects a codec."""
+    codec = get_codec(path)
+    return codec.decompress(data) if codec else data
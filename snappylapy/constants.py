@@ -5,6 +5,8 @@ from typing import NamedTuple
 
 DEFAULT_SNAPSHOT_BASE_DIR = pathlib.Path()
 OUTPUT_JSON_INDENTATION_LEVEL = 2
+FINGERPRINT_FILE_SUFFIX = ".fingerprint"
+"""Suffix of the files stored next to dataframe snapshots with a fingerprint of the snapshotted dataframe."""
 
 
 class DirectoryNames(NamedTuple):
@@ -12,8 +14,13 @@ class DirectoryNames(NamedTuple):
 
     snapshot_dir_name: str
     test_results_dir_name: str
+    blob_dir_name: str
+    worker_dir_name: str
 
 
 DIRECTORY_NAMES: DirectoryNames = DirectoryNames(
-    snapshot_dir_name="__snapshots__", test_results_dir_name="__test_results__",
+    snapshot_dir_name="__snapshots__",
+    test_results_dir_name="__test_results__",
+    blob_dir_name="__blobs__",
+    worker_dir_name="__workers__",
 )
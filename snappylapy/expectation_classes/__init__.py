@@ -1,17 +1,27 @@
 """Make expectation classes available for import."""
 
+from .expect_arrow import ArrowTableExpect
 from .expect_bytes import BytesExpect
 from .expect_dataframe import DataframeExpect
 from .expect_dict import DictExpect
 from .expect_list import ListExpect
+from .expect_ndarray import ArrayExpect
 from .expect_object import ObjectExpect
+from .expect_polars import PolarsExpect
+from .expect_records import RecordsExpect
+from .expect_series import SeriesExpect
 from .expect_string import StringExpect
 
 __all__ = [
+    "ArrayExpect",
+    "ArrowTableExpect",
     "BytesExpect",
     "DataframeExpect",
     "DictExpect",
     "ListExpect",
     "ObjectExpect",
+    "PolarsExpect",
+    "RecordsExpect",
+    "SeriesExpect",
     "StringExpect",
 ]
@@ -0,0 +1,52 @@
+"""Base class for snapshot testing of data written as json, with masking of volatile values."""
+
+from __future__ import annotations
+
+from .base_snapshot import BaseSnapshot, T
+from collections.abc import Iterable, Mapping
+from snappylapy._path_mask import Matcher, PathMask
+from snappylapy.models import Settings
+from snappylapy.serialization import JsonPickleSerializer
+from snappylapy.session import SnapshotSession
+from typing import cast
+
+
+class BaseJsonSnapshot(BaseSnapshot[T]):
+    """Base class for snapshot testing of dicts, lists and objects written as json."""
+
+    def __init__(self, settings: Settings, snappylapy_session: SnapshotSession) -> None:
+        """Initialize the snapshot without masking values."""
+        super().__init__(settings, snappylapy_session)
+        self._mask: PathMask | None = None
+        self._has_unwritten_test_results = False
+
+    def _create_serializer(self) -> JsonPickleSerializer[T]:
+        """Create the serializer, writing canonical json if enabled in the settings and masking values if given."""
+        return JsonPickleSerializer[T](canonical=self.settings.snapshot_canonical_json, mask=self._mask)
+
+    def _write_test_results(self, data: T) -> None:
+        """Defer writing the test results to `to_match_snapshot`, so they are serialized once with the values masked."""
+        del data  # Written from self._data
+        self._has_unwritten_test_results = True
+
+    def to_match_snapshot(
+        self,
+        exclude_paths: Iterable[str] | None = None,
+        matchers: Mapping[str, Matcher] | None = None,
+    ) -> None:
+        """
+        Write the test results and assert they match the snapshot.
+
+        exclude_paths: Iterable[str] | None
+            Paths of values to leave out of the snapshot, e.g. `"meta.created_at"`, `"items[*].id"` or `"**.uuid"`.
+        matchers: Mapping[str, type | tuple[type, ...] | Callable[[Any], bool]] | None
+            Paths of values to check with a type or a function, and to write as a placeholder like `"<datetime>"`.
+        """
+        if self._has_unwritten_test_results:
+            self._mask = PathMask(exclude_paths or (), matchers) if exclude_paths or matchers else None
+            try:
+                super()._write_test_results(cast("T", self._data))
+            finally:
+                self._mask = None
+            self._has_unwritten_test_results = False
+        super().to_match_snapshot()
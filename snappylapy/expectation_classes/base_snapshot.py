@@ -5,6 +5,15 @@ from __future__ import annotations
 import pathlib
 import Levenshtein
 from abc import ABC, abstractmethod
+from snappylapy._atomic_write import copy_file_atomic, write_bytes_atomic
+from snappylapy._blob_store import (
+    calculate_digest,
+    read_pointer_digest,
+    read_snapshot_bytes,
+    write_deduplicated_snapshot,
+)
+from snappylapy._utils_directories import ensure_directory_exists
+from snappylapy.compression import compress_for_path, decompress_for_path
 from snappylapy.models import Settings
 from snappylapy.serialization import Serializer
 from snappylapy.session import SnapshotSession
@@ -51,7 +60,7 @@ class BaseSnapshot(ABC, Generic[T]):
 
     def to_match_snapshot(self) -> None:
         """Assert test results match the snapshot."""
-        if not (self.settings.snapshot_dir / self.settings.filename).exists():
+        if not self.settings.snapshot_path.exists():
             if not self.settings.snapshot_update:
                 error_msg = f"Snapshot file not found: {self.settings.filename}, run 'snappylapy update' command in the terminal, or run pytest with the --snapshot-update flag to create it."  # noqa: E501
                 raise FileNotFoundError(error_msg)
@@ -59,10 +68,13 @@ class BaseSnapshot(ABC, Generic[T]):
             self._update_snapshot()
             return
 
-        snapshot_data = self._read_file(self.settings.snapshot_dir / self.settings.filename)
-        test_data = self._read_file(self.settings.test_results_dir / self.settings.filename)
+        snapshot_path = self.settings.snapshot_path
+        test_results_path = self.settings.test_results_path
+        if self._matches_deduplicated_snapshot(snapshot_path, test_results_path):
+            self.snappylapy_session.add_snapshot_test_succeeded(self.settings.filename)
+            return
         try:
-            self.compare_snapshot_data(snapshot_data, test_data)
+            self._compare_snapshot_files(snapshot_path, test_results_path)
         except AssertionError as error:
             if self.settings.snapshot_update:
                 self.snappylapy_session.add_updated_snapshot(self.settings.filename)
@@ -75,6 +87,10 @@ class BaseSnapshot(ABC, Generic[T]):
         else:
             self.snappylapy_session.add_snapshot_test_succeeded(self.settings.filename)
 
+    def _compare_snapshot_files(self, snapshot_path: pathlib.Path, test_results_path: pathlib.Path) -> None:
+        """Compare the snapshot file with the test results file, override to compare without reading whole files."""
+        self.compare_snapshot_data(self._read_file(snapshot_path), self._read_file(test_results_path))
+
     def compare_snapshot_data(self, snapshot_data: bytes, test_data: bytes) -> None:
         """
         Compare snapshot data with test data.
@@ -112,22 +128,40 @@ class BaseSnapshot(ABC, Generic[T]):
             self.settings.custom_name = str(name)
         self._data = data
         self.settings.filename_extension = extension
-        file_path = self.settings.test_results_dir / self.settings.filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_test_results(data)
+
+    def _write_test_results(self, data: T) -> None:
+        """Write the test results file, creating its directory if needed."""
+        file_path = self.settings.test_results_path
+        ensure_directory_exists(file_path.parent)
         self._save_test_results(file_path, data)
 
     def _update_snapshot(self) -> None:
         """Write test results to the snapshot file."""
-        snap_path = self.settings.snapshot_dir / self.settings.filename
-        test_path = self.settings.test_results_dir / self.settings.filename
-        snap_path.parent.mkdir(parents=True, exist_ok=True)
-        snap_path.write_bytes(test_path.read_bytes())
+        snap_path = self.settings.snapshot_path
+        test_path = self.settings.test_results_path
+        ensure_directory_exists(snap_path.parent)
+        if self.settings.snapshot_deduplicate:
+            write_deduplicated_snapshot(snap_path, test_path.read_bytes())
+        else:
+            copy_file_atomic(test_path, snap_path)
+
+    def _matches_deduplicated_snapshot(self, snapshot_path: pathlib.Path, test_results_path: pathlib.Path) -> bool:
+        """Check if the snapshot points to a blob with the same digest as the test results, without reading the blob."""
+        digest = read_pointer_digest(snapshot_path)
+        if digest is None or not test_results_path.exists():
+            return False
+        return digest == calculate_digest(test_results_path.read_bytes())
 
     def _read_file(self, path: pathlib.Path) -> bytes:
-        """Read file bytes or return placeholder."""
-        return path.read_bytes() if path.exists() else b"<No file>"
+        """Read and decompress file bytes or return placeholder."""
+        return decompress_for_path(path, read_snapshot_bytes(path)) if path.exists() else b"<No file>"
+
+    def _create_serializer(self) -> Serializer[T]:
+        """Create the serializer for writing test results, override to configure it from the settings."""
+        return self.serializer_class()
 
     def _save_test_results(self, path: pathlib.Path, data: T) -> None:
-        """Save data for test results."""
-        data_bin = self.serializer_class().serialize(data)
-        path.write_bytes(data_bin)
+        """Save data for test results atomically, compressed if the file extension selects a codec."""
+        data_bin = self._create_serializer().serialize(data)
+        write_bytes_atomic(path, compress_for_path(path, data_bin))
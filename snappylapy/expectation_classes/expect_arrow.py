@@ -0,0 +1,94 @@
+"""Snapshot testing and expectations for pyarrow tables."""
+
+from __future__ import annotations
+
+from .base_snapshot import BaseSnapshot
+from collections.abc import Callable
+from functools import wraps
+from snappylapy.serialization import ArrowIpcSerializer
+from typing import TYPE_CHECKING, Any, Protocol, TypeAlias, TypeVar, cast
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def require_pyarrow(func: F) -> F:
+    """Decorate to require pyarrow for the function."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        try:
+            import pyarrow as pa  # noqa: F401, PLC0415
+        except ImportError as exc:
+            error_message = "pyarrow is required for this function."
+            raise ImportError(error_message) from exc
+        return func(*args, **kwargs)
+
+    return cast("F", wrapper)
+
+
+class ArrowTableLike(Protocol):
+    """
+    The attributes of a pyarrow Table, used to tell tables apart in the overloads of `Expect.__call__`.
+
+    pyarrow has no type hints, so `pa.Table` is Any for type checkers and would match any data.
+    """
+
+    @property
+    def num_rows(self) -> int:
+        """Number of rows in the table."""
+
+    def combine_chunks(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Make a table with the chunks of each column combined."""
+
+
+def describe_table_mismatch(snapshot_table: "pa.Table", test_table: "pa.Table") -> str | None:  # noqa: UP037
+    """Describe how two pyarrow tables differ, None if they are equal."""
+    if snapshot_table.schema != test_table.schema:
+        return f"Tables have different schemas.\nSnapshot:\n{snapshot_table.schema}\nTest results:\n{test_table.schema}"
+    if snapshot_table.num_rows != test_table.num_rows:
+        return (
+            f"Tables have different number of rows. Snapshot: {snapshot_table.num_rows}, "
+            f"test results: {test_table.num_rows}."
+        )
+    differing_columns = [
+        name
+        for name in snapshot_table.column_names
+        if not snapshot_table.column(name).equals(test_table.column(name))
+    ]
+    if not differing_columns:
+        return None
+    return f"Tables are not matching. Differing columns: {', '.join(differing_columns)}."
+
+
+class ArrowTableExpect(BaseSnapshot["pa.Table"]):
+    """Snapshot testing for pyarrow tables."""
+
+    serializer_class = ArrowIpcSerializer
+    Table: TypeAlias = "pa.Table"
+
+    @require_pyarrow
+    def __call__(
+        self,
+        data_to_snapshot: "pa.Table",  # noqa: UP037
+        name: str | None = None,
+        filetype: str = "table.arrow",
+    ) -> ArrowTableExpect:
+        """Prepare a pyarrow table for snapshot testing."""
+        self._prepare_test(data_to_snapshot, name, filetype)
+        return self
+
+    def compare_snapshot_data(self, snapshot_data: bytes, test_data: bytes) -> None:
+        """
+        Compare the tables with the schema and the values of each column.
+
+        Instead of a text diff of the binary files, the differing schema, row count or columns are reported.
+        """
+        if snapshot_data == test_data:
+            return
+        serializer = self.serializer_class()
+        mismatch = describe_table_mismatch(serializer.deserialize(snapshot_data), serializer.deserialize(test_data))
+        if mismatch:
+            raise AssertionError(mismatch)
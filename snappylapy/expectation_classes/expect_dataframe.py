@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
+import json
+import hashlib
+import pathlib
 from .base_snapshot import BaseSnapshot
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
 from functools import wraps
-from snappylapy.serialization import PandasCsvSerializer
+from snappylapy._atomic_write import copy_file_atomic, write_bytes_atomic
+from snappylapy._blob_store import get_snapshot_size, read_snapshot_bytes
+from snappylapy.compression import compress_for_path
+from snappylapy.constants import FINGERPRINT_FILE_SUFFIX
+from snappylapy.models import Settings
+from snappylapy.serialization import JsonSerializer, PandasCsvSerializer
+from snappylapy.session import SnapshotSession
 from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, cast
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+TOP_K_DIFFERING_ROWS = 5
+FINGERPRINT_VERSION = "1"
+"""Version of the fingerprint format, bump it when the fingerprint or the serialization of dataframes changes."""
+SUMMARY_SAMPLE_ROWS = 10
+SUMMARY_QUANTILES = (0.0, 0.25, 0.5, 0.75, 1.0)
+SUMMARY_SIGNIFICANT_DIGITS = 12
+"""Statistics are rounded, so the summary does not change with floating point noise between platforms."""
+
 
 def require_pandas(func: F) -> F:
     """Decorate to require pandas for the function."""
@@ -29,23 +48,444 @@ def require_pandas(func: F) -> F:
     return cast("F", wrapper)
 
 
+@dataclass(slots=True)
+class DataframeComparisonOptions:
+    """Options for comparing the deserialized snapshot and test results dataframes."""
+
+    rtol: float = 0.0
+    """Relative tolerance for comparing numeric columns, see `numpy.isclose`."""
+
+    atol: float = 0.0
+    """Absolute tolerance for comparing numeric columns, see `numpy.isclose`."""
+
+    check_dtype: bool = True
+    """Flag to fail if the dtypes of the columns differ."""
+
+    ignore_columns: list[str] | None = None
+    """Columns that are not compared."""
+
+
+def _get_column_mismatch_mask(
+    snapshot_column: "pd.Series",  # noqa: UP037
+    test_column: "pd.Series",  # noqa: UP037
+    options: DataframeComparisonOptions,
+) -> "np.ndarray":  # noqa: UP037
+    """Get a boolean mask of the rows where the values of the two columns differ, missing values are equal."""
+    import numpy as np  # noqa: PLC0415
+    import pandas as pd  # noqa: PLC0415
+
+    both_missing = snapshot_column.isna().to_numpy() & test_column.isna().to_numpy()
+    is_numeric = all(
+        pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column)
+        for column in (snapshot_column, test_column)
+    )
+    if is_numeric and (options.rtol or options.atol):
+        is_equal = np.isclose(
+            test_column.to_numpy(dtype=np.float64, na_value=np.nan),
+            snapshot_column.to_numpy(dtype=np.float64, na_value=np.nan),
+            rtol=options.rtol,
+            atol=options.atol,
+        )
+    else:
+        is_equal = np.asarray(snapshot_column.to_numpy() == test_column.to_numpy(), dtype=bool)
+    return ~(is_equal | both_missing)
+
+
+def _get_column_keys(dataframe: "pd.DataFrame") -> list[tuple[Hashable, int]]:  # noqa: UP037
+    """Key the columns by their name and occurrence, so duplicate column names are matched in their order."""
+    occurrences: dict[Hashable, int] = {}
+    keys: list[tuple[Hashable, int]] = []
+    for column in dataframe.columns:
+        occurrence = occurrences.get(column, 0)
+        occurrences[column] = occurrence + 1
+        keys.append((column, occurrence))
+    return keys
+
+
+def _describe_structure_mismatch(
+    snapshot_df: "pd.DataFrame",  # noqa: UP037
+    test_df: "pd.DataFrame",  # noqa: UP037
+) -> list[str]:
+    """Describe differences in the columns, the order of the columns and the row count of two dataframes."""
+    lines: list[str] = []
+    snapshot_keys = _get_column_keys(snapshot_df)
+    test_keys = _get_column_keys(test_df)
+    snapshot_only_columns = [column for column, occurrence in snapshot_keys if (column, occurrence) not in test_keys]
+    test_only_columns = [column for column, occurrence in test_keys if (column, occurrence) not in snapshot_keys]
+    if snapshot_only_columns:
+        lines.append(f"Columns only in snapshot: {snapshot_only_columns}")
+    if test_only_columns:
+        lines.append(f"Columns only in test results: {test_only_columns}")
+    snapshot_common_keys = [key for key in snapshot_keys if key in test_keys]
+    test_common_keys = [key for key in test_keys if key in snapshot_keys]
+    if snapshot_common_keys != test_common_keys:
+        lines.append(
+            f"Column order differs. Snapshot: {list(snapshot_df.columns)}, test results: {list(test_df.columns)}.",
+        )
+    if len(snapshot_df) != len(test_df):
+        lines.append(f"Row count differs. Snapshot: {len(snapshot_df)}, test results: {len(test_df)}.")
+    return lines
+
+
+def _get_common_columns(
+    snapshot_df: "pd.DataFrame",  # noqa: UP037
+    test_df: "pd.DataFrame",  # noqa: UP037
+) -> list[tuple[str, int, int]]:
+    """Get the name and the positions in the snapshot and test results of the columns in both dataframes."""
+    test_positions = {key: position for position, key in enumerate(_get_column_keys(test_df))}
+    common_columns: list[tuple[str, int, int]] = []
+    for position, (column, occurrence) in enumerate(_get_column_keys(snapshot_df)):
+        if (column, occurrence) in test_positions:
+            name = str(column) if occurrence == 0 else f"{column} ({occurrence + 1})"
+            common_columns.append((name, position, test_positions[column, occurrence]))
+    return common_columns
+
+
+def describe_dataframe_mismatch(
+    snapshot_df: "pd.DataFrame",  # noqa: UP037
+    test_df: "pd.DataFrame",  # noqa: UP037
+    options: DataframeComparisonOptions,
+) -> str | None:
+    """
+    Compare two dataframes column wise, and describe the mismatch.
+
+    Rows are compared by position, and columns by name, with duplicate column names matched in their order. Returns
+    None if the dataframes are equal within the tolerances.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    if options.ignore_columns:
+        snapshot_df = snapshot_df.drop(columns=options.ignore_columns, errors="ignore")
+        test_df = test_df.drop(columns=options.ignore_columns, errors="ignore")
+    lines = _describe_structure_mismatch(snapshot_df, test_df)
+
+    common_columns = _get_common_columns(snapshot_df, test_df)
+    row_count = min(len(snapshot_df), len(test_df))
+    snapshot_df = snapshot_df.iloc[:row_count]
+    test_df = test_df.iloc[:row_count]
+
+    if options.check_dtype:
+        lines.extend(
+            f"Column {column} dtype differs. Snapshot: {snapshot_df.dtypes.iloc[snapshot_position]}, "
+            f"test results: {test_df.dtypes.iloc[test_position]}."
+            for column, snapshot_position, test_position in common_columns
+            if snapshot_df.dtypes.iloc[snapshot_position] != test_df.dtypes.iloc[test_position]
+        )
+
+    rows_differing = _get_column_mismatch_mask(
+        snapshot_df.index.to_series(),
+        test_df.index.to_series(),
+        options,
+    )
+    mismatch_counts: dict[str, int] = {}
+    if rows_differing.any():
+        mismatch_counts["<index>"] = int(rows_differing.sum())
+    for column, snapshot_position, test_position in common_columns:
+        column_mismatch = _get_column_mismatch_mask(
+            snapshot_df.iloc[:, snapshot_position],
+            test_df.iloc[:, test_position],
+            options,
+        )
+        count = int(column_mismatch.sum())
+        if count:
+            mismatch_counts[column] = count
+            rows_differing |= column_mismatch
+    if mismatch_counts:
+        lines.append("Mismatching values per column:")
+        lines.extend(f"  {column}: {count} of {row_count} rows" for column, count in mismatch_counts.items())
+        top_rows = np.flatnonzero(rows_differing)[:TOP_K_DIFFERING_ROWS]
+        lines.extend([
+            f"Top {len(top_rows)} differing rows in snapshot:\n{snapshot_df.iloc[top_rows].to_string()}",
+            f"Top {len(top_rows)} differing rows in test results:\n{test_df.iloc[top_rows].to_string()}",
+        ])
+
+    if not lines:
+        return None
+    header = (
+        f"Dataframes are not matching (rtol={options.rtol}, atol={options.atol}, "
+        f"check_dtype={options.check_dtype}, ignore_columns={options.ignore_columns})."
+    )
+    return "\n".join([header, *lines])
+
+
+def _hash_rows(dataframe: "pd.DataFrame") -> "pd.Series | None":  # noqa: UP037
+    """Hash each row including the index, None if the dataframe contains values that cannot be hashed, e.g. lists."""
+    import pandas as pd  # noqa: PLC0415
+
+    try:
+        return pd.util.hash_pandas_object(dataframe, index=True)
+    except TypeError:
+        return None
+
+
+def _calculate_fingerprint_from_row_hashes(dataframe: "pd.DataFrame", row_hashes: "pd.Series") -> str:  # noqa: UP037
+    hasher = hashlib.sha256()
+    schema = {
+        "version": FINGERPRINT_VERSION,
+        "columns": [str(column) for column in dataframe.columns],
+        "dtypes": [str(dtype) for dtype in dataframe.dtypes],
+        "index_names": [str(name) for name in dataframe.index.names],
+        "index_dtype": str(dataframe.index.dtype),
+    }
+    hasher.update(json.dumps(schema).encode())
+    hasher.update(row_hashes.to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+def calculate_dataframe_fingerprint(dataframe: "pd.DataFrame") -> str | None:  # noqa: UP037
+    """
+    Calculate a cheap fingerprint of the values, schema and index of a dataframe.
+
+    Returns None if the dataframe contains values that cannot be hashed, e.g. lists.
+    """
+    row_hashes = _hash_rows(dataframe)
+    if row_hashes is None:
+        return None
+    return _calculate_fingerprint_from_row_hashes(dataframe, row_hashes)
+
+
+def _round_statistic(value: Any) -> float | int | None:  # noqa: ANN401
+    """Convert a numpy scalar to a json value, rounding floats and mapping NaN to None."""
+    import pandas as pd  # noqa: PLC0415
+
+    if pd.isna(value):
+        return None
+    if isinstance(value, bool) or (not isinstance(value, float) and float(value).is_integer()):
+        return int(value)
+    return float(f"{float(value):.{SUMMARY_SIGNIFICANT_DIGITS}g}")
+
+
+def _summarize_column(column: "pd.Series") -> dict[str, Any]:  # noqa: UP037
+    """Summarize a column with statistics depending on the dtype."""
+    summary: dict[str, Any] = {"dtype": str(column.dtype), "null_count": int(column.isna().sum())}
+    kind = column.dtype.kind
+    if kind == "b":
+        summary["true_count"] = int(column.sum())
+    elif kind in "iuf":
+        quantiles = column.quantile(list(SUMMARY_QUANTILES))
+        summary.update({
+            "mean": _round_statistic(column.mean()),
+            "std": _round_statistic(column.std()),
+            "quantiles": {
+                str(quantile): _round_statistic(value)
+                for quantile, value in zip(SUMMARY_QUANTILES, quantiles, strict=True)
+            },
+        })
+    elif kind == "M":
+        summary.update({"min": str(column.min()), "max": str(column.max())})
+    else:
+        try:
+            summary["unique_count"] = int(column.nunique())
+        except TypeError:
+            summary["unique_count"] = None
+    return summary
+
+
+def summarize_dataframe(
+    dataframe: "pd.DataFrame",  # noqa: UP037
+    row_hashes: "pd.Series | None" = None,  # noqa: UP037
+) -> dict[str, Any]:
+    """
+    Create a deterministic summary of a dataframe, for snapshotting dataframes too large for a full snapshot.
+
+    The summary contains the schema, row count, statistics per column, a sample of rows and a digest of the whole
+    dataframe. The rows in the sample are selected by their hash, so the same rows are selected no matter the order.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    if row_hashes is None:
+        row_hashes = _hash_rows(dataframe)
+    sample_positions: np.ndarray
+    if row_hashes is None:
+        digest = None
+        sample_positions = np.arange(min(SUMMARY_SAMPLE_ROWS, len(dataframe)))
+    else:
+        digest = _calculate_fingerprint_from_row_hashes(dataframe, row_hashes)
+        sample_positions = np.sort(np.argsort(row_hashes.to_numpy(), kind="stable")[:SUMMARY_SAMPLE_ROWS])
+    sample = dataframe.iloc[sample_positions]
+    return {
+        "row_count": len(dataframe),
+        "index": {"names": [str(name) for name in dataframe.index.names], "dtype": str(dataframe.index.dtype)},
+        "columns": {str(name): _summarize_column(dataframe[name]) for name in dataframe.columns},
+        "sample": json.loads(sample.to_json(orient="split", date_format="iso", double_precision=10)),
+        "digest": digest,
+    }
+
+
+def get_fingerprint_path(snapshot_path: pathlib.Path) -> pathlib.Path:
+    """Get the path of the fingerprint file stored next to a snapshot file."""
+    return snapshot_path.with_name(snapshot_path.name + FINGERPRINT_FILE_SUFFIX)
+
+
+def is_fingerprint_matching_snapshot(snapshot_path: pathlib.Path, fingerprint: str) -> bool:
+    """
+    Check if the fingerprint stored next to the snapshot is the given fingerprint.
+
+    The size of the snapshot file is stored with the fingerprint, to detect snapshot files edited by hand. Both files
+    can be deduplicated in the blob store. A fingerprint that cannot be read is not matching, so the snapshot is
+    compared in full.
+    """
+    fingerprint_path = get_fingerprint_path(snapshot_path)
+    if not fingerprint_path.exists() or not snapshot_path.exists():
+        return False
+    import pandas as pd  # noqa: PLC0415
+
+    try:
+        stored = json.loads(read_snapshot_bytes(fingerprint_path))
+        return (
+            stored["fingerprint"] == fingerprint
+            # The hashing of pandas is not guaranteed to be stable between versions
+            and stored["pandas_version"] == pd.__version__
+            and stored["size"] == get_snapshot_size(snapshot_path)
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
 class DataframeExpect(BaseSnapshot["pd.DataFrame"]):
     """Snapshot testing for dataframes."""
 
     serializer_class = PandasCsvSerializer
     DataFrame: TypeAlias = "pd.DataFrame"
 
+    def __init__(self, settings: Settings, snappylapy_session: SnapshotSession) -> None:
+        """Initialize the dataframe snapshot, comparing exactly unless other options are given."""
+        super().__init__(settings, snappylapy_session)
+        self._comparison_options = DataframeComparisonOptions()
+        self._is_unchanged_by_fingerprint = False
+        self._is_summary = False
+
     @require_pandas
     def __call__(
         self,
         data_to_snapshot: "pd.DataFrame",  # noqa: UP037
         name: str | None = None,
-        filetype: str = "dataframe.csv",
+        filetype: str | None = None,
+        *,
+        summary: bool = False,
     ) -> DataframeExpect:
-        """Prepare a dataframe for snapshot testing."""
+        """
+        Prepare a dataframe for snapshot testing.
+
+        summary: bool
+            Snapshot a deterministic summary of the dataframe instead of the full csv. The summary contains the schema,
+            row count, statistics and null counts per column, a sample of rows and a digest of the whole dataframe.
+            Use it for dataframes too large for a full snapshot. Defaults the filetype to `dataframe.summary.json`.
+        """
+        self._is_summary = summary
+        if filetype is None:
+            filetype = "dataframe.summary.json" if summary else "dataframe.csv"
         self._prepare_test(data_to_snapshot, name, filetype)
         return self
 
+    @require_pandas
+    def to_match_snapshot(
+        self,
+        *,
+        rtol: float = 0.0,
+        atol: float = 0.0,
+        check_dtype: bool = True,
+        ignore_columns: list[str] | None = None,
+    ) -> None:
+        """
+        Assert test results match the snapshot.
+
+        When the files differ, the snapshot and test results are deserialized and compared column wise.
+
+        rtol: float
+            Relative tolerance for comparing numeric columns, see `numpy.isclose`.
+        atol: float
+            Absolute tolerance for comparing numeric columns, see `numpy.isclose`.
+        check_dtype: bool
+            Fail if the dtypes of the columns differ.
+        ignore_columns: list[str] | None
+            Columns that are not compared.
+        """
+        if self._is_unchanged_by_fingerprint:
+            self.snappylapy_session.add_snapshot_test_succeeded(self.settings.filename)
+            return
+        if self._is_summary and (rtol or atol or not check_dtype or ignore_columns):
+            msg = "Comparison options are not supported for summary snapshots of dataframes."
+            raise ValueError(msg)
+        self._comparison_options = DataframeComparisonOptions(
+            rtol=rtol,
+            atol=atol,
+            check_dtype=check_dtype,
+            ignore_columns=ignore_columns,
+        )
+        super().to_match_snapshot()
+
+    def _save_test_results(self, path: pathlib.Path, data: "pd.DataFrame") -> None:  # noqa: UP037
+        """
+        Save the dataframe for test results, unless the fingerprint shows it is unchanged from the snapshot.
+
+        The fingerprint is stored next to the test results, and copied along when the snapshot is updated.
+        """
+        row_hashes = _hash_rows(data)
+        fingerprint = None if row_hashes is None else _calculate_fingerprint_from_row_hashes(data, row_hashes)
+        snapshot_path = self.settings.snapshot_path
+        self._is_unchanged_by_fingerprint = fingerprint is not None and is_fingerprint_matching_snapshot(
+            snapshot_path,
+            fingerprint,
+        )
+        if self._is_unchanged_by_fingerprint:
+            # Remove test results left from an earlier run, they would otherwise be seen as changes
+            path.unlink(missing_ok=True)
+            return
+        if self._is_summary:
+            data_bin = JsonSerializer[dict[str, Any]]().serialize(summarize_dataframe(data, row_hashes))
+        else:
+            data_bin = self.serializer_class().serialize(data)
+        write_bytes_atomic(path, compress_for_path(path, data_bin))
+        if fingerprint is not None:
+            import pandas as pd  # noqa: PLC0415
+
+            fingerprint_data = {
+                "fingerprint": fingerprint,
+                "pandas_version": pd.__version__,
+                "size": path.stat().st_size,
+            }
+            write_bytes_atomic(get_fingerprint_path(path), json.dumps(fingerprint_data).encode("utf-8"))
+
+    def _update_snapshot(self) -> None:
+        """Write test results and the fingerprint to the snapshot files."""
+        super()._update_snapshot()
+        test_fingerprint_path = get_fingerprint_path(self.settings.test_results_path)
+        if test_fingerprint_path.exists():
+            snapshot_fingerprint_path = get_fingerprint_path(self.settings.snapshot_path)
+            copy_file_atomic(test_fingerprint_path, snapshot_fingerprint_path)
+
+    def compare_snapshot_data(self, snapshot_data: bytes, test_data: bytes) -> None:
+        """
+        Compare the dataframes column wise with the configured options.
+
+        Instead of a text diff of the csv files, the count of mismatching values per column and the top differing rows
+        are reported. Summary snapshots are compared with a text diff of the summaries.
+        """
+        if snapshot_data == test_data:
+            return
+        if self._is_summary:
+            super().compare_snapshot_data(snapshot_data, test_data)
+            return
+        serializer = self.serializer_class()
+        mismatch = describe_dataframe_mismatch(
+            serializer.deserialize(snapshot_data),
+            serializer.deserialize(test_data),
+            self._comparison_options,
+        )
+        if mismatch:
+            raise AssertionError(mismatch)
+
+    def _null_values_error_message(self, column_name: str, is_null: "pd.Series", null_count: int) -> str:  # noqa: UP037
+        """Create the error message for a column containing null values, using an already computed null mask."""
+        assert self._data is not None, "Data should have been checked before creating the error message."
+        top_n: int = 3  # Number of examples to display
+        null_rows: pd.DataFrame = self._data[is_null].head(top_n)
+        return (
+            f"Column {column_name} contains {null_count} null values. "
+            f"Top {top_n} examples:\n{null_rows.to_string(index=False)}"
+        )
+
     @require_pandas
     def column_not_to_contain_nulls(
         self,
@@ -58,17 +498,10 @@ class DataframeExpect(BaseSnapshot["pd.DataFrame"]):
         if column_name not in self._data.columns:
             error_message = f"Column {column_name} not found in dataframe."
             raise ValueError(error_message)
-        if self._data[column_name].isna().any():
-            null_count: int = int(self._data[column_name].isna().sum())
-            top_n: int = 3  # Number of examples to display
-            null_rows: pd.DataFrame = self._data[self._data[column_name].isna()].head(top_n)
-            null_value_error_message = (
-                f"Column {column_name} contains {null_count} null values. "
-                f"Top {top_n} examples:\n{null_rows.to_string(index=False)}"
-            )
-            raise ValueError(
-                null_value_error_message,
-            )
+        is_null = self._data[column_name].isna()
+        null_count = int(is_null.sum())
+        if null_count:
+            raise ValueError(self._null_values_error_message(column_name, is_null, null_count))
         return self
 
     @require_pandas
@@ -76,7 +509,11 @@ class DataframeExpect(BaseSnapshot["pd.DataFrame"]):
         self,
         column_names: list[str] | None = None,
     ) -> DataframeExpect:
-        """Check that multiple columns do not contain null values."""
+        """
+        Check that multiple columns do not contain null values.
+
+        The null values of all the columns are counted in a single vectorized scan of the dataframe.
+        """
         if self._data is None:
             error_message = "No data to check. Call __call__ first."
             raise ValueError(error_message)
@@ -84,12 +521,21 @@ class DataframeExpect(BaseSnapshot["pd.DataFrame"]):
             # Check all columns
             column_names = self._data.columns.tolist()
         assert column_names is not None, "Column names should have been set to default to all columns."
+        existing_columns = list(dict.fromkeys(name for name in column_names if name in self._data.columns))
+        is_null_frame = self._data[existing_columns].isna()
+        null_counts = is_null_frame.sum()
         error_texts: list[str] = []
         for column_name in column_names:
-            try:
-                self.column_not_to_contain_nulls(column_name)
-            except ValueError as e:  # noqa: PERF203
-                error_texts.append(str(e))
+            if column_name not in self._data.columns:
+                error_texts.append(f"Column {column_name} not found in dataframe.")
+            elif null_counts[column_name]:
+                error_texts.append(
+                    self._null_values_error_message(
+                        column_name,
+                        is_null_frame[column_name],
+                        int(null_counts[column_name]),
+                    ),
+                )
         if error_texts:
             raise ValueError("\n".join(error_texts))
         return self
@@ -105,15 +551,24 @@ class DataframeExpect(BaseSnapshot["pd.DataFrame"]):
         column_to_regex: dict[str, str]
             Dictionary of column names to regex patterns.
             The column name is the key and the regex pattern is the value.
+
+        The columns are converted to strings in a single batch, and each match mask is computed once.
         """
         if self._data is None:
             error_message = "No data to check. Call __call__ first."
             raise ValueError(error_message)
-        for column_name, regex in column_to_regex.items():
+        # Columns are checked in order, so the first missing column is only reported if the columns before it matched
+        columns_to_check: list[str] = []
+        missing_column: str | None = None
+        for column_name in column_to_regex:
             if column_name not in self._data.columns:
-                error_message = f"Column {column_name} not found in dataframe."
-                raise ValueError(error_message)
-            if not self._data[column_name].astype(str).str.match(regex).all():
+                missing_column = column_name
+                break
+            columns_to_check.append(column_name)
+        columns_as_strings = self._data[columns_to_check].astype(str)
+        for column_name in columns_to_check:
+            regex = column_to_regex[column_name]
+            if not columns_as_strings[column_name].str.match(regex).all():
                 regex_mismatch_message = (
                     f"Column {column_name} does not match regex {regex}. "
                     f"Top 3 examples:\n{self._data[column_name].head(3).to_string(index=False)}"
@@ -121,4 +576,7 @@ class DataframeExpect(BaseSnapshot["pd.DataFrame"]):
                 raise ValueError(
                     regex_mismatch_message,
                 )
+        if missing_column is not None:
+            error_message = f"Column {missing_column} not found in dataframe."
+            raise ValueError(error_message)
         return self
@@ -1,11 +1,11 @@
 """Snapshot testing and expectations for dicts."""
 from __future__ import annotations
 
-from .base_snapshot import BaseSnapshot
+from .base_json_snapshot import BaseJsonSnapshot
 from snappylapy.serialization import JsonPickleSerializer
 
 
-class DictExpect(BaseSnapshot[dict]):
+class DictExpect(BaseJsonSnapshot[dict]):
     """Snapshot testing for dictionaries."""
 
     serializer_class = JsonPickleSerializer[dict]
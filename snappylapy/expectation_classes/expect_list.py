@@ -1,12 +1,12 @@
 """Snapshot testing and expectations for lists."""
 from __future__ import annotations
 
-from .base_snapshot import BaseSnapshot
+from .base_json_snapshot import BaseJsonSnapshot
 from snappylapy.serialization import JsonPickleSerializer
 from typing import Any
 
 
-class ListExpect(BaseSnapshot[list[Any]]):
+class ListExpect(BaseJsonSnapshot[list[Any]]):
     """Snapshot testing for lists."""
 
     serializer_class = JsonPickleSerializer[list[Any]]
@@ -0,0 +1,131 @@
+"""Snapshot testing and expectations for numpy arrays."""
+
+from __future__ import annotations
+
+from .base_snapshot import BaseSnapshot
+from collections.abc import Callable
+from functools import wraps
+from snappylapy.models import Settings
+from snappylapy.serialization import NumpyNpySerializer
+from snappylapy.session import SnapshotSession
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, cast
+
+if TYPE_CHECKING:
+    import numpy as np
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+MAX_DIFFERING_ELEMENTS_TO_SHOW = 5
+
+
+def require_numpy(func: F) -> F:
+    """Decorate to require numpy for the function."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        try:
+            import numpy as np  # noqa: F401, PLC0415
+        except ImportError as exc:
+            error_message = "numpy is required for this function."
+            raise ImportError(error_message) from exc
+        return func(*args, **kwargs)
+
+    return cast("F", wrapper)
+
+
+def describe_array_mismatch(
+    snapshot_array: "np.ndarray",  # noqa: UP037
+    test_array: "np.ndarray",  # noqa: UP037
+    rtol: float,
+    atol: float,
+) -> str | None:
+    """
+    Compare two arrays of the same shape element wise, and describe the mismatch.
+
+    Returns None if all elements are equal within the tolerances. NaN values are considered equal to each other.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    is_numeric = snapshot_array.dtype.kind in "biufc" and test_array.dtype.kind in "biufc"
+    if is_numeric:
+        is_close = np.isclose(test_array, snapshot_array, rtol=rtol, atol=atol, equal_nan=True)
+    else:
+        is_close = np.asarray(test_array == snapshot_array)
+    count_differing = int(is_close.size - np.count_nonzero(is_close))
+    if count_differing == 0:
+        return None
+
+    lines = [
+        f"Arrays are not matching. {count_differing} of {is_close.size} elements differ (rtol={rtol}, atol={atol}).",
+    ]
+    if is_numeric:
+        dtype = np.result_type(snapshot_array, test_array, np.float64)
+        errors = np.where(is_close, 0, np.abs(test_array.astype(dtype) - snapshot_array.astype(dtype)))
+        # Elements where only one of the values is NaN are reported as an infinite error
+        errors = np.nan_to_num(errors, nan=np.inf, posinf=np.inf)
+        index_max_error = np.unravel_index(int(np.argmax(errors)), errors.shape)
+        lines.append(f"Max absolute error: {errors[index_max_error]} at index {tuple(map(int, index_max_error))}.")
+    lines.append("First differing elements (index: snapshot -> test results):")
+    for index in np.argwhere(~is_close)[:MAX_DIFFERING_ELEMENTS_TO_SHOW]:
+        index_tuple = tuple(map(int, index))
+        lines.append(f"  {index_tuple}: {snapshot_array[index_tuple]!r} -> {test_array[index_tuple]!r}")
+    return "\n".join(lines)
+
+
+class ArrayExpect(BaseSnapshot["np.ndarray"]):
+    """Snapshot testing for numpy arrays."""
+
+    serializer_class = NumpyNpySerializer
+    NDArray: TypeAlias = "np.ndarray"
+
+    def __init__(self, settings: Settings, snappylapy_session: SnapshotSession) -> None:
+        """Initialize the array snapshot, comparing exactly unless tolerances are given."""
+        super().__init__(settings, snappylapy_session)
+        self._rtol: float = 0.0
+        self._atol: float = 0.0
+
+    @require_numpy
+    def __call__(
+        self,
+        data_to_snapshot: "np.ndarray",  # noqa: UP037
+        name: str | None = None,
+        filetype: str = "ndarray.npy",
+    ) -> ArrayExpect:
+        """Prepare a numpy array for snapshot testing."""
+        self._prepare_test(data_to_snapshot, name, filetype)
+        return self
+
+    @require_numpy
+    def to_match_snapshot(self, rtol: float = 0.0, atol: float = 0.0) -> None:
+        """
+        Assert test results match the snapshot.
+
+        rtol: float
+            Relative tolerance for comparing numeric elements, see `numpy.isclose`.
+        atol: float
+            Absolute tolerance for comparing numeric elements, see `numpy.isclose`.
+        """
+        self._rtol = rtol
+        self._atol = atol
+        super().to_match_snapshot()
+
+    def compare_snapshot_data(self, snapshot_data: bytes, test_data: bytes) -> None:
+        """
+        Compare the arrays element wise with the configured tolerances.
+
+        Instead of a text diff, the number of differing elements and the maximum absolute error is reported.
+        """
+        if snapshot_data == test_data:
+            return
+        serializer = self.serializer_class()
+        snapshot_array = serializer.deserialize(snapshot_data)
+        test_array = serializer.deserialize(test_data)
+        if snapshot_array.shape != test_array.shape:
+            msg = f"Arrays have different shapes. Snapshot: {snapshot_array.shape}, test results: {test_array.shape}."
+            raise AssertionError(msg)
+        if snapshot_array.dtype != test_array.dtype:
+            msg = f"Arrays have different dtypes. Snapshot: {snapshot_array.dtype}, test results: {test_array.dtype}."
+            raise AssertionError(msg)
+        mismatch = describe_array_mismatch(snapshot_array, test_array, self._rtol, self._atol)
+        if mismatch:
+            raise AssertionError(mismatch)
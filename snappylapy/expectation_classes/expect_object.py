@@ -1,11 +1,11 @@
 """Snapshot testing and expectations for generic custom objects."""
 from __future__ import annotations
 
-from .base_snapshot import BaseSnapshot
+from .base_json_snapshot import BaseJsonSnapshot
 from snappylapy.serialization import JsonPickleSerializer
 
 
-class ObjectExpect(BaseSnapshot[object]):
+class ObjectExpect(BaseJsonSnapshot[object]):
     """Snapshot testing for generic objects."""
 
     serializer_class = JsonPickleSerializer[object]
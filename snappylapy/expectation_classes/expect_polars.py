@@ -0,0 +1,77 @@
+"""Snapshot testing and expectations for polars dataframes."""
+
+from __future__ import annotations
+
+from .base_snapshot import BaseSnapshot
+from collections.abc import Callable
+from functools import wraps
+from snappylapy.serialization import PolarsIpcSerializer
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, cast
+
+if TYPE_CHECKING:
+    import polars as pl
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def require_polars(func: F) -> F:
+    """Decorate to require polars for the function."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        try:
+            import polars as pl  # noqa: F401, PLC0415
+        except ImportError as exc:
+            error_message = "polars is required for this function."
+            raise ImportError(error_message) from exc
+        return func(*args, **kwargs)
+
+    return cast("F", wrapper)
+
+
+def describe_polars_mismatch(snapshot_df: "pl.DataFrame", test_df: "pl.DataFrame") -> str | None:  # noqa: UP037
+    """Describe how two polars dataframes differ, None if they are equal."""
+    if snapshot_df.schema != test_df.schema:
+        return f"Dataframes have different schemas. Snapshot: {snapshot_df.schema}, test results: {test_df.schema}."
+    if snapshot_df.height != test_df.height:
+        return (
+            f"Dataframes have different number of rows. Snapshot: {snapshot_df.height}, "
+            f"test results: {test_df.height}."
+        )
+    differing_columns = [
+        name for name in snapshot_df.columns if not snapshot_df.get_column(name).equals(test_df.get_column(name))
+    ]
+    if not differing_columns:
+        return None
+    return f"Dataframes are not matching. Differing columns: {', '.join(differing_columns)}."
+
+
+class PolarsExpect(BaseSnapshot["pl.DataFrame"]):
+    """Snapshot testing for polars dataframes."""
+
+    serializer_class = PolarsIpcSerializer
+    DataFrame: TypeAlias = "pl.DataFrame"
+
+    @require_polars
+    def __call__(
+        self,
+        data_to_snapshot: "pl.DataFrame",  # noqa: UP037
+        name: str | None = None,
+        filetype: str = "polars.arrow",
+    ) -> PolarsExpect:
+        """Prepare a polars dataframe for snapshot testing."""
+        self._prepare_test(data_to_snapshot, name, filetype)
+        return self
+
+    def compare_snapshot_data(self, snapshot_data: bytes, test_data: bytes) -> None:
+        """
+        Compare the dataframes with the schema and the values of each column.
+
+        Instead of a text diff of the binary files, the differing schema, row count or columns are reported.
+        """
+        if snapshot_data == test_data:
+            return
+        serializer = self.serializer_class()
+        mismatch = describe_polars_mismatch(serializer.deserialize(snapshot_data), serializer.deserialize(test_data))
+        if mismatch:
+            raise AssertionError(mismatch)
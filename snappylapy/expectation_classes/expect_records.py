@@ -0,0 +1,140 @@
+"""Snapshot testing and expectations for collections of records stored as JSON Lines."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+from .base_snapshot import BaseSnapshot
+from collections.abc import Iterable, Iterator
+from contextlib import nullcontext
+from itertools import islice, zip_longest
+from snappylapy._atomic_write import open_atomic
+from snappylapy._blob_store import get_blob_path, read_pointer_digest
+from snappylapy.compression import get_codec
+from snappylapy.serialization import ENCODING_TO_USE, JsonLinesSerializer
+from typing import Any
+
+MAX_MISMATCHED_INDICES_TO_SHOW = 20
+MAX_MISMATCHED_RECORDS_TO_SHOW = 5
+RECORDS_PER_WRITE = 10_000
+"""Number of records serialized before each write, to bound the memory used while streaming."""
+
+
+def iter_snapshot_lines(path: pathlib.Path) -> Iterator[bytes]:
+    """
+    Read the lines of a snapshot file one at a time.
+
+    Deduplicated snapshots are read from the blob they point to, and compressed snapshots are decompressed while
+    reading.
+
+    Yields
+    ------
+    bytes
+        The lines of the snapshot including the line endings.
+
+    """
+    digest = read_pointer_digest(path)
+    data_path = get_blob_path(path, digest) if digest is not None else path
+    codec = get_codec(path)
+    with codec.open_decompressed(data_path) if codec else data_path.open("rb") as file:
+        yield from file
+
+
+def _format_record_line(line: bytes | None) -> str:
+    return "<missing>" if line is None else line.decode(encoding=ENCODING_TO_USE, errors="replace").rstrip("\n")
+
+
+def _is_same_record(snapshot_line: bytes, test_line: bytes) -> bool:
+    """Check if two lines have equal JSON content, lines that are not valid JSON are not matching, e.g. truncated."""
+    try:
+        return json.loads(snapshot_line) == json.loads(test_line)
+    except ValueError:
+        return False
+
+
+def describe_records_mismatch(snapshot_lines: Iterable[bytes], test_lines: Iterable[bytes]) -> str | None:
+    """
+    Compare records line by line, and describe the indices of the mismatching records.
+
+    The lines are consumed one at a time, only the first mismatching records are kept for the description. Lines with
+    different formatting but equal JSON content are considered matching. Returns None if all records match.
+    """
+    mismatch_count = 0
+    snapshot_count = 0
+    test_count = 0
+    shown_indices: list[int] = []
+    shown_records: list[str] = []
+    for index, (snapshot_line, test_line) in enumerate(zip_longest(snapshot_lines, test_lines)):
+        snapshot_count += snapshot_line is not None
+        test_count += test_line is not None
+        if snapshot_line == test_line:
+            continue
+        if snapshot_line is not None and test_line is not None and _is_same_record(snapshot_line, test_line):
+            continue
+        mismatch_count += 1
+        if len(shown_indices) < MAX_MISMATCHED_INDICES_TO_SHOW:
+            shown_indices.append(index)
+        if len(shown_records) < MAX_MISMATCHED_RECORDS_TO_SHOW:
+            shown_records.append(f"  {index}: {_format_record_line(snapshot_line)} -> {_format_record_line(test_line)}")
+    if not mismatch_count:
+        return None
+
+    shown_indices_text = str(shown_indices) + (" ..." if mismatch_count > len(shown_indices) else "")
+    lines = [
+        (
+            f"Records are not matching. {mismatch_count} records differ. "
+            f"Snapshot has {snapshot_count} records, test results have {test_count} records."
+        ),
+        f"Mismatched record indices: {shown_indices_text}",
+        "First mismatched records (index: snapshot -> test results):",
+        *shown_records,
+    ]
+    return "\n".join(lines)
+
+
+class RecordsExpect(BaseSnapshot[Iterable[Any]]):
+    """Snapshot testing for collections of records, e.g. a list of dictionaries or a generator of rows."""
+
+    serializer_class = JsonLinesSerializer
+
+    def __call__(
+        self,
+        data_to_snapshot: Iterable[Any],
+        name: str | None = None,
+        filetype: str = "records.jsonl",
+    ) -> RecordsExpect:
+        """Prepare records for snapshot testing, iterators and generators are consumed while writing."""
+        self._prepare_test(data_to_snapshot, name, filetype)
+        return self
+
+    def _save_test_results(self, path: pathlib.Path, data: Iterable[Any]) -> None:
+        """Write the records in chunks as they are produced, so they are never all held in memory."""
+        codec = get_codec(path)
+        lines = JsonLinesSerializer().iter_serialize(data)
+        with open_atomic(path) as file, codec.open_compressed(file) if codec else nullcontext(file) as output:
+            while chunk := list(islice(lines, RECORDS_PER_WRITE)):
+                output.write(b"".join(chunk))
+
+    def _compare_snapshot_files(self, snapshot_path: pathlib.Path, test_results_path: pathlib.Path) -> None:
+        """Compare the files record by record while reading them, without loading the files into memory."""
+        if not test_results_path.exists():
+            super()._compare_snapshot_files(snapshot_path, test_results_path)
+            return
+        mismatch = describe_records_mismatch(iter_snapshot_lines(snapshot_path), iter_snapshot_lines(test_results_path))
+        if mismatch:
+            raise AssertionError(mismatch)
+
+    def compare_snapshot_data(self, snapshot_data: bytes, test_data: bytes) -> None:
+        """
+        Compare the records one by one.
+
+        Instead of a text diff of the whole file, the indices of the mismatching records are reported.
+        """
+        if snapshot_data == test_data:
+            return
+        mismatch = describe_records_mismatch(
+            snapshot_data.splitlines(keepends=True),
+            test_data.splitlines(keepends=True),
+        )
+        if mismatch:
+            raise AssertionError(mismatch)
@@ -0,0 +1,29 @@
+"""Snapshot testing and expectations for pandas series."""
+
+from __future__ import annotations
+
+from .base_snapshot import BaseSnapshot
+from .expect_dataframe import require_pandas
+from snappylapy.serialization import PandasSeriesCsvSerializer
+from typing import TYPE_CHECKING, TypeAlias
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class SeriesExpect(BaseSnapshot["pd.Series"]):
+    """Snapshot testing for pandas series."""
+
+    serializer_class = PandasSeriesCsvSerializer
+    Series: TypeAlias = "pd.Series"
+
+    @require_pandas
+    def __call__(
+        self,
+        data_to_snapshot: "pd.Series",  # noqa: UP037
+        name: str | None = None,
+        filetype: str = "series.csv",
+    ) -> SeriesExpect:
+        """Prepare a series for snapshot testing."""
+        self._prepare_test(data_to_snapshot, name, filetype)
+        return self
@@ -11,23 +11,38 @@ Snappylapy provides the following pytest fixtures.
 
 from __future__ import annotations
 
+import pathlib
 from .expectation_classes import (
+    ArrayExpect,
+    ArrowTableExpect,
     BytesExpect,
     DataframeExpect,
     DictExpect,
     ListExpect,
     ObjectExpect,
+    PolarsExpect,
+    RecordsExpect,
+    SeriesExpect,
     StringExpect,
 )
 from .models import Settings
 from .serialization import (
+    ArrowIpcSerializer,
     BytesSerializer,
+    JsonLinesSerializer,
     JsonPickleSerializer,
+    NumpyNpySerializer,
     PandasCsvSerializer,
+    PandasSeriesCsvSerializer,
+    PolarsIpcSerializer,
     Serializer,
     StringSerializer,
 )
-from snappylapy.constants import DIRECTORY_NAMES
+from collections.abc import Iterator
+from snappylapy._blob_store import read_snapshot_bytes
+from snappylapy.compression import CODECS, decompress_for_path
+from snappylapy.expectation_classes.expect_arrow import ArrowTableLike
+from snappylapy.expectation_classes.expect_records import iter_snapshot_lines
 from snappylapy.session import SnapshotSession
 from typing import Any, Protocol, TypeVar, overload
 
@@ -42,7 +57,18 @@ class _CallableExpectation(Protocol):
         data_to_snapshot: Any,  # noqa: ANN401
         name: str | None = None,
         filetype: str = "snapshot.txt",
-    ) -> DictExpect | ListExpect | StringExpect | BytesExpect | DataframeExpect:
+    ) -> (
+        DictExpect
+        | ListExpect
+        | StringExpect
+        | BytesExpect
+        | DataframeExpect
+        | SeriesExpect
+        | ArrayExpect
+        | PolarsExpect
+        | ArrowTableExpect
+        | RecordsExpect
+    ):
         """Call the expectation with the given parameters."""
         ...
 
@@ -57,7 +83,8 @@ class Expect:
     *Calling expect directly*
 
     The `expect` fixture can be called directly with a value, and it will automatically select
-    the appropriate handler (DictExpect, ListExpect, StringExpect, BytesExpect, DataframeExpect, or ObjectExpect)
+    the appropriate handler (DictExpect, ListExpect, StringExpect, BytesExpect, DataframeExpect, SeriesExpect,
+    ArrayExpect, PolarsExpect, ArrowTableExpect, RecordsExpect or ObjectExpect)
     depending on the type of the input. The input type must be resolvable to one of the supported types.
 
     Example usage
@@ -88,6 +115,19 @@ class Expect:
         df: pd.DataFrame = pd.DataFrame({"x": [1, 2]})
         expect(df).to_match_snapshot()
 
+        # Series input (requires pandas)
+        series: pd.Series = pd.Series([1.5, 2.5], name="y")
+        expect(series).to_match_snapshot()
+
+        # NumPy array input (requires numpy)
+        import numpy as np
+        array: np.ndarray = np.array([[1.0, 2.0], [3.0, 4.0]])
+        expect(array).to_match_snapshot()
+
+        # Iterator or generator input, streamed as JSON Lines records
+        rows = ({"row": index} for index in range(3))
+        expect(rows).to_match_snapshot()
+
         # Custom object input (falls back to ObjectExpect)
         class Custom:
             def __init__(self) -> None:
@@ -167,6 +207,43 @@ class Expect:
         ```
         """
 
+        self.records = RecordsExpect(self.settings, snappylapy_session)
+        """RecordsExpect instance for configuring snapshot testing of collections of records.
+
+        The records are written as JSON Lines, one compact JSON document per record, while iterating over the data.
+        Any iterable can be given, including generators, so large collections are never built in memory. When the
+        snapshot does not match, the indices of the mismatching records are reported.
+
+        The instance is callable with the following parameters:
+
+        Parameters
+        ----------
+        - `data_to_snapshot` (`Iterable[Any]`): The records to be snapshotted.
+        - `name` (`str`, optional): The name of the snapshot.
+        - `filetype` (`str`, optional): The file type of the snapshot, by default "records.jsonl".
+
+        Returns
+        -------
+        RecordsExpect
+        - `RecordsExpect`: The instance of the RecordsExpect class.
+
+        Example
+        -------
+        `test_fixture_expect_records.py`
+        ```python
+        import pytest
+        from collections.abc import Iterator
+        from snappylapy.fixtures import Expect
+
+        def generate_rows() -> Iterator[dict[str, int]]:
+            for number in range(3):
+                yield {"number": number, "square": number**2}
+
+        def test_expect_records(expect: Expect) -> None:
+            expect.records(generate_rows()).to_match_snapshot()
+        ```
+        """
+
         self.string = StringExpect(self.settings, snappylapy_session)
         """StringExpect instance for configuring snapshot testing of strings.
 
@@ -235,6 +312,8 @@ class Expect:
         - `data_to_snapshot` (`pd.DataFrame`): The dataframe data to be snapshotted.
         - `name` (`str`, optional): The name of the snapshot.
         - `filetype` (`str`, optional): The file type of the snapshot, by default "dataframe.json".
+        - `summary` (`bool`, optional): Snapshot a deterministic summary (schema, row count, statistics per column,
+          a sample of rows and a digest) instead of the full dataframe, by default False.
 
         Returns
         -------
@@ -255,6 +334,137 @@ class Expect:
         ```
         """
 
+        self.series = SeriesExpect(self.settings, snappylapy_session)
+        """SeriesExpect instance for configuring snapshot testing of pandas series.
+
+        The series is stored in csv format, with the dtype and name in the first line so they are kept when loading.
+
+        The instance is callable with the following parameters:
+
+        Parameters
+        ----------
+        - `data_to_snapshot` (`pd.Series`): The series to be snapshotted.
+        - `name` (`str`, optional): The name of the snapshot.
+        - `filetype` (`str`, optional): The file type of the snapshot, by default "series.csv".
+
+        Returns
+        -------
+        SeriesExpect
+        - `SeriesExpect`: The instance of the SeriesExpect class.
+
+        Example
+        -------
+        `test_fixture_expect_series.py`
+        ```python
+        import pytest
+        import pandas as pd
+        from snappylapy.fixtures import Expect
+
+        def test_expect_series(expect: Expect) -> None:
+            series: pd.Series = pd.Series([1, 2, 3], name="numbers", dtype="int32")
+            expect.series(series).to_match_snapshot()
+        ```
+        """
+
+        self.ndarray = ArrayExpect(self.settings, snappylapy_session)
+        """ArrayExpect instance for configuring snapshot testing of numpy arrays.
+
+        The array is stored in the binary .npy format, and compared element wise. Tolerances for comparing
+        numeric elements can be given with `to_match_snapshot(rtol=..., atol=...)`.
+
+        The instance is callable with the following parameters:
+
+        Parameters
+        ----------
+        - `data_to_snapshot` (`np.ndarray`): The numpy array to be snapshotted.
+        - `name` (`str`, optional): The name of the snapshot.
+        - `filetype` (`str`, optional): The file type of the snapshot, by default "ndarray.npy".
+
+        Returns
+        -------
+        ArrayExpect
+        - `ArrayExpect`: The instance of the ArrayExpect class.
+
+        Example
+        -------
+        `test_fixture_expect_ndarray.py`
+        ```python
+        import pytest
+        import numpy as np
+        from snappylapy.fixtures import Expect
+
+        def test_expect_ndarray(expect: Expect) -> None:
+            array: np.ndarray = np.linspace(0.0, 1.0, 5)
+            expect.ndarray(array).to_match_snapshot(rtol=1e-9, atol=1e-12)
+        ```
+        """
+
+        self.polars = PolarsExpect(self.settings, snappylapy_session)
+        """PolarsExpect instance for configuring snapshot testing of polars dataframes.
+
+        The dataframe is stored in the Arrow IPC file format written by polars, and compared on the schema and the
+        values of each column.
+
+        The instance is callable with the following parameters:
+
+        Parameters
+        ----------
+        - `data_to_snapshot` (`pl.DataFrame`): The polars dataframe to be snapshotted.
+        - `name` (`str`, optional): The name of the snapshot.
+        - `filetype` (`str`, optional): The file type of the snapshot, by default "polars.arrow".
+
+        Returns
+        -------
+        PolarsExpect
+        - `PolarsExpect`: The instance of the PolarsExpect class.
+
+        Example
+        -------
+        `test_fixture_expect_polars.py`
+        ```python
+        import pytest
+        import polars as pl
+        from snappylapy.fixtures import Expect
+
+        def test_expect_polars(expect: Expect) -> None:
+            df: pl.DataFrame = pl.DataFrame({"key": ["value1", "value2"], "number": [1, 2]})
+            expect.polars(df).to_match_snapshot()
+        ```
+        """
+
+        self.arrow_table = ArrowTableExpect(self.settings, snappylapy_session)
+        """ArrowTableExpect instance for configuring snapshot testing of pyarrow tables.
+
+        The table is stored in the Arrow IPC file format written by pyarrow, and compared on the schema and the
+        values of each column.
+
+        The instance is callable with the following parameters:
+
+        Parameters
+        ----------
+        - `data_to_snapshot` (`pa.Table`): The pyarrow table to be snapshotted.
+        - `name` (`str`, optional): The name of the snapshot.
+        - `filetype` (`str`, optional): The file type of the snapshot, by default "table.arrow".
+
+        Returns
+        -------
+        ArrowTableExpect
+        - `ArrowTableExpect`: The instance of the ArrowTableExpect class.
+
+        Example
+        -------
+        `test_fixture_expect_arrow_table.py`
+        ```python
+        import pytest
+        import pyarrow as pa
+        from snappylapy.fixtures import Expect
+
+        def test_expect_arrow_table(expect: Expect) -> None:
+            table: pa.Table = pa.table({"key": ["value1", "value2"], "number": [1, 2]})
+            expect.arrow_table(table).to_match_snapshot()
+        ```
+        """
+
         self.object = ObjectExpect(self.settings, snappylapy_session)
         """ObjectExpect instance for configuring snapshot testing of generic objects.
 
@@ -314,6 +524,46 @@ class Expect:
         filetype: str | None = None,
     ) -> DataframeExpect: ...
 
+    @overload
+    def __call__(
+        self,
+        data_to_snapshot: SeriesExpect.Series,
+        name: str | None = None,
+        filetype: str | None = None,
+    ) -> SeriesExpect: ...
+
+    @overload
+    def __call__(
+        self,
+        data_to_snapshot: ArrayExpect.NDArray,
+        name: str | None = None,
+        filetype: str | None = None,
+    ) -> ArrayExpect: ...
+
+    @overload
+    def __call__(
+        self,
+        data_to_snapshot: PolarsExpect.DataFrame,
+        name: str | None = None,
+        filetype: str | None = None,
+    ) -> PolarsExpect: ...
+
+    @overload
+    def __call__(
+        self,
+        data_to_snapshot: ArrowTableLike,
+        name: str | None = None,
+        filetype: str | None = None,
+    ) -> ArrowTableExpect: ...
+
+    @overload
+    def __call__(
+        self,
+        data_to_snapshot: Iterator[Any],
+        name: str | None = None,
+        filetype: str | None = None,
+    ) -> RecordsExpect: ...
+
     @overload
     def __call__(
         self,
@@ -324,10 +574,31 @@ class Expect:
 
     def __call__(
         self,
-        data_to_snapshot: dict | list[Any] | str | bytes | DataframeExpect.DataFrame,
+        data_to_snapshot: dict
+        | list[Any]
+        | str
+        | bytes
+        | DataframeExpect.DataFrame
+        | SeriesExpect.Series
+        | ArrayExpect.NDArray
+        | PolarsExpect.DataFrame
+        | ArrowTableExpect.Table
+        | Iterator[Any],
         name: str | None = None,
         filetype: str | None = None,
-    ) -> DictExpect | ListExpect | StringExpect | BytesExpect | DataframeExpect | ObjectExpect:
+    ) -> (
+        DictExpect
+        | ListExpect
+        | StringExpect
+        | BytesExpect
+        | DataframeExpect
+        | SeriesExpect
+        | ArrayExpect
+        | PolarsExpect
+        | ArrowTableExpect
+        | RecordsExpect
+        | ObjectExpect
+    ):
         """Call the fixture with the given parameters. Falls back to object handler for custom objects."""
         kwargs: dict[str, str] = {}
         if name is not None:
@@ -347,24 +618,36 @@ class Expect:
             if isinstance(typ, type) and isinstance(data_to_snapshot, typ):
                 return func(data_to_snapshot, **kwargs)
 
-        # Check if the object is a pandas DataFrame without importing pandas directly
-        if (
-            type(data_to_snapshot).__module__.startswith("pandas")
-            and type(data_to_snapshot).__name__ == "DataFrame"
-            # TODO: Create a protocol class instead that contains all the dependencies we are depending on
-        ):
-            return self.dataframe(data_to_snapshot, **kwargs)  # type: ignore[arg-type]
+        # Check types of optional dependencies by their top level module and class name, without importing them
+        # TODO: Create a protocol class instead that contains all the dependencies we are depending on
+        optional_type_map: dict[tuple[str, str], _CallableExpectation] = {
+            ("pandas", "DataFrame"): self.dataframe,
+            ("pandas", "Series"): self.series,
+            ("numpy", "ndarray"): self.ndarray,
+            ("polars", "DataFrame"): self.polars,
+            ("pyarrow", "Table"): self.arrow_table,
+        }
+        data_type = type(data_to_snapshot)
+        optional_handler = optional_type_map.get((data_type.__module__.split(".")[0], data_type.__name__))
+        if optional_handler is not None:
+            return optional_handler(data_to_snapshot, **kwargs)
+
+        # Iterators and generators are streamed as records, so they are never materialized in memory
+        if isinstance(data_to_snapshot, Iterator):
+            return self.records(data_to_snapshot, **kwargs)
 
         # Fallback: treat custom objects as dicts for snapshotting
         return self.object(data_to_snapshot, **kwargs)
 
     def _read_snapshot(self) -> bytes:
         """Read the snapshot file."""
-        return (self.settings.snapshot_dir / self.settings.filename).read_bytes()
+        path = self.settings.snapshot_path
+        return decompress_for_path(path, read_snapshot_bytes(path))
 
     def _read_test_results(self) -> bytes:
         """Read the test results file."""
-        return (self.settings.test_results_dir / self.settings.filename).read_bytes()
+        path = self.settings.test_results_path
+        return decompress_for_path(path, path.read_bytes())
 
 
 class LoadSnapshot:
@@ -380,8 +663,8 @@ class LoadSnapshot:
         self.settings = settings
         self._current_dependency_index = 0
 
-    def _read_snapshot(self) -> bytes:
-        """Read the snapshot file."""
+    def _get_snapshot_path(self) -> pathlib.Path:
+        """Get the path of the snapshot file of the current dependency."""
         if self._current_dependency_index >= len(self.settings.depending_tests):
             msg = (
                 f"Attempted to load more dependencies ({self._current_dependency_index + 1}) "
@@ -392,11 +675,20 @@ class LoadSnapshot:
         if not self.settings.depending_tests[self._current_dependency_index].snapshots_base_dir:
             msg = "Depending snapshots base directory is not set."
             raise ValueError(msg)
-        return (
-            self.settings.depending_tests[self._current_dependency_index].snapshots_base_dir
-            / DIRECTORY_NAMES.snapshot_dir_name
-            / self.settings.depending_tests[self._current_dependency_index].filename
-        ).read_bytes()
+        path = self.settings.depending_tests[self._current_dependency_index].snapshot_path
+        if not path.exists():
+            # The snapshot might have been stored compressed, e.g. as dict.json.gz
+            for extension in CODECS:
+                compressed_path = path.with_name(f"{path.name}.{extension}")
+                if compressed_path.exists():
+                    path = compressed_path
+                    break
+        return path
+
+    def _read_snapshot(self) -> bytes:
+        """Read the snapshot file."""
+        path = self._get_snapshot_path()
+        return decompress_for_path(path, read_snapshot_bytes(path))
 
     def _load_and_deserialize(self, filename_extension: str, deserializer: Serializer[T]) -> T:
         """Set filename extension, read, deserialize, and increment dependency index."""
@@ -564,6 +856,159 @@ class LoadSnapshot:
             PandasCsvSerializer(),
         )
 
+    def series(self) -> SeriesExpect.Series:
+        """
+        Load series snapshot.
+
+        Use this method to load a pandas series snapshot that was created in a previous test.
+        This is useful for reusing test data, isolating dependencies, and verifying integration between components.
+
+        Example usage:
+        --------------
+        `test_load_snapshot_from_file_series.py`
+        ```python
+        import pytest
+        import pandas as pd
+        from snappylapy.fixtures import LoadSnapshot, Expect
+
+        def test_save_series_snapshot(expect: Expect) -> None:
+            series: pd.Series = pd.Series([1, 2, 3], name="numbers", dtype="int32")
+            expect(series).to_match_snapshot()
+
+        @pytest.mark.snappylapy(depends=[test_save_series_snapshot])
+        def test_load_snapshot_series(load_snapshot: LoadSnapshot) -> None:
+            series: pd.Series = load_snapshot.series()
+            assert series.name == "numbers"
+            assert series.dtype == "int32"
+            assert series.sum() == 6
+        ```
+        """
+        return self._load_and_deserialize(
+            "series.csv",
+            PandasSeriesCsvSerializer(),
+        )
+
+    def ndarray(self) -> ArrayExpect.NDArray:
+        """
+        Load numpy array snapshot.
+
+        Use this method to load a numpy array snapshot that was created in a previous test.
+        This is useful for reusing test data, isolating dependencies, and verifying integration between components.
+
+        Example usage:
+        --------------
+        `test_load_snapshot_from_file_ndarray.py`
+        ```python
+        import pytest
+        import numpy as np
+        from snappylapy.fixtures import LoadSnapshot, Expect
+
+        def test_save_ndarray_snapshot(expect: Expect) -> None:
+            array: np.ndarray = np.arange(6).reshape(2, 3)
+            expect(array).to_match_snapshot()
+
+        @pytest.mark.snappylapy(depends=[test_save_ndarray_snapshot])
+        def test_load_snapshot_ndarray(load_snapshot: LoadSnapshot) -> None:
+            array: np.ndarray = load_snapshot.ndarray()
+            assert array.shape == (2, 3)
+            assert array.sum() == 15
+        ```
+        """
+        return self._load_and_deserialize(
+            "ndarray.npy",
+            NumpyNpySerializer(),
+        )
+
+    def polars(self) -> PolarsExpect.DataFrame:
+        """
+        Load polars dataframe snapshot.
+
+        Use this method to load a polars dataframe snapshot that was created in a previous test.
+        This is useful for reusing test data, isolating dependencies, and verifying integration between components.
+
+        Example usage:
+        --------------
+        `test_load_snapshot_from_file_polars.py`
+        ```python
+        import pytest
+        import polars as pl
+        from snappylapy.fixtures import LoadSnapshot, Expect
+
+        def test_save_polars_snapshot(expect: Expect) -> None:
+            df: pl.DataFrame = pl.DataFrame({"numbers": [1, 2, 3]})
+            expect(df).to_match_snapshot()
+
+        @pytest.mark.snappylapy(depends=[test_save_polars_snapshot])
+        def test_load_snapshot_polars(load_snapshot: LoadSnapshot) -> None:
+            df: pl.DataFrame = load_snapshot.polars()
+            assert df["numbers"].sum() == 6
+        ```
+        """
+        return self._load_and_deserialize(
+            "polars.arrow",
+            PolarsIpcSerializer(),
+        )
+
+    def arrow_table(self) -> ArrowTableExpect.Table:
+        """
+        Load pyarrow table snapshot.
+
+        Use this method to load a pyarrow table snapshot that was created in a previous test.
+        The columns of the table are read from the snapshot without copying.
+
+        Example usage:
+        --------------
+        `test_load_snapshot_from_file_arrow_table.py`
+        ```python
+        import pytest
+        import pyarrow as pa
+        from snappylapy.fixtures import LoadSnapshot, Expect
+
+        def test_save_arrow_table_snapshot(expect: Expect) -> None:
+            table: pa.Table = pa.table({"numbers": [1, 2, 3]})
+            expect(table).to_match_snapshot()
+
+        @pytest.mark.snappylapy(depends=[test_save_arrow_table_snapshot])
+        def test_load_snapshot_arrow_table(load_snapshot: LoadSnapshot) -> None:
+            table: pa.Table = load_snapshot.arrow_table()
+            assert table.column("numbers").to_pylist() == [1, 2, 3]
+        ```
+        """
+        return self._load_and_deserialize(
+            "table.arrow",
+            ArrowIpcSerializer(),
+        )
+
+    def records(self) -> Iterator[Any]:
+        """
+        Load records snapshot as a lazy iterator.
+
+        Use this method to load a records snapshot that was created in a previous test.
+        The records are read from the file one at a time while iterating, so large snapshots are never loaded
+        into memory at once.
+
+        Example usage:
+        --------------
+        `test_load_snapshot_from_file_records.py`
+        ```python
+        import pytest
+        from snappylapy.fixtures import LoadSnapshot, Expect
+
+        def test_save_records_snapshot(expect: Expect) -> None:
+            rows = ({"id": index, "name": f"row {index}"} for index in range(3))
+            expect.records(rows).to_match_snapshot()
+
+        @pytest.mark.snappylapy(depends=[test_save_records_snapshot])
+        def test_load_snapshot_records(load_snapshot: LoadSnapshot) -> None:
+            ids = [row["id"] for row in load_snapshot.records()]
+            assert ids == [0, 1, 2]
+        ```
+        """
+        self.settings.depending_tests[self._current_dependency_index].filename_extension = "records.jsonl"
+        path = self._get_snapshot_path()
+        self._current_dependency_index += 1
+        return JsonLinesSerializer().iter_deserialize(iter_snapshot_lines(path))
+
     def object(self) -> object:
         """
         Load object snapshot.
@@ -24,6 +24,7 @@ class SnappylapyMarkerConfig:
     depends: list[Callable[..., Any]] | None = None
     output_dir: str | None = None
     foreach_folder_in: str | Path | None = None
+    canonical_json: bool = False
 
 
 def configure_snappylapy(
@@ -31,6 +32,7 @@ def configure_snappylapy(
     depends: list[Callable[..., Any]] | None = None,
     output_dir: str | None = None,
     foreach_folder_in: str | Path | None = None,
+    canonical_json: bool = False,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
     Decorate a test function with the snappylapy marker and configuration.
@@ -45,6 +47,8 @@ def configure_snappylapy(
         kwargs["output_dir"] = output_dir
     if foreach_folder_in is not None:
         kwargs["foreach_folder_in"] = foreach_folder_in
+    if canonical_json:
+        kwargs["canonical_json"] = canonical_json
     marker = pytest.mark.snappylapy(**kwargs)
 
     def _wrap(func: Callable[P, R]) -> Callable[P, R]:
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import pathlib
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from snappylapy.constants import DIRECTORY_NAMES
+from typing import Any
 
+_FILENAME_FIELDS = frozenset({"test_filename", "test_function", "custom_name", "filename_extension"})
+"""Fields the snapshot filename is built from, setting one of them clears the cached filename and paths."""
 
-@dataclass
+
+@dataclass(slots=True)
 class DependingSettings:
     """Settings for depending on other snapshots. Used for loading snapshots."""
 
@@ -26,18 +30,40 @@ class DependingSettings:
     custom_name: str | None = None
     """Custom name for the depending snapshot file."""
 
+    _snapshot_path: pathlib.Path | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Set an attribute, clearing the cached snapshot path if it depends on it."""
+        object.__setattr__(self, name, value)
+        if name in _FILENAME_FIELDS or name == "snapshots_base_dir":
+            object.__setattr__(self, "_snapshot_path", None)
+
+    @property
+    def filename_prefix(self) -> str:
+        """Depending snapshot filename without the extension."""
+        if self.custom_name is not None:
+            return f"[{self.test_filename}][{self.test_function}][{self.custom_name}]"
+        return f"[{self.test_filename}][{self.test_function}]"
+
     @property
     def filename(self) -> str:
         """Get the depending snapshot filename."""
         if not self.filename_extension:
             msg = "Missing depending snapshot filename extension."
             raise ValueError(msg)
-        if self.custom_name is not None:
-            return f"[{self.test_filename}][{self.test_function}][{self.custom_name}].{self.filename_extension}"
-        return f"[{self.test_filename}][{self.test_function}].{self.filename_extension}"
+        return f"{self.filename_prefix}.{self.filename_extension}"
+
+    @property
+    def snapshot_path(self) -> pathlib.Path:
+        """Path of the depending snapshot file, cached until a field it is built from is set."""
+        if self._snapshot_path is None:
+            self._snapshot_path = (
+                pathlib.Path(self.snapshots_base_dir) / DIRECTORY_NAMES.snapshot_dir_name / self.filename
+            )
+        return self._snapshot_path
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Shared setting for all the strategies for doing snapshot testing."""
 
@@ -56,9 +82,18 @@ class Settings:
     snapshot_update: bool = False
     """Flag to update the snapshots."""
 
+    snapshot_deduplicate: bool = False
+    """Flag to store updated snapshots in a content-addressed blob store, so identical payloads are stored once."""
+
+    snapshot_canonical_json: bool = False
+    """Flag to write json snapshots canonically, with sorted keys, normalized floats and sorted sets."""
+
     filename_extension: str = "txt"
     """Extension for the output of snapshot file."""
 
+    test_results_namespace: str | None = None
+    """Name of the subdirectory of the test results directory to write to, e.g. the id of the pytest-xdist worker."""
+
     # Configurations for depending
     depending_tests: list[DependingSettings] = field(default_factory=list)
     """
@@ -67,19 +102,70 @@ class Settings:
     Information about each test the users have specified in a test decorator will be stored here.
     """
 
+    _filename: str | None = field(default=None, init=False, repr=False, compare=False)
+    _snapshot_dir: pathlib.Path | None = field(default=None, init=False, repr=False, compare=False)
+    _test_results_dir: pathlib.Path | None = field(default=None, init=False, repr=False, compare=False)
+    _snapshot_path: pathlib.Path | None = field(default=None, init=False, repr=False, compare=False)
+    _test_results_path: pathlib.Path | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Set an attribute, clearing the cached filename and paths depending on it."""
+        object.__setattr__(self, name, value)
+        if name in _FILENAME_FIELDS:
+            object.__setattr__(self, "_filename", None)
+        elif name in {"snapshots_base_dir", "test_results_namespace"}:
+            object.__setattr__(self, "_snapshot_dir", None)
+            object.__setattr__(self, "_test_results_dir", None)
+        else:
+            return
+        object.__setattr__(self, "_snapshot_path", None)
+        object.__setattr__(self, "_test_results_path", None)
+
+    def copy(self) -> Settings:
+        """Copy the settings, with copies of the depending settings, so the copy can be changed independently."""
+        return replace(self, depending_tests=[replace(depending) for depending in self.depending_tests])
+
     @property
     def snapshot_dir(self) -> pathlib.Path:
         """Get the snapshot directory."""
-        return pathlib.Path(self.snapshots_base_dir) / DIRECTORY_NAMES.snapshot_dir_name
+        if self._snapshot_dir is None:
+            self._snapshot_dir = pathlib.Path(self.snapshots_base_dir) / DIRECTORY_NAMES.snapshot_dir_name
+        return self._snapshot_dir
 
     @property
     def test_results_dir(self) -> pathlib.Path:
-        """Get the test results directory."""
-        return pathlib.Path(self.snapshots_base_dir) / DIRECTORY_NAMES.test_results_dir_name
+        """Get the test results directory, the subdirectory of the namespace if set."""
+        if self._test_results_dir is None:
+            test_results_dir = pathlib.Path(self.snapshots_base_dir) / DIRECTORY_NAMES.test_results_dir_name
+            if self.test_results_namespace is not None:
+                test_results_dir = test_results_dir / DIRECTORY_NAMES.worker_dir_name / self.test_results_namespace
+            self._test_results_dir = test_results_dir
+        return self._test_results_dir
+
+    @property
+    def filename_prefix(self) -> str:
+        """Snapshot filename without the extension."""
+        if self.custom_name is not None:
+            return f"[{self.test_filename}][{self.test_function}][{self.custom_name}]"
+        return f"[{self.test_filename}][{self.test_function}]"
 
     @property
     def filename(self) -> str:
         """Get the snapshot filename."""
-        if self.custom_name is not None:
-            return f"[{self.test_filename}][{self.test_function}][{self.custom_name}].{self.filename_extension}"
-        return f"[{self.test_filename}][{self.test_function}].{self.filename_extension}"
+        if self._filename is None:
+            self._filename = f"{self.filename_prefix}.{self.filename_extension}"
+        return self._filename
+
+    @property
+    def snapshot_path(self) -> pathlib.Path:
+        """Path of the snapshot file, cached until a field it is built from is set."""
+        if self._snapshot_path is None:
+            self._snapshot_path = self.snapshot_dir / self.filename
+        return self._snapshot_path
+
+    @property
+    def test_results_path(self) -> pathlib.Path:
+        """Path of the test results file, cached until a field it is built from is set."""
+        if self._test_results_path is None:
+            self._test_results_path = self.test_results_dir / self.filename
+        return self._test_results_path
@@ -4,18 +4,30 @@ Serialization classes for serializing and deserializing data.
 Be sure that data is serialized the same way no matter what os and OS configuration is used.
 """
 import json
+import math
 import jsonpickle
+import dataclasses
+import jsonpickle.util
+import jsonpickle.pickler
+import jsonpickle.handlers
 from abc import ABC, abstractmethod
-from io import StringIO
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from io import BytesIO, StringIO
+from snappylapy._path_mask import PathMask, _MaskNode
 from snappylapy.constants import OUTPUT_JSON_INDENTATION_LEVEL
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
+    import polars as pl
+    import pyarrow as pa
 
 T = TypeVar("T")
 
 ENCODING_TO_USE = "utf-8"
+CANONICAL_FLOAT_SIGNIFICANT_DIGITS = 15
+"""Floats are rounded in canonical json, so floating point noise like 0.30000000000000004 does not change snapshots."""
 
 
 class Serializer(ABC, Generic[T]):
@@ -30,6 +42,29 @@ class Serializer(ABC, Generic[T]):
         """Deserialize bytes to data."""
 
 
+def _canonical_sort_key(item: Any) -> str:  # noqa: ANN401
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+def _canonicalize(data: Any) -> Any:  # noqa: ANN401
+    """Normalize floats and sort sets, so equal data gives identical canonical json."""
+    if type(data) is float:
+        if not math.isfinite(data):
+            return data
+        # Adding 0.0 turns -0.0 into 0.0
+        return float(f"{data:.{CANONICAL_FLOAT_SIGNIFICANT_DIGITS}g}") + 0.0
+    if isinstance(data, (list, tuple)):
+        return [_canonicalize(item) for item in data]
+    if isinstance(data, (set, frozenset)):
+        return sorted((_canonicalize(item) for item in data), key=_canonical_sort_key)
+    if isinstance(data, dict):
+        canonical_data = {key: _canonicalize(value) for key, value in data.items()}
+        if isinstance(canonical_data.get("py/set"), list):
+            canonical_data["py/set"] = sorted(canonical_data["py/set"], key=_canonical_sort_key)
+        return canonical_data
+    return data
+
+
 class JsonSerializer(Serializer, Generic[T]):
     """Serialize and deserialize a dictionary."""
 
@@ -49,15 +84,296 @@ class JsonSerializer(Serializer, Generic[T]):
         return json.loads(data.decode(encoding=ENCODING_TO_USE))
 
 
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_PICKLE_PROTOCOL_METHODS = ("__getstate__", "__reduce__", "__reduce_ex__")
+
+
+@dataclasses.dataclass(frozen=True)
+class _ClassPlan:
+    """How instances of a class are converted to plain json, built once per class and reused for all instances."""
+
+    field_names: tuple[str, ...] = ()
+    """Fields written as a plain dictionary, for dataclasses, pydantic models, NamedTuples and attrs classes."""
+
+    py_object: str | None = None
+    """Class path written as `py/object` before the instance `__dict__`, the same way jsonpickle writes objects."""
+
+    reducer: Callable[[Any], Any] | None = None
+    """Registered function converting instances to json data."""
+
+
+_class_plans: dict[type, _ClassPlan | None] = {}
+"""Cache of plans by class, None for classes that must be written by jsonpickle. Handlers are not part of the plans."""
+
+_reducers: dict[type, Callable[[Any], Any]] = {}
+
+
+class _JsonPickleRequiredError(Exception):
+    """Raised when data can not be written as plain json in the same way as jsonpickle would."""
+
+
+class _ReducerHandler(jsonpickle.handlers.BaseHandler):
+    """Apply a registered reducer when data falls back to jsonpickle, so the output does not depend on the path."""
+
+    def flatten(self, obj: Any, data: dict[str, Any]) -> Any:  # noqa: ANN401, ARG002
+        """Flatten the reduced object instead of the object."""
+        return self.context.flatten(_reducers[type(obj)](obj), reset=False)
+
+
+def register_reducer(cls: type[T], reducer: Callable[[T], Any]) -> None:
+    """
+    Register a function converting instances of a class to json data, e.g. a dictionary, in snapshots.
+
+    The reduced data is written instead of the instance, and is what is loaded back from the snapshot.
+    """
+    _reducers[cls] = reducer
+    _class_plans.pop(cls, None)
+    jsonpickle.handlers.register(cls, _ReducerHandler)
+
+
+def _get_field_names(cls: type) -> list[str] | None:
+    """Get the names of the fields of dataclasses, pydantic models, NamedTuples and attrs classes."""
+    if dataclasses.is_dataclass(cls):
+        return [field.name for field in dataclasses.fields(cls)]
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        return list(cls._fields)
+    model_fields = getattr(cls, "model_fields", None)
+    if isinstance(model_fields, dict) and hasattr(cls, "model_dump"):
+        return list(model_fields)
+    attrs_attributes = getattr(cls, "__attrs_attrs__", None)
+    if attrs_attributes is not None:
+        return [attribute.name for attribute in attrs_attributes]
+    return None
+
+
+def _is_plain_object_class(cls: type) -> bool:
+    """Check if jsonpickle writes instances as `py/object` with the instance `__dict__` and nothing else."""
+    for base in cls.__mro__[:-1]:
+        if base.__module__ == "builtins" or "__slots__" in vars(base) or "__getnewargs__" in vars(base):
+            return False
+        if any(name in vars(base) for name in _PICKLE_PROTOCOL_METHODS):
+            return False
+    return True
+
+
+def _build_class_plan(cls: type) -> _ClassPlan | None:
+    """Build the plan for converting instances of a class, None if they must be written by jsonpickle."""
+    if cls in _reducers:
+        return _ClassPlan(reducer=_reducers[cls])
+    field_names = _get_field_names(cls)
+    if field_names is not None:
+        return _ClassPlan(field_names=tuple(field_names))
+    if _is_plain_object_class(cls):
+        return _ClassPlan(py_object=jsonpickle.util.importable_name(cls))
+    return None
+
+
+def _get_class_plan(cls: type) -> _ClassPlan | None:
+    """Get the cached plan for converting instances of a class, None if a jsonpickle handler is registered for it."""
+    # Looked up for every instance, since handlers can be registered with jsonpickle after the plan is cached
+    if jsonpickle.handlers.registry.get(cls) not in {None, _ReducerHandler}:
+        return None
+    if cls not in _class_plans:
+        _class_plans[cls] = _build_class_plan(cls)
+    return _class_plans[cls]
+
+
+def _to_plain_dict(
+    items: Iterable[tuple[Any, Any]],
+    seen_objects: dict[int, Any],
+    active_ids: set[int],
+) -> dict[str, Any]:
+    """Convert the values of dictionary items, the keys must be strings jsonpickle writes as they are."""
+    plain_dict: dict[str, Any] = {}
+    for key, value in items:
+        if type(key) is not str or key.startswith("py/"):
+            raise _JsonPickleRequiredError
+        plain_dict[key] = _to_plain_json(value, seen_objects, active_ids)
+    return plain_dict
+
+
+def _to_plain_json(data: Any, seen_objects: dict[int, Any], active_ids: set[int]) -> Any:  # noqa: ANN401
+    """
+    Convert data to plain json types, converting classes with a cached plan.
+
+    Raises _JsonPickleRequiredError for data jsonpickle writes differently than plain json, e.g. tuples, sets,
+    dictionaries with keys that are not strings, objects referenced more than once and classes without a plan.
+
+    The seen objects are kept by their id until the conversion is done. Otherwise the id of a temporary object, e.g.
+    the dictionary returned by a reducer, could be reused by a later one, which would be taken for a repeated reference.
+    """
+    data_type = type(data)
+    if data_type in _JSON_SCALAR_TYPES:
+        return data
+    if data_type is list or data_type is dict:
+        # jsonpickle writes repeated references to the same container as {"py/id": ...}
+        if id(data) in seen_objects:
+            raise _JsonPickleRequiredError
+        seen_objects[id(data)] = data
+        if data_type is list:
+            return [_to_plain_json(item, seen_objects, active_ids) for item in data]
+        return _to_plain_dict(data.items(), seen_objects, active_ids)
+    plan = _get_class_plan(data_type)
+    if plan is None or id(data) in active_ids:
+        raise _JsonPickleRequiredError
+    active_ids.add(id(data))
+    if plan.reducer is not None:
+        plain_data = _to_plain_json(plan.reducer(data), seen_objects, active_ids)
+    elif plan.py_object is not None:
+        # Repeated references to the same object are also written as {"py/id": ...} by jsonpickle
+        if id(data) in seen_objects:
+            raise _JsonPickleRequiredError
+        seen_objects[id(data)] = data
+        plain_data = {"py/object": plan.py_object, **_to_plain_dict(vars(data).items(), seen_objects, active_ids)}
+    else:
+        plain_data = _to_plain_dict(
+            ((name, getattr(data, name)) for name in plan.field_names),
+            seen_objects,
+            active_ids,
+        )
+    active_ids.discard(id(data))
+    return plain_data
+
+
+def _flatten_without_refs(data: Any, pickler: jsonpickle.pickler.Pickler) -> Any:  # noqa: ANN401
+    """Convert data to json data, writing objects referenced more than once in full instead of as references."""
+    try:
+        return _to_plain_json(data, {}, set())
+    except (_JsonPickleRequiredError, RecursionError):
+        return pickler.flatten(data)
+
+
+def _mask_items(
+    items: Iterable[tuple[Any, Any]],
+    mask: PathMask,
+    nodes: tuple[_MaskNode, ...],
+    pickler: jsonpickle.pickler.Pickler,
+    active_ids: set[int],
+) -> Iterator[tuple[Any, Any]]:
+    """
+    Convert the values of key value pairs, leaving out excluded values and replacing matched values.
+
+    Yields
+    ------
+    tuple
+        The key and the converted value of each pair that is not excluded.
+
+    """
+    for key, value in items:
+        child_nodes = mask.step(nodes, str(key))
+        if not child_nodes:
+            yield key, _flatten_without_refs(value, pickler)
+        elif not mask.is_excluded(child_nodes):
+            placeholder = mask.apply_matcher(child_nodes, value)
+            if placeholder is not None:
+                yield key, placeholder
+            else:
+                yield key, _to_masked_json(value, mask, child_nodes, pickler, active_ids)
+
+
+def _to_masked_json(
+    data: Any,  # noqa: ANN401
+    mask: PathMask,
+    nodes: tuple[_MaskNode, ...],
+    pickler: jsonpickle.pickler.Pickler,
+    active_ids: set[int],
+) -> Any:  # noqa: ANN401
+    """
+    Convert data to json data, excluding and matching the values reached by the paths of the mask in the same pass.
+
+    Only the parts of the data a path can reach are checked. Paths reach into dictionaries with string keys, lists,
+    tuples and classes with a cached plan, everything else is written by jsonpickle as it is.
+    """
+    data_type = type(data)
+    if data_type in _JSON_SCALAR_TYPES:
+        return data
+    if id(data) in active_ids:
+        # Cycles are written by jsonpickle, the same way as without a mask
+        return pickler.flatten(data)
+    active_ids.add(id(data))
+    masked_data: Any
+    if data_type is list or data_type is tuple:
+        masked_items = [value for _, value in _mask_items(enumerate(data), mask, nodes, pickler, active_ids)]
+        masked_data = masked_items if data_type is list else {"py/tuple": masked_items}
+    elif data_type is dict and all(type(key) is str and not key.startswith("py/") for key in data):
+        masked_data = dict(_mask_items(data.items(), mask, nodes, pickler, active_ids))
+    else:
+        plan = _get_class_plan(data_type)
+        if plan is None or data_type is dict:
+            masked_data = pickler.flatten(data)
+        elif plan.reducer is not None:
+            masked_data = _to_masked_json(plan.reducer(data), mask, nodes, pickler, active_ids)
+        elif plan.py_object is not None:
+            masked_data = {
+                "py/object": plan.py_object,
+                **dict(_mask_items(vars(data).items(), mask, nodes, pickler, active_ids)),
+            }
+        else:
+            fields = ((name, getattr(data, name)) for name in plan.field_names)
+            masked_data = dict(_mask_items(fields, mask, nodes, pickler, active_ids))
+    active_ids.discard(id(data))
+    return masked_data
+
+
 class JsonPickleSerializer(Serializer, Generic[T]):
-    """Serialize and deserialize a dictionary using pickle."""
+    """
+    Serialize and deserialize a dictionary using pickle.
+
+    Plain json data, dataclasses, pydantic models, NamedTuples, attrs classes, simple classes and classes with a
+    registered reducer are written with the json module directly, using a plan cached per class. Dataclasses,
+    pydantic models, NamedTuples and attrs classes are written as plain dictionaries of their fields, and simple
+    classes the same way as jsonpickle writes them. Everything else is written with jsonpickle.
+
+    With `canonical=True` keys are sorted, floats are normalized and sets are sorted, so equal data always gives
+    identical bytes no matter the insertion order. Objects referenced more than once are written in full each time
+    instead of as references, since references depend on the order of the keys.
+
+    With a `mask`, the values reached by its paths are excluded or replaced by a placeholder while converting the
+    data, without copying it first. Objects referenced more than once are also written in full with a mask.
+    """
+
+    def __init__(self, *, canonical: bool = False, mask: PathMask | None = None) -> None:
+        """Initialize the serializer, optionally writing canonical json and masking values."""
+        self.canonical = canonical
+        self.mask = mask
+
+    def _serialize_masked(self, data: T, mask: PathMask) -> str:
+        """Serialize to json, excluding and matching values with the mask."""
+        pickler = jsonpickle.pickler.Pickler(make_refs=False)
+        masked_data = _to_masked_json(data, mask, mask.root_nodes, pickler, set())
+        if self.canonical:
+            masked_data = _canonicalize(masked_data)
+        return json.dumps(masked_data, indent=OUTPUT_JSON_INDENTATION_LEVEL, sort_keys=self.canonical)
+
+    def _serialize_canonical(self, data: T) -> str:
+        """Serialize to canonical json."""
+        try:
+            flattened_data = _to_plain_json(data, {}, set())
+        except (_JsonPickleRequiredError, RecursionError):
+            flattened_data = jsonpickle.pickler.Pickler(make_refs=False).flatten(data)
+        return json.dumps(_canonicalize(flattened_data), indent=OUTPUT_JSON_INDENTATION_LEVEL, sort_keys=True)
+
+    def _serialize_like_jsonpickle(self, data: T) -> str:
+        """Serialize to the same json as jsonpickle, using the fast path when possible."""
+        try:
+            plain_data = _to_plain_json(data, {}, set())
+        except (_JsonPickleRequiredError, RecursionError):
+            return jsonpickle.encode(
+                data,
+                indent=OUTPUT_JSON_INDENTATION_LEVEL,
+            )
+        # Same output as jsonpickle gives for plain json data
+        return json.dumps(plain_data, indent=OUTPUT_JSON_INDENTATION_LEVEL)
 
     def serialize(self, data: T) -> bytes:
         """Serialize a dictionary/list or other to bytes in json format with cross-platform consistency."""
-        json_string: str = jsonpickle.encode(
-            data,
-            indent=OUTPUT_JSON_INDENTATION_LEVEL,
-        )
+        if self.mask is not None:
+            json_string = self._serialize_masked(data, self.mask)
+        elif self.canonical:
+            json_string = self._serialize_canonical(data)
+        else:
+            json_string = self._serialize_like_jsonpickle(data)
         json_string = json_string.replace("\r\n", "\n").replace("\r", "\n")  # Normalize all line endings to LF
         return json_string.encode(encoding=ENCODING_TO_USE)
 
@@ -66,6 +382,36 @@ class JsonPickleSerializer(Serializer, Generic[T]):
         return jsonpickle.decode(data.decode(encoding=ENCODING_TO_USE))  # noqa: S301, pickle security, data should be trusted here, keep your snapshot files safe
 
 
+class JsonLinesSerializer(Serializer[Iterable[Any]]):
+    """
+    Serialize and deserialize collections of records using the JSON Lines format.
+
+    Each record is written as one compact JSON document on its own line, so records can be written and read one at
+    a time without holding the whole collection in memory.
+    """
+
+    def serialize_record(self, record: Any) -> bytes:  # noqa: ANN401
+        """Serialize a single record to one line of JSON, including the line ending."""
+        json_string = json.dumps(record, default=str, ensure_ascii=False, separators=(",", ":"))
+        return (json_string + "\n").encode(encoding=ENCODING_TO_USE)
+
+    def iter_serialize(self, data: Iterable[Any]) -> Iterator[bytes]:
+        """Serialize the records one line at a time, consuming iterators and generators lazily."""
+        return (self.serialize_record(record) for record in data)
+
+    def serialize(self, data: Iterable[Any]) -> bytes:
+        """Serialize the records to bytes in the JSON Lines format."""
+        return b"".join(self.iter_serialize(data))
+
+    def iter_deserialize(self, lines: Iterable[bytes]) -> Iterator[Any]:
+        """Deserialize the records one line at a time, skipping empty lines."""
+        return (json.loads(line.decode(encoding=ENCODING_TO_USE)) for line in lines if line.strip())
+
+    def deserialize(self, data: bytes) -> list[Any]:
+        """Deserialize bytes in the JSON Lines format to a list of records."""
+        return list(self.iter_deserialize(data.splitlines()))
+
+
 class StringSerializer(Serializer[str]):
     """Serialize and deserialize a string."""
 
@@ -130,3 +476,172 @@ class PandasCsvSerializer(Serializer["pd.DataFrame"]):
         csv_buffer = StringIO(csv_string)
         dataframe = pd.read_csv(csv_buffer, index_col=0)
         return dataframe
+
+
+class PandasSeriesCsvSerializer(Serializer["pd.Series"]):
+    """
+    Serialize and deserialize pandas Series using CSV format.
+
+    The first line is a comment with the dtype and name of the series, and the level names of a MultiIndex, so they
+    are kept when deserializing.
+    """
+
+    metadata_prefix = "# "
+
+    def serialize(self, data: "pd.Series") -> bytes:
+        """Serialize a pandas Series to bytes using CSV format, with the dtype and name in the first line."""
+        try:
+            # Lazy import to avoid dependency issues if pandas is not installed
+            import pandas as pd  # noqa: PLC0415
+        except ImportError as e:
+            msg = "pandas is required for Series serialization"
+            raise ImportError(msg) from e
+
+        if not isinstance(data, pd.Series):
+            msg = f"Expected pandas Series, got {type(data)}"
+            raise TypeError(msg)
+
+        metadata_values: dict[str, Any] = {"dtype": str(data.dtype), "name": data.name}
+        if data.index.nlevels > 1:
+            metadata_values["index_names"] = list(data.index.names)
+        metadata = json.dumps(metadata_values, default=str)
+        csv_buffer = StringIO()
+        csv_buffer.write(self.metadata_prefix + metadata + "\n")
+        # A tuple name would be written as a header row per item, the name is kept in the metadata instead
+        header = [str(data.name)] if isinstance(data.name, tuple) else True
+        data.to_csv(csv_buffer, index=True, header=header, lineterminator="\n")
+        csv_string = csv_buffer.getvalue()
+
+        # Ensure consistent line endings
+        csv_string = csv_string.replace("\r\n", "\n").replace("\r", "\n")
+        return csv_string.encode(encoding=ENCODING_TO_USE)
+
+    def deserialize(self, data: bytes) -> "pd.Series":
+        """Deserialize bytes to a pandas Series, restoring the dtype and name."""
+        try:
+            # Lazy import to avoid dependency issues if pandas is not installed
+            import pandas as pd  # noqa: PLC0415
+        except ImportError as e:
+            msg = "pandas is required for Series deserialization"
+            raise ImportError(msg) from e
+
+        metadata_line, csv_string = data.decode(encoding=ENCODING_TO_USE).split("\n", maxsplit=1)
+        metadata = json.loads(metadata_line.removeprefix(self.metadata_prefix))
+        # The names of the levels of a MultiIndex are kept, since the header can not tell them from missing names
+        index_names = metadata.get("index_names")
+        index_levels = len(index_names) if index_names is not None else 1
+        dtype = pd.api.types.pandas_dtype(metadata["dtype"])
+        read_dtype: dict[Hashable, Any] | None = None
+        if pd.api.types.is_string_dtype(dtype):
+            # Read strings as they are, otherwise strings looking like numbers are read back as numbers
+            values_column = pd.read_csv(StringIO(csv_string), nrows=0).columns[-1]
+            read_dtype = {values_column: object}
+        series = pd.read_csv(StringIO(csv_string), index_col=list(range(index_levels)), dtype=read_dtype).iloc[:, 0]
+        if index_names is not None:
+            series.index.names = index_names
+        # Json has no tuples, so a tuple name is read back as a list, which can not be the name of a series
+        name = metadata["name"]
+        series.name = tuple(name) if isinstance(name, list) else name
+        return series.astype(dtype)
+
+
+class NumpyNpySerializer(Serializer["np.ndarray"]):
+    """
+    Serialize and deserialize numpy arrays using the binary .npy format.
+
+    Arrays of the object dtype are stored with their elements pickled, which is the only way .npy files can hold them.
+    """
+
+    def serialize(self, data: "np.ndarray") -> bytes:
+        """Serialize a numpy array to bytes using the .npy format."""
+        try:
+            # Lazy import to avoid dependency issues if numpy is not installed
+            import numpy as np  # noqa: PLC0415
+        except ImportError as e:
+            msg = "numpy is required for ndarray serialization"
+            raise ImportError(msg) from e
+
+        if not isinstance(data, np.ndarray):
+            msg = f"Expected numpy ndarray, got {type(data)}"
+            raise TypeError(msg)
+
+        npy_buffer = BytesIO()
+        np.save(npy_buffer, data, allow_pickle=data.dtype.hasobject)
+        return npy_buffer.getvalue()
+
+    def deserialize(self, data: bytes) -> "np.ndarray":
+        """Deserialize bytes in the .npy format to a numpy array."""
+        try:
+            # Lazy import to avoid dependency issues if numpy is not installed
+            import numpy as np  # noqa: PLC0415
+        except ImportError as e:
+            msg = "numpy is required for ndarray deserialization"
+            raise ImportError(msg) from e
+
+        # Pickled elements are only loaded for arrays of the object dtype, like jsonpickle does for objects in json
+        return np.load(BytesIO(data), allow_pickle=True)
+
+
+class ArrowIpcSerializer(Serializer["pa.Table"]):
+    """Serialize and deserialize pyarrow Tables using the Arrow IPC file format."""
+
+    def serialize(self, data: "pa.Table") -> bytes:
+        """Serialize a pyarrow Table to bytes using the Arrow IPC file format."""
+        try:
+            # Lazy import to avoid dependency issues if pyarrow is not installed
+            import pyarrow as pa  # noqa: PLC0415
+        except ImportError as e:
+            msg = "pyarrow is required for Table serialization"
+            raise ImportError(msg) from e
+
+        if not isinstance(data, pa.Table):
+            msg = f"Expected pyarrow Table, got {type(data)}"
+            raise TypeError(msg)
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, data.schema) as writer:
+            writer.write_table(data)
+        return sink.getvalue().to_pybytes()
+
+    def deserialize(self, data: bytes) -> "pa.Table":
+        """Deserialize bytes in the Arrow IPC file format to a pyarrow Table, without copying the column buffers."""
+        try:
+            # Lazy import to avoid dependency issues if pyarrow is not installed
+            import pyarrow as pa  # noqa: PLC0415
+        except ImportError as e:
+            msg = "pyarrow is required for Table deserialization"
+            raise ImportError(msg) from e
+
+        return pa.ipc.open_file(pa.BufferReader(pa.py_buffer(data))).read_all()
+
+
+class PolarsIpcSerializer(Serializer["pl.DataFrame"]):
+    """Serialize and deserialize polars DataFrames using the Arrow IPC file format."""
+
+    def serialize(self, data: "pl.DataFrame") -> bytes:
+        """Serialize a polars DataFrame to bytes using the Arrow IPC file format."""
+        try:
+            # Lazy import to avoid dependency issues if polars is not installed
+            import polars as pl  # noqa: PLC0415
+        except ImportError as e:
+            msg = "polars is required for DataFrame serialization"
+            raise ImportError(msg) from e
+
+        if not isinstance(data, pl.DataFrame):
+            msg = f"Expected polars DataFrame, got {type(data)}"
+            raise TypeError(msg)
+
+        ipc_buffer = BytesIO()
+        data.write_ipc(ipc_buffer)
+        return ipc_buffer.getvalue()
+
+    def deserialize(self, data: bytes) -> "pl.DataFrame":
+        """Deserialize bytes in the Arrow IPC file format to a polars DataFrame."""
+        try:
+            # Lazy import to avoid dependency issues if polars is not installed
+            import polars as pl  # noqa: PLC0415
+        except ImportError as e:
+            msg = "polars is required for DataFrame deserialization"
+            raise ImportError(msg) from e
+
+        return pl.read_ipc(BytesIO(data))
@@ -2,19 +2,24 @@
 import pathlib
 from _pytest.terminal import TerminalReporter
 from dataclasses import dataclass
-from snappylapy.constants import DIRECTORY_NAMES
+from snappylapy._atomic_write import is_temporary_file
+from snappylapy._sharding import Shard
+from snappylapy.constants import DIRECTORY_NAMES, FINGERPRINT_FILE_SUFFIX
 
 
 @dataclass
 class SnapshotSession:
     """Session for snapshot testing."""
 
-    def __init__(self) -> None:
-        """Initialize the snapshot session."""
+    def __init__(self, shard: Shard | None = None) -> None:
+        """Initialize the snapshot session, for all tests or only the case folders of a shard."""
         self.snapshots_created: list[str] = []
         self.snapshots_updated: list[str] = []
         self.snapshot_tests_succeeded: list[str] = []
         self.snapshot_tests_failed: list[str] = []
+        self.snapshots_reused: list[str] = []
+        self.shard = shard
+        self.case_directories_in_other_shards: set[pathlib.Path] = set()
 
     def _get_all_snapshots(self) -> set[str]:
         """Loop through all SNAPSHOT_DIR_NAME directories and return names of all snapshots."""
@@ -23,8 +28,13 @@ class SnapshotSession:
         snapshot_dirs = list(pathlib.Path().rglob(
             DIRECTORY_NAMES.snapshot_dir_name))
         for snapshot_dir in snapshot_dirs:
+            # Snapshots of case folders run by other shards are not visited in this session
+            if snapshot_dir.parent.resolve() in self.case_directories_in_other_shards:
+                continue
             snapshot_file_names.update(
-                snapshot_file.name for snapshot_file in snapshot_dir.iterdir())
+                snapshot_file.name for snapshot_file in snapshot_dir.iterdir()
+                if snapshot_file.is_file() and not snapshot_file.name.endswith(FINGERPRINT_FILE_SUFFIX)
+                and not is_temporary_file(snapshot_file))
         return snapshot_file_names
 
     def _get_unvisited_snapshots(self) -> set[str]:
@@ -32,7 +42,7 @@ class SnapshotSession:
         all_snapshots = self._get_all_snapshots()
         unvisited_snapshots = all_snapshots - set(
             self.snapshots_created + self.snapshots_updated +
-            self.snapshot_tests_succeeded + self.snapshot_tests_failed)
+            self.snapshot_tests_succeeded + self.snapshot_tests_failed + self.snapshots_reused)
         return unvisited_snapshots
 
     def on_finish(self) -> None:
@@ -44,11 +54,26 @@ class SnapshotSession:
             self.snapshots_created or self.snapshots_updated
             or self.snapshot_tests_succeeded)
 
+    def _write_skipped_summary(self, reporter: TerminalReporter) -> None:
+        """Write which tests were not run, if the case folders were split in shards or upstream tests were skipped."""
+        if self.shard is not None:
+            reporter.write(
+                f"Ran shard {self.shard}, skipping {len(self.case_directories_in_other_shards)} case folders "
+                "run by other shards\n",
+                blue=True,
+            )
+        if self.snapshots_reused:
+            reporter.write(
+                f"Reused {len(self.snapshots_reused)} snapshots of unchanged upstream tests\n",
+                green=True,
+            )
+
     def write_summary(self, reporter: TerminalReporter) -> None:
         """Write the snapshot tests summary."""
         if not self.has_ran_snapshot_tests():
             return
         reporter.write_sep("=", "Snapshot tests summary", blue=True)
+        self._write_skipped_summary(reporter)
         if self.snapshot_tests_succeeded:
             reporter.write(
                 f"Got {len(self.snapshot_tests_succeeded)} snapshot tests passing\n",
@@ -73,9 +98,17 @@ class SnapshotSession:
             reporter.write(
                 f"Found {len(unvisited_snapshots)} unvisited snapshots:\n",
                 red=True)
-            for snapshot in unvisited_snapshots:
+            for snapshot in sorted(unvisited_snapshots):
                 reporter.write(f"  {snapshot}\n", blue=True)
 
+    def add_case_directories_in_other_shards(self, case_directories: list[pathlib.Path]) -> None:
+        """Add case folders not run by the shard of this session."""
+        self.case_directories_in_other_shards.update(case.resolve() for case in case_directories)
+
+    def add_reused_snapshot(self, item: str) -> None:
+        """Add a snapshot of a skipped upstream test, reused by the tests depending on it."""
+        self.snapshots_reused.append(item)
+
     def add_created_snapshot(self, item: str) -> None:
         """Add a created snapshot."""
         self.snapshots_created.append(item)
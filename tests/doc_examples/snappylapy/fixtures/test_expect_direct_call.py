@@ -28,6 +28,23 @@ def test_expect_direct_call(expect: Expect) -> None:
         df: pd.DataFrame = pd.DataFrame({"x": [1, 2]})
         expect(df).to_match_snapshot()
 
+        # Series input (requires pandas)
+        series: pd.Series = pd.Series([1.5, 2.5], name="y")
+        expect(series).to_match_snapshot()
+
+    # NumPy array input (requires numpy)
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        array: np.ndarray = np.array([[1.0, 2.0], [3.0, 4.0]])
+        expect(array).to_match_snapshot()
+
+    # Iterator or generator input, streamed as JSON Lines records
+    rows = ({"row": index} for index in range(3))
+    expect(rows).to_match_snapshot()
+
     # Custom object input (falls back to ObjectExpect)
     class Custom:
         def __init__(self) -> None:
@@ -0,0 +1,16 @@
+import pytest
+from snappylapy.fixtures import Expect
+
+try:
+    import pyarrow as pa
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow is not installed")
+def test_expect_arrow_table(expect: Expect) -> None:
+    """Test that a pyarrow table matches the snapshot."""
+    table: pa.Table = pa.table({"key": ["value1", "value2"], "number": [1, 2]})
+    expect.arrow_table(table).to_match_snapshot()
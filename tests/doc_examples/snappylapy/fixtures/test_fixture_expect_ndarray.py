@@ -0,0 +1,16 @@
+import pytest
+from snappylapy.fixtures import Expect
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy is not installed")
+def test_expect_ndarray(expect: Expect) -> None:
+    """Test that a numpy array matches the snapshot within the tolerances."""
+    array: np.ndarray = np.linspace(0.0, 1.0, 5)
+    expect.ndarray(array).to_match_snapshot(rtol=1e-9, atol=1e-12)
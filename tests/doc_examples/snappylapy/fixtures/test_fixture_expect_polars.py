@@ -0,0 +1,16 @@
+import pytest
+from snappylapy.fixtures import Expect
+
+try:
+    import polars as pl
+
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+
+@pytest.mark.skipif(not HAS_POLARS, reason="polars is not installed")
+def test_expect_polars(expect: Expect) -> None:
+    """Test that a polars dataframe matches the snapshot."""
+    df: pl.DataFrame = pl.DataFrame({"key": ["value1", "value2"], "number": [1, 2]})
+    expect.polars(df).to_match_snapshot()
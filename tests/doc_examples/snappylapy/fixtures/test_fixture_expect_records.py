@@ -0,0 +1,13 @@
+import pytest
+from collections.abc import Iterator
+from snappylapy.fixtures import Expect
+
+
+def generate_rows() -> Iterator[dict[str, int]]:
+    for number in range(3):
+        yield {"number": number, "square": number**2}
+
+
+def test_expect_records(expect: Expect) -> None:
+    """Test that records from a generator match the snapshot."""
+    expect.records(generate_rows()).to_match_snapshot()
@@ -0,0 +1,16 @@
+import pytest
+from snappylapy.fixtures import Expect
+
+try:
+    import pandas as pd
+
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+
+@pytest.mark.skipif(not HAS_PANDAS, reason="pandas is not installed")
+def test_expect_series(expect: Expect) -> None:
+    """Test that a series matches the snapshot."""
+    series: pd.Series = pd.Series([1, 2, 3], name="numbers", dtype="int32")
+    expect.series(series).to_match_snapshot()
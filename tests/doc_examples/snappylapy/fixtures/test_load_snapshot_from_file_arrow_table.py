@@ -0,0 +1,21 @@
+import pytest
+from snappylapy.fixtures import Expect, LoadSnapshot
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow is not installed")
+def test_save_arrow_table_snapshot(expect: Expect) -> None:
+    """Test saving a pyarrow table snapshot."""
+    table: pa.Table = pa.table({"numbers": [1, 2, 3]})
+    expect(table).to_match_snapshot()
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow is not installed")
+@pytest.mark.snappylapy(depends=[test_save_arrow_table_snapshot])
+def test_load_snapshot_arrow_table(load_snapshot: LoadSnapshot) -> None:
+    """Test loading a pyarrow table snapshot."""
+    table: pa.Table = load_snapshot.arrow_table()
+    assert table.column("numbers").to_pylist() == [1, 2, 3]
@@ -0,0 +1,22 @@
+import pytest
+from snappylapy.fixtures import Expect, LoadSnapshot
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy is not installed")
+def test_save_ndarray_snapshot(expect: Expect) -> None:
+    """Test saving a numpy array snapshot."""
+    array: np.ndarray = np.arange(6).reshape(2, 3)
+    expect(array).to_match_snapshot()
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy is not installed")
+@pytest.mark.snappylapy(depends=[test_save_ndarray_snapshot])
+def test_load_snapshot_ndarray(load_snapshot: LoadSnapshot) -> None:
+    """Test loading a numpy array snapshot."""
+    array: np.ndarray = load_snapshot.ndarray()
+    assert array.shape == (2, 3)
+    assert array.sum() == 15
@@ -0,0 +1,21 @@
+import pytest
+from snappylapy.fixtures import Expect, LoadSnapshot
+
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+@pytest.mark.skipif(not HAS_POLARS, reason="polars is not installed")
+def test_save_polars_snapshot(expect: Expect) -> None:
+    """Test saving a polars dataframe snapshot."""
+    df: pl.DataFrame = pl.DataFrame({"numbers": [1, 2, 3]})
+    expect(df).to_match_snapshot()
+
+@pytest.mark.skipif(not HAS_POLARS, reason="polars is not installed")
+@pytest.mark.snappylapy(depends=[test_save_polars_snapshot])
+def test_load_snapshot_polars(load_snapshot: LoadSnapshot) -> None:
+    """Test loading a polars dataframe snapshot."""
+    df: pl.DataFrame = load_snapshot.polars()
+    assert df["numbers"].sum() == 6
@@ -0,0 +1,15 @@
+import pytest
+from snappylapy.fixtures import Expect, LoadSnapshot
+
+
+def test_save_records_snapshot(expect: Expect) -> None:
+    """Test saving a records snapshot."""
+    rows = ({"id": index, "name": f"row {index}"} for index in range(3))
+    expect.records(rows).to_match_snapshot()
+
+
+@pytest.mark.snappylapy(depends=[test_save_records_snapshot])
+def test_load_snapshot_records(load_snapshot: LoadSnapshot) -> None:
+    """Test loading a records snapshot lazily."""
+    ids = [row["id"] for row in load_snapshot.records()]
+    assert ids == [0, 1, 2]
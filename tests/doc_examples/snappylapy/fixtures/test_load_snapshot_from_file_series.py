@@ -0,0 +1,23 @@
+import pytest
+from snappylapy.fixtures import Expect, LoadSnapshot
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+@pytest.mark.skipif(not HAS_PANDAS, reason="pandas is not installed")
+def test_save_series_snapshot(expect: Expect) -> None:
+    """Test saving a series snapshot."""
+    series: pd.Series = pd.Series([1, 2, 3], name="numbers", dtype="int32")
+    expect(series).to_match_snapshot()
+
+@pytest.mark.skipif(not HAS_PANDAS, reason="pandas is not installed")
+@pytest.mark.snappylapy(depends=[test_save_series_snapshot])
+def test_load_snapshot_series(load_snapshot: LoadSnapshot) -> None:
+    """Test loading a series snapshot."""
+    series: pd.Series = load_snapshot.series()
+    assert series.name == "numbers"
+    assert series.dtype == "int32"
+    assert series.sum() == 6
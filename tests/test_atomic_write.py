@@ -0,0 +1,99 @@
+"""Test cases for atomic writes with an fsync policy."""
+import os
+import pathlib
+import pytest
+from unittest import mock
+from snappylapy import _atomic_write as module_on_test
+
+
+@pytest.fixture(autouse=True)
+def reset_fsync_policy():
+    """Make sure every test starts with the default policy and no pending writes."""
+    yield
+    module_on_test.set_fsync_policy("none")
+    module_on_test.sync_pending_writes()
+
+
+def test_write_bytes_atomic_replaces_file(tmp_path: pathlib.Path):
+    """Test that the file is replaced and no temporary file is left."""
+    path = tmp_path / "snapshot.txt"
+    path.write_bytes(b"old")
+    module_on_test.write_bytes_atomic(path, b"new")
+    assert path.read_bytes() == b"new"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="File modes are only applied on POSIX systems")
+def test_write_bytes_atomic_uses_default_permissions(tmp_path: pathlib.Path):
+    """Test that the written file gets the same permissions as a file written directly."""
+    module_on_test.write_bytes_atomic(tmp_path / "atomic.txt", b"data")
+    (tmp_path / "direct.txt").write_bytes(b"data")
+    assert (tmp_path / "atomic.txt").stat().st_mode == (tmp_path / "direct.txt").stat().st_mode
+
+
+def test_open_atomic_keeps_file_on_error(tmp_path: pathlib.Path):
+    """Test that an error while writing keeps the previous file and removes the temporary file."""
+    path = tmp_path / "snapshot.txt"
+    path.write_bytes(b"old")
+    with pytest.raises(RuntimeError), module_on_test.open_atomic(path) as file:
+        file.write(b"partial")
+        raise RuntimeError
+    assert path.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_copy_file_atomic(tmp_path: pathlib.Path):
+    """Test that the content of the file is copied."""
+    (tmp_path / "source.txt").write_bytes(b"data")
+    module_on_test.copy_file_atomic(tmp_path / "source.txt", tmp_path / "destination.txt")
+    assert (tmp_path / "destination.txt").read_bytes() == b"data"
+
+
+@pytest.mark.parametrize(
+    ("policy", "fsyncs_on_write", "fsyncs_at_session_end"),
+    [("none", 0, 0), ("file", 2, 0), ("session", 0, 1)],
+)
+def test_fsync_policy(
+    tmp_path: pathlib.Path,
+    policy: module_on_test.FsyncPolicy,
+    fsyncs_on_write: int,
+    fsyncs_at_session_end: int,
+):
+    """Test that files are fsynced when written, or at the end of the session skipping files deleted since."""
+    module_on_test.set_fsync_policy(policy)
+    with mock.patch.object(module_on_test, "_fsync_file") as fsync_file_mock:
+        module_on_test.write_bytes_atomic(tmp_path / "snapshot.txt", b"data")
+        module_on_test.write_bytes_atomic(tmp_path / "deleted.txt", b"data")
+        (tmp_path / "deleted.txt").unlink()
+        assert fsync_file_mock.call_count == fsyncs_on_write
+        fsync_file_mock.reset_mock()
+        module_on_test.sync_pending_writes()
+        assert fsync_file_mock.call_count == fsyncs_at_session_end
+
+
+@pytest.mark.parametrize(("policy", "directory_fsyncs"), [("none", 0), ("file", 1), ("session", 1)])
+def test_replace_file_syncs_destination_directory(tmp_path: pathlib.Path, policy, directory_fsyncs: int):
+    """Test that the directory a file is moved to is fsynced, when moved or at the end of the session."""
+    (tmp_path / "namespace").mkdir()
+    (tmp_path / "namespace" / "result.txt").write_bytes(b"data")
+    module_on_test.set_fsync_policy(policy)
+    with mock.patch.object(module_on_test, "_fsync_directory") as fsync_directory_mock:
+        module_on_test.replace_file(tmp_path / "namespace" / "result.txt", tmp_path / "result.txt")
+        module_on_test.sync_pending_writes()
+    assert (tmp_path / "result.txt").read_bytes() == b"data"
+    assert [call.args[0] for call in fsync_directory_mock.call_args_list] == [tmp_path] * directory_fsyncs
+
+
+def test_is_temporary_file(tmp_path: pathlib.Path):
+    """Test that the temporary files of atomic writes are recognized, and other files are not."""
+    with module_on_test.open_atomic(tmp_path / "snapshot.txt") as file:
+        assert [module_on_test.is_temporary_file(path) for path in tmp_path.iterdir()] == [True]
+        file.write(b"data")
+    assert not module_on_test.is_temporary_file(tmp_path / "snapshot.txt")
+    assert not module_on_test.is_temporary_file(tmp_path / "[test_code][test_function].tmp")
+
+
+def test_set_fsync_policy_invalid():
+    """Test that an unknown policy is rejected."""
+    with pytest.raises(ValueError, match="Invalid fsync policy"):
+        module_on_test.set_fsync_policy("always")  # type: ignore[arg-type]
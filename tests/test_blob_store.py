@@ -0,0 +1,81 @@
+"""Test cases for the content-addressed blob store."""
+import pathlib
+import pytest
+from snappylapy import _blob_store as module_on_test
+from snappylapy.constants import DIRECTORY_NAMES
+from unittest import mock
+
+
+def test_write_deduplicated_snapshot_stores_payload_once(tmp_path: pathlib.Path):
+    """Test that identical payloads share a single blob."""
+    data = b'{\n  "key": "value"\n}'
+    module_on_test.write_deduplicated_snapshot(tmp_path / "[test][case1].dict.json", data)
+    module_on_test.write_deduplicated_snapshot(tmp_path / "[test][case2].dict.json", data)
+    blobs = list((tmp_path / DIRECTORY_NAMES.blob_dir_name).iterdir())
+    assert [blob.name for blob in blobs] == [module_on_test.calculate_digest(data)]
+    assert module_on_test.read_snapshot_bytes(tmp_path / "[test][case1].dict.json") == data
+    assert module_on_test.read_snapshot_bytes(tmp_path / "[test][case2].dict.json") == data
+
+
+def test_get_snapshot_digest(tmp_path: pathlib.Path):
+    """Test that regular and deduplicated snapshots with the same payload have the same digest."""
+    data = b"Hello World"
+    (tmp_path / "regular.txt").write_bytes(data)
+    module_on_test.write_deduplicated_snapshot(tmp_path / "deduplicated.txt", data)
+    assert module_on_test.read_pointer_digest(tmp_path / "regular.txt") is None
+    assert module_on_test.get_snapshot_digest(tmp_path / "regular.txt") == module_on_test.get_snapshot_digest(
+        tmp_path / "deduplicated.txt",
+    )
+
+
+def test_remove_unreferenced_blobs(tmp_path: pathlib.Path):
+    """Test that blobs not pointed to by any snapshot are deleted."""
+    snapshot_path = tmp_path / "[test][func].string.txt"
+    module_on_test.write_deduplicated_snapshot(snapshot_path, b"old")
+    module_on_test.write_deduplicated_snapshot(snapshot_path, b"new")
+    removed = module_on_test.remove_unreferenced_blobs([tmp_path])
+    assert [blob.name for blob in removed] == [module_on_test.calculate_digest(b"old")]
+    assert module_on_test.read_snapshot_bytes(snapshot_path) == b"new"
+
+
+@pytest.fixture
+def blob_store_root(tmp_path: pathlib.Path):
+    """Put the shared blob store in the temporary directory, and reset it after the test."""
+    module_on_test.set_blob_store_root(tmp_path)
+    yield tmp_path
+    module_on_test._blob_store_root = None
+
+
+def test_blob_store_is_shared_by_snapshot_directories(blob_store_root: pathlib.Path):
+    """Test that identical payloads in different snapshot directories share a blob in the root of the store."""
+    data = b"Hello World"
+    for case in ("case1", "case2"):
+        (blob_store_root / case / "__snapshots__").mkdir(parents=True)
+        module_on_test.write_deduplicated_snapshot(blob_store_root / case / "__snapshots__" / "[test].txt", data)
+    assert [blob.name for blob in (blob_store_root / DIRECTORY_NAMES.blob_dir_name).iterdir()] == [
+        module_on_test.calculate_digest(data),
+    ]
+    assert module_on_test.read_snapshot_bytes(blob_store_root / "case2" / "__snapshots__" / "[test].txt") == data
+    snapshot_dirs = [blob_store_root / "case1" / "__snapshots__", blob_store_root / "case2" / "__snapshots__"]
+    (snapshot_dirs[0] / "[test].txt").unlink()
+    assert module_on_test.remove_unreferenced_blobs(snapshot_dirs) == []
+    (snapshot_dirs[1] / "[test].txt").unlink()
+    assert len(module_on_test.remove_unreferenced_blobs(snapshot_dirs)) == 1
+
+
+def test_blobs_next_to_snapshots_are_found(blob_store_root: pathlib.Path):
+    """Test that pointers are resolved against blobs stored in the snapshot directory by earlier versions."""
+    snapshot_dir = blob_store_root / "case1" / "__snapshots__"
+    (snapshot_dir / DIRECTORY_NAMES.blob_dir_name).mkdir(parents=True)
+    digest = module_on_test.calculate_digest(b"data")
+    (snapshot_dir / DIRECTORY_NAMES.blob_dir_name / digest).write_bytes(b"data")
+    (snapshot_dir / "[test].txt").write_bytes(module_on_test.BLOB_POINTER_PREFIX + digest.encode() + b"\n")
+    assert module_on_test.read_snapshot_bytes(snapshot_dir / "[test].txt") == b"data"
+
+
+def test_read_pointer_digest_does_not_open_regular_snapshots(tmp_path: pathlib.Path):
+    """Test that snapshots which can not be pointers by their size are not opened."""
+    (tmp_path / "regular.txt").write_bytes(b"Hello World")
+    with mock.patch.object(pathlib.Path, "open") as open_mock:
+        assert module_on_test.read_pointer_digest(tmp_path / "regular.txt") is None
+    open_mock.assert_not_called()
@@ -0,0 +1,23 @@
+"""Test the snappylapy command line interface."""
+import pathlib
+import pytest
+from typer.testing import CliRunner
+from snappylapy._cli import app
+from snappylapy.constants import DIRECTORY_NAMES
+
+
+def test_clear_removes_leftover_worker_directories(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that clear also removes the test results of pytest-xdist workers left by an interrupted session."""
+    monkeypatch.chdir(tmp_path)
+    test_results_dir = tmp_path / DIRECTORY_NAMES.test_results_dir_name
+    worker_dir = test_results_dir / DIRECTORY_NAMES.worker_dir_name / "gw0"
+    worker_dir.mkdir(parents=True)
+    (worker_dir / "[test_file][test_function].txt").write_text("worker result")
+    (test_results_dir / "[test_file][test_function].txt").write_text("result")
+    (tmp_path / DIRECTORY_NAMES.snapshot_dir_name).mkdir()
+    (tmp_path / DIRECTORY_NAMES.snapshot_dir_name / "[test_file][test_function].txt").write_text("snapshot")
+    result = CliRunner().invoke(app, ["clear", "--force"])
+    assert result.exit_code == 0, result.output
+    assert "Deleted 2 files." in result.output
+    assert not test_results_dir.exists()
+    assert not (tmp_path / DIRECTORY_NAMES.snapshot_dir_name).exists()
@@ -0,0 +1,73 @@
+"""Test cases for compression module."""
+import io
+import pathlib
+import pytest
+import sys
+from unittest import mock
+from snappylapy.compression import (
+    GzipCodec,
+    ZstdCodec,
+    compress_for_path,
+    decompress_for_path,
+    get_codec,
+    strip_codec_extension,
+)
+
+try:
+    import zstandard  # noqa: F401
+    zstandard_installed = True
+except ImportError:
+    zstandard_installed = False
+
+
+def test_get_codec_from_extension():
+    """Test that the codec is chosen by the last file extension."""
+    assert isinstance(get_codec(pathlib.Path("[test][func].dict.json.gz")), GzipCodec)
+    assert isinstance(get_codec(pathlib.Path("[test][func].dict.json.zst")), ZstdCodec)
+    assert get_codec(pathlib.Path("[test][func].dict.json")) is None
+
+
+def test_strip_codec_extension():
+    """Test that only the compression extension is removed."""
+    assert strip_codec_extension(pathlib.Path("a/[t][f].dict.json.gz")) == pathlib.Path("a/[t][f].dict.json")
+    assert strip_codec_extension(pathlib.Path("a/[t][f].dict.json")) == pathlib.Path("a/[t][f].dict.json")
+
+
+def test_gzip_is_deterministic():
+    """Test that compressing the same content twice gives identical bytes."""
+    codec = GzipCodec()
+    assert codec.compress(b"hello" * 100) == codec.compress(b"hello" * 100)
+
+
+@pytest.mark.parametrize("filename", [
+    "file.txt",
+    "file.txt.gz",
+    pytest.param("file.txt.zst", marks=pytest.mark.skipif(not zstandard_installed, reason="zstandard not installed")),
+])
+def test_compression_round_trip(filename: str):
+    """Test round-trip compression and decompression."""
+    path = pathlib.Path(filename)
+    data = b'{\n  "key": "value"\n}' * 100
+    compressed = compress_for_path(path, data)
+    if get_codec(path) is not None:
+        assert len(compressed) < len(data)
+    assert decompress_for_path(path, compressed) == data
+
+
+@pytest.mark.parametrize("codec", [
+    GzipCodec(),
+    pytest.param(ZstdCodec(), marks=pytest.mark.skipif(not zstandard_installed, reason="zstandard not installed")),
+])
+def test_open_compressed_round_trip(codec: GzipCodec | ZstdCodec):
+    """Test that content compressed as a stream can be decompressed."""
+    file = io.BytesIO()
+    with codec.open_compressed(file) as compressed_file:
+        for _ in range(100):
+            compressed_file.write(b'{"key": "value"}\n')
+    assert codec.decompress(file.getvalue()) == b'{"key": "value"}\n' * 100
+
+
+def test_zstd_without_zstandard_installed():
+    """Test that a missing zstandard raises an error telling how to install it."""
+    with mock.patch.dict(sys.modules, {"zstandard": None}), pytest.raises(ImportError, match=r"snappylapy\[zstd\]"):
+        ZstdCodec().compress(b"data")
@@ -0,0 +1,69 @@
+"""Testing of the polars and pyarrow expectation classes."""
+import pytest
+import snappylapy.expectation_classes.expect_arrow as expect_arrow
+import snappylapy.expectation_classes.expect_polars as expect_polars
+from snappylapy.models import Settings
+from snappylapy.serialization import ArrowIpcSerializer, PolarsIpcSerializer
+from unittest import mock
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _settings() -> Settings:
+    return Settings(test_filename="test_file", test_function="test_function")
+
+
+@pytest.mark.skipif(pl is None, reason="polars is not installed")
+def test_polars_serializer_round_trip():
+    """Test round-trip serialization keeps values and schema."""
+    serializer = PolarsIpcSerializer()
+    data = pl.DataFrame({"a": [1, 2], "b": ["x", None]}, schema={"a": pl.Int16, "b": pl.String})
+    assert serializer.deserialize(serializer.serialize(data)).equals(data)
+    assert serializer.serialize(data) == serializer.serialize(data.clone())
+
+
+@pytest.mark.skipif(pl is None, reason="polars is not installed")
+def test_polars_compare_reports_differing_columns():
+    """Test that the differing columns are reported."""
+    expect = expect_polars.PolarsExpect(_settings(), mock.MagicMock())
+    serializer = PolarsIpcSerializer()
+    snapshot = pl.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    expect.compare_snapshot_data(serializer.serialize(snapshot), serializer.serialize(snapshot.clone()))
+    with pytest.raises(AssertionError, match="Differing columns: b"):
+        expect.compare_snapshot_data(
+            serializer.serialize(snapshot),
+            serializer.serialize(snapshot.with_columns(pl.Series("b", ["x", "z"]))),
+        )
+    with pytest.raises(AssertionError, match="different schemas"):
+        expect.compare_snapshot_data(serializer.serialize(snapshot), serializer.serialize(snapshot.drop("b")))
+
+
+@pytest.mark.skipif(pa is None, reason="pyarrow is not installed")
+def test_arrow_serializer_round_trip():
+    """Test round-trip serialization keeps values and schema."""
+    serializer = ArrowIpcSerializer()
+    data = pa.table({"a": pa.array([1, 2], type=pa.int16()), "b": ["x", None]})
+    assert serializer.deserialize(serializer.serialize(data)).equals(data)
+
+
+@pytest.mark.skipif(pa is None, reason="pyarrow is not installed")
+def test_arrow_compare_reports_differing_columns():
+    """Test that the differing columns and row counts are reported."""
+    expect = expect_arrow.ArrowTableExpect(_settings(), mock.MagicMock())
+    serializer = ArrowIpcSerializer()
+    snapshot = pa.table({"a": [1, 2], "b": ["x", "y"]})
+    with pytest.raises(AssertionError, match="Differing columns: a"):
+        expect.compare_snapshot_data(
+            serializer.serialize(snapshot),
+            serializer.serialize(pa.table({"a": [1, 3], "b": ["x", "y"]})),
+        )
+    with pytest.raises(AssertionError, match="different number of rows"):
+        expect.compare_snapshot_data(serializer.serialize(snapshot), serializer.serialize(snapshot.slice(0, 1)))
@@ -25,13 +25,33 @@ try:  # Optional dependency import for runtime test skipping logic
 except ImportError:  # pragma: no cover
     pd = None  # type: ignore[assignment]
 
+try:  # Optional dependency import for runtime test skipping logic
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+try:  # Optional dependency import for runtime test skipping logic
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pl = None  # type: ignore[assignment]
+
+try:  # Optional dependency import for runtime test skipping logic
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore[assignment]
+
 from snappylapy.expectation_classes import (
+    ArrayExpect,
+    ArrowTableExpect,
     BytesExpect,
     DataframeExpect,
     DictExpect,
     ListExpect,
     StringExpect,
     ObjectExpect,
+    PolarsExpect,
+    RecordsExpect,
+    SeriesExpect,
 )
 from snappylapy.fixtures import Expect
 from snappylapy.models import Settings
@@ -86,6 +106,48 @@ def test_overload_dataframe(expect_fixture: Expect) -> None:  # pragma: no cover
     assert isinstance(result, DataframeExpect)
     assert_type(result, DataframeExpect)
 
+@pytest.mark.skipif(pd is None and not TYPE_CHECKING, reason="pandas not installed")
+def test_overload_series(expect_fixture: Expect) -> None:  # pragma: no cover - optional dependency
+    """Series input returns SeriesExpect (when pandas available)."""
+    assert pd is not None  # for type checkers
+    series = pd.Series([1, 2, 3])
+    result = expect_fixture(series)
+    assert isinstance(result, SeriesExpect)
+    assert_type(result, SeriesExpect)
+
+@pytest.mark.skipif(np is None and not TYPE_CHECKING, reason="numpy not installed")
+def test_overload_ndarray(expect_fixture: Expect) -> None:  # pragma: no cover - optional dependency
+    """Numpy array input returns ArrayExpect (when numpy available)."""
+    assert np is not None  # for type checkers
+    array = np.array([1, 2, 3])
+    result = expect_fixture(array)
+    assert isinstance(result, ArrayExpect)
+    assert_type(result, ArrayExpect)
+
+@pytest.mark.skipif(pl is None and not TYPE_CHECKING, reason="polars not installed")
+def test_overload_polars(expect_fixture: Expect) -> None:  # pragma: no cover - optional dependency
+    """Polars DataFrame input returns PolarsExpect (when polars available)."""
+    assert pl is not None  # for type checkers
+    data_frame = pl.DataFrame({"a": [1, 2, 3]})
+    result = expect_fixture(data_frame)
+    assert isinstance(result, PolarsExpect)
+    assert_type(result, PolarsExpect)
+
+@pytest.mark.skipif(pa is None and not TYPE_CHECKING, reason="pyarrow not installed")
+def test_overload_arrow_table(expect_fixture: Expect) -> None:  # pragma: no cover - optional dependency
+    """Pyarrow Table input returns ArrowTableExpect (when pyarrow available)."""
+    assert pa is not None  # for type checkers
+    table = pa.table({"a": [1, 2, 3]})
+    result = expect_fixture(table)
+    assert isinstance(result, ArrowTableExpect)
+    assert_type(result, ArrowTableExpect)
+
+def test_overload_generator(expect_fixture: Expect) -> None:
+    """Generator input returns RecordsExpect."""
+    result = expect_fixture({"row": index} for index in range(3))
+    assert isinstance(result, RecordsExpect)
+    assert_type(result, RecordsExpect)
+
 def test_overload_object(expect_fixture: Expect) -> None:
     """Object input returns ObjectExpect."""
     class Custom:
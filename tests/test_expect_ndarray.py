@@ -0,0 +1,82 @@
+"""Testing of the numpy array expectations class."""
+import pytest
+import snappylapy.expectation_classes.expect_ndarray as module_on_test
+from snappylapy.models import Settings
+from snappylapy.serialization import NumpyNpySerializer
+from unittest import mock
+
+try:
+    import numpy as np
+    numpy_installed = True
+except ImportError:
+    numpy_installed = False
+
+pytestmark = pytest.mark.skipif(not numpy_installed, reason="numpy is not installed")
+
+
+@pytest.fixture
+def expect() -> module_on_test.ArrayExpect:
+    snappylapy_session = mock.MagicMock()
+    return module_on_test.ArrayExpect(
+        settings=Settings(
+            test_filename="test_file",
+            test_function="test_function",
+        ),
+        snappylapy_session=snappylapy_session,
+    )
+
+
+def test_numpy_serializer_round_trip():
+    """Test round-trip serialization keeps values, shape and dtype."""
+    serializer = NumpyNpySerializer()
+    data = np.arange(12, dtype=np.int32).reshape(3, 4)
+    deserialized_data = serializer.deserialize(serializer.serialize(data))
+    assert deserialized_data.dtype == np.int32
+    np.testing.assert_array_equal(deserialized_data, data)
+
+
+def test_numpy_serializer_round_trip_object_dtype(expect: module_on_test.ArrayExpect) -> None:
+    """Test that arrays of the object dtype can be serialized, and are compared element wise."""
+    serializer = NumpyNpySerializer()
+    data = np.array([{"a": 1}, "text", None], dtype=object)
+    deserialized_data = serializer.deserialize(serializer.serialize(data))
+    assert deserialized_data.dtype == object
+    assert deserialized_data.tolist() == data.tolist()
+    changed_data = np.array([{"a": 2}, "text", None], dtype=object)
+    with pytest.raises(AssertionError, match="1 of 3 elements differ"):
+        expect.compare_snapshot_data(serializer.serialize(data), serializer.serialize(changed_data))
+
+
+def test_compare_within_tolerance(expect: module_on_test.ArrayExpect) -> None:
+    """Test that small float noise passes when tolerances are given."""
+    serializer = NumpyNpySerializer()
+    snapshot = np.linspace(0.0, 1.0, 100)
+    expect._atol = 1e-9
+    expect.compare_snapshot_data(serializer.serialize(snapshot), serializer.serialize(snapshot + 1e-12))
+
+
+def test_compare_reports_summary(expect: module_on_test.ArrayExpect) -> None:
+    """Test that a mismatch reports the count of differing elements and the max absolute error."""
+    serializer = NumpyNpySerializer()
+    snapshot = np.zeros((10, 10))
+    test_results = snapshot.copy()
+    test_results[2, 3] = 0.5
+    test_results[7, 1] = -2.0
+    with pytest.raises(AssertionError) as error:
+        expect.compare_snapshot_data(serializer.serialize(snapshot), serializer.serialize(test_results))
+    assert "2 of 100 elements differ" in str(error.value)
+    assert "Max absolute error: 2.0 at index (7, 1)" in str(error.value)
+
+
+def test_compare_nan_is_equal_to_nan(expect: module_on_test.ArrayExpect) -> None:
+    """Test that NaN values in the same positions are considered equal."""
+    assert module_on_test.describe_array_mismatch(
+        np.array([1.0, np.nan]), np.array([1.0, np.nan]), rtol=0.0, atol=0.0,
+    ) is None
+
+
+def test_compare_shape_mismatch(expect: module_on_test.ArrayExpect) -> None:
+    """Test that arrays of different shapes are reported."""
+    serializer = NumpyNpySerializer()
+    with pytest.raises(AssertionError, match="different shapes"):
+        expect.compare_snapshot_data(serializer.serialize(np.zeros(3)), serializer.serialize(np.zeros(4)))
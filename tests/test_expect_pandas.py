@@ -2,6 +2,7 @@
 import pytest
 import pathlib
 import snappylapy.expectation_classes.expect_dataframe as module_on_test
+from snappylapy._blob_store import write_deduplicated_snapshot
 from snappylapy.models import Settings
 from unittest import mock
 
@@ -62,3 +63,173 @@ def test_columns_to_match_regex(
     """Test the columns_to_match_regex method of DataframeExpect."""
     dataframe_to_test = pd.DataFrame({"key1": ["value1", "value2"], "key2": ["test1", "test2"]})
     expect(dataframe_to_test).columns_to_match_regex({"key1": r"value\d", "key2": r"test\d"})
+
+def _serialize(dataframe: "pd.DataFrame") -> bytes:
+    return module_on_test.PandasCsvSerializer().serialize(dataframe)
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_compare_within_tolerance(expect: module_on_test.DataframeExpect) -> None:
+    """Test that float noise passes when tolerances are given."""
+    snapshot = pd.DataFrame({"x": [0.1, 0.2, 0.3], "label": ["a", "b", "c"]})
+    test_results = snapshot.assign(x=snapshot["x"] + 1e-12)
+    expect._comparison_options = module_on_test.DataframeComparisonOptions(atol=1e-9)
+    expect.compare_snapshot_data(_serialize(snapshot), _serialize(test_results))
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_compare_reports_mismatch_per_column(expect: module_on_test.DataframeExpect) -> None:
+    """Test that a mismatch reports counts per column and the differing rows."""
+    snapshot = pd.DataFrame({"x": range(100), "label": ["a"] * 100})
+    test_results = snapshot.copy()
+    test_results.loc[[3, 50], "x"] = -1
+    test_results.loc[7, "label"] = "b"
+    with pytest.raises(AssertionError) as error:
+        expect.compare_snapshot_data(_serialize(snapshot), _serialize(test_results))
+    message = str(error.value)
+    assert "  x: 2 of 100 rows" in message
+    assert "  label: 1 of 100 rows" in message
+    assert "Top 3 differing rows in snapshot" in message
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_compare_reports_column_order(expect: module_on_test.DataframeExpect) -> None:
+    """Test that dataframes with the same columns in a different order do not match."""
+    snapshot = pd.DataFrame({"x": [1, 2], "label": ["a", "b"]})
+    with pytest.raises(AssertionError, match=r"Column order differs. Snapshot: \['x', 'label'\]"):
+        expect.compare_snapshot_data(_serialize(snapshot), _serialize(snapshot[["label", "x"]]))
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_compare_duplicate_column_names() -> None:
+    """Test that duplicate column names are compared in their order."""
+    snapshot = pd.DataFrame([[1, 2, "a"]], columns=["x", "x", "label"])
+    options = module_on_test.DataframeComparisonOptions()
+    assert module_on_test.describe_dataframe_mismatch(snapshot, snapshot.copy(), options) is None
+    test_results = pd.DataFrame([[1, 3, "a"]], columns=["x", "x", "label"])
+    message = module_on_test.describe_dataframe_mismatch(snapshot, test_results, options)
+    assert message is not None
+    assert "  x (2): 1 of 1 rows" in message
+    assert "Columns only in snapshot: ['x']" in module_on_test.describe_dataframe_mismatch(
+        snapshot,
+        snapshot.iloc[:, 1:],
+        options,
+    )
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_compare_ignore_columns_and_dtype(expect: module_on_test.DataframeExpect) -> None:
+    """Test that ignored columns are not compared and dtype differences can be allowed."""
+    snapshot = pd.DataFrame({"x": [1, 2], "timestamp": ["2024-01-01", "2024-01-02"]})
+    test_results = pd.DataFrame({"x": [1.0, 2.0], "timestamp": ["2025-01-01", "2025-01-02"]})
+    with pytest.raises(AssertionError, match="Column x dtype differs"):
+        expect._comparison_options = module_on_test.DataframeComparisonOptions(ignore_columns=["timestamp"])
+        expect.compare_snapshot_data(_serialize(snapshot), _serialize(test_results))
+    expect._comparison_options = module_on_test.DataframeComparisonOptions(
+        check_dtype=False,
+        ignore_columns=["timestamp"],
+    )
+    expect.compare_snapshot_data(_serialize(snapshot), _serialize(test_results))
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_columns_not_to_contain_nulls_reports_all_columns(expect: module_on_test.DataframeExpect) -> None:
+    """Test that all failing and missing columns are reported in the given order."""
+    dataframe_to_test = pd.DataFrame({"key1": [None, "value2"], "key2": ["value3", "value4"], "key3": [None, None]})
+    with pytest.raises(ValueError) as error:
+        expect(dataframe_to_test).columns_not_to_contain_nulls(["key3", "missing", "key1", "key2"])
+    lines = [line for line in str(error.value).splitlines() if line.startswith("Column")]
+    assert lines == [
+        "Column key3 contains 2 null values. Top 3 examples:",
+        "Column missing not found in dataframe.",
+        "Column key1 contains 1 null values. Top 3 examples:",
+    ]
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_columns_to_match_regex_fails(expect: module_on_test.DataframeExpect) -> None:
+    """Test the columns_to_match_regex method of DataframeExpect with failure."""
+    dataframe_to_test = pd.DataFrame({"key1": ["value1", "value2"], "key2": ["test1", "other"]})
+    with pytest.raises(ValueError, match=r"Column key2 does not match regex test\\d"):
+        expect(dataframe_to_test).columns_to_match_regex({"key1": r"value\d", "key2": r"test\d", "missing": r".*"})
+    with pytest.raises(ValueError, match="Column missing not found in dataframe."):
+        expect(dataframe_to_test).columns_to_match_regex({"key1": r"value\d", "missing": r".*"})
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_dataframe_fingerprint() -> None:
+    """Test the fingerprint is stable, and changes with values, schema and index."""
+    dataframe = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    fingerprint = module_on_test.calculate_dataframe_fingerprint(dataframe)
+    assert fingerprint == module_on_test.calculate_dataframe_fingerprint(dataframe.copy())
+    assert fingerprint != module_on_test.calculate_dataframe_fingerprint(dataframe.assign(a=[1, 3]))
+    assert fingerprint != module_on_test.calculate_dataframe_fingerprint(dataframe.astype({"a": "float64"}))
+    assert fingerprint != module_on_test.calculate_dataframe_fingerprint(dataframe.set_axis([5, 6]))
+    assert module_on_test.calculate_dataframe_fingerprint(pd.DataFrame({"a": [[1], [2]]})) is None
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_unchanged_dataframe_skips_writing_test_results(tmp_path: pathlib.Path) -> None:
+    """Test that a dataframe with the same fingerprint as the snapshot is not written to the test results."""
+    dataframe = pd.DataFrame({"a": [1.5, 2.5], "b": ["x", "y"]})
+    settings = Settings(test_filename="test_file", test_function="test_function", snapshots_base_dir=tmp_path)
+    settings.snapshot_update = True
+    module_on_test.DataframeExpect(settings, mock.MagicMock())(dataframe).to_match_snapshot()
+    snapshot_path = settings.snapshot_dir / settings.filename
+    assert module_on_test.get_fingerprint_path(snapshot_path).exists()
+    test_results_path = settings.test_results_dir / settings.filename
+    test_results_path.unlink()
+
+    settings.snapshot_update = False
+    expect = module_on_test.DataframeExpect(settings, mock.MagicMock())
+    expect(dataframe.copy()).to_match_snapshot()
+    assert not test_results_path.exists()
+
+    expect(dataframe.assign(a=[1.5, 3.5]))
+    assert test_results_path.exists()
+    with pytest.raises(AssertionError):
+        expect.to_match_snapshot()
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_fingerprint_of_deduplicated_snapshot(tmp_path: pathlib.Path) -> None:
+    """Test that deduplicated snapshots and fingerprints are compared, also when the fingerprint is invalid."""
+    dataframe = pd.DataFrame({"a": [1.5, 2.5], "b": ["x", "y"]})
+    settings = Settings(test_filename="test_file", test_function="test_function", snapshots_base_dir=tmp_path)
+    settings.snapshot_update = True
+    module_on_test.DataframeExpect(settings, mock.MagicMock())(dataframe).to_match_snapshot()
+    snapshot_path = settings.snapshot_path
+    fingerprint_path = module_on_test.get_fingerprint_path(snapshot_path)
+    for path in (snapshot_path, fingerprint_path):
+        write_deduplicated_snapshot(path, path.read_bytes())
+    settings.test_results_path.unlink()
+
+    settings.snapshot_update = False
+    module_on_test.DataframeExpect(settings, mock.MagicMock())(dataframe.copy()).to_match_snapshot()
+    assert not settings.test_results_path.exists()
+
+    fingerprint_path.write_text("not a fingerprint")
+    module_on_test.DataframeExpect(settings, mock.MagicMock())(dataframe.copy()).to_match_snapshot()
+    assert settings.test_results_path.exists()
+    with pytest.raises(AssertionError):
+        module_on_test.DataframeExpect(settings, mock.MagicMock())(dataframe.assign(a=[1.5, 3.5])).to_match_snapshot()
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_summarize_dataframe() -> None:
+    """Test the summary contains statistics, a sample and a digest that changes with the values."""
+    dataframe = pd.DataFrame({"a": [float(i) for i in range(50)], "b": ["x", None] * 25})
+    summary = module_on_test.summarize_dataframe(dataframe)
+    assert summary["row_count"] == 50
+    assert summary["columns"]["a"]["quantiles"]["0.5"] == 24.5
+    assert summary["columns"]["b"] == {"dtype": "object", "null_count": 25, "unique_count": 1}
+    assert len(summary["sample"]["data"]) == module_on_test.SUMMARY_SAMPLE_ROWS
+    assert summary == module_on_test.summarize_dataframe(dataframe.copy())
+    changed_dataframe = dataframe.copy()
+    changed_dataframe.loc[3, "a"] = 3.5
+    assert summary["digest"] != module_on_test.summarize_dataframe(changed_dataframe)["digest"]
+
+@pytest.mark.skipif(not pandas_installed, reason="pandas is not installed")
+def test_summary_snapshot(tmp_path: pathlib.Path) -> None:
+    """Test that summary snapshots are stored as json, and detect changed values."""
+    dataframe = pd.DataFrame({"a": [1.5, 2.5, 3.5]})
+    settings = Settings(test_filename="test_file", test_function="test_function", snapshots_base_dir=tmp_path)
+    settings.snapshot_update = True
+    module_on_test.DataframeExpect(settings, mock.MagicMock())(dataframe, summary=True).to_match_snapshot()
+    assert settings.filename.endswith("dataframe.summary.json")
+
+    settings.snapshot_update = False
+    expect = module_on_test.DataframeExpect(settings, mock.MagicMock())
+    with pytest.raises(AssertionError):
+        expect(dataframe.assign(a=[1.5, 2.5, 4.5]), summary=True).to_match_snapshot()
+    with pytest.raises(ValueError, match="not supported for summary snapshots"):
+        expect(dataframe.assign(a=[1.5, 2.5, 4.5]), summary=True).to_match_snapshot(atol=1.0)
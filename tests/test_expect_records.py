@@ -0,0 +1,116 @@
+"""Testing of the records expectations class."""
+import gzip
+import importlib.util
+import pathlib
+import pytest
+import snappylapy.expectation_classes.expect_records as module_on_test
+from snappylapy._blob_store import write_deduplicated_snapshot
+from snappylapy.models import Settings
+from snappylapy.serialization import JsonLinesSerializer
+from unittest import mock
+
+
+@pytest.fixture
+def expect(tmp_path: pathlib.Path) -> module_on_test.RecordsExpect:
+    snappylapy_session = mock.MagicMock()
+    return module_on_test.RecordsExpect(
+        settings=Settings(
+            test_filename="test_file",
+            test_function="test_function",
+            snapshots_base_dir=tmp_path,
+        ),
+        snappylapy_session=snappylapy_session,
+    )
+
+
+def test_json_lines_serializer_round_trip():
+    """Test that records are written as one compact line each."""
+    serializer = JsonLinesSerializer()
+    records = [{"a": 1, "b": "æ"}, [1, 2], "text", None]
+    data = serializer.serialize(iter(records))
+    assert data == '{"a":1,"b":"æ"}\n[1,2]\n"text"\nnull\n'.encode()
+    assert serializer.deserialize(data) == records
+
+
+def test_records_are_streamed_to_test_results(expect: module_on_test.RecordsExpect):
+    """Test that a generator is consumed and written to the test results file."""
+    expect(({"index": index} for index in range(3)))
+    test_results_path = expect.settings.test_results_dir / expect.settings.filename
+    assert test_results_path.read_bytes() == b'{"index":0}\n{"index":1}\n{"index":2}\n'
+
+
+def test_compare_reports_mismatched_indices(expect: module_on_test.RecordsExpect):
+    """Test that mismatching records and missing records are reported by index."""
+    serializer = JsonLinesSerializer()
+    snapshot_data = serializer.serialize([{"a": 1}, {"a": 2}, {"a": 3}])
+    test_data = serializer.serialize([{"a": 1}, {"a": 5}, {"a": 3}, {"a": 4}])
+    with pytest.raises(AssertionError) as error:
+        expect.compare_snapshot_data(snapshot_data, test_data)
+    message = str(error.value)
+    assert "Mismatched record indices: [1, 3]" in message
+    assert '1: {"a":2} -> {"a":5}' in message
+    assert '3: <missing> -> {"a":4}' in message
+
+
+def test_compare_ignores_formatting(expect: module_on_test.RecordsExpect):
+    """Test that records with the same content but different formatting match."""
+    expect.compare_snapshot_data(b'{"a": 1, "b": [1, 2]}\n', b'{"a":1,"b":[1,2]}\n')
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_iter_snapshot_lines_follows_pointers(tmp_path: pathlib.Path, compressed: bool):
+    """Test that lines are read from deduplicated and compressed snapshots."""
+    data = b'{"a":1}\n{"a":2}\n'
+    snapshot_path = tmp_path / ("records.jsonl.gz" if compressed else "records.jsonl")
+    write_deduplicated_snapshot(snapshot_path, gzip.compress(data) if compressed else data)
+    assert list(module_on_test.iter_snapshot_lines(snapshot_path)) == [b'{"a":1}\n', b'{"a":2}\n']
+
+
+def test_records_are_written_in_chunks(expect: module_on_test.RecordsExpect):
+    """Test that all records are written when they span several chunks."""
+    with mock.patch.object(module_on_test, "RECORDS_PER_WRITE", 2):
+        expect(iter(range(5)))
+    test_results_path = expect.settings.test_results_dir / expect.settings.filename
+    assert test_results_path.read_bytes() == b"0\n1\n2\n3\n4\n"
+
+
+def test_to_match_snapshot_streams_files(expect: module_on_test.RecordsExpect):
+    """Test that snapshot files are compared record by record without reading the whole files."""
+    expect.settings.snapshot_update = True
+    expect(iter([{"a": 1}, {"a": 2}])).to_match_snapshot()
+    expect.settings.snapshot_update = False
+    with mock.patch.object(module_on_test.RecordsExpect, "_read_file") as read_file_mock, pytest.raises(
+        AssertionError, match=r"Mismatched record indices: \[1\]",
+    ):
+        expect(iter([{"a": 1}, {"a": 3}])).to_match_snapshot()
+    read_file_mock.assert_not_called()
+
+
+def test_truncated_snapshot_is_reported_and_updated(expect: module_on_test.RecordsExpect):
+    """Test that a snapshot with an invalid line is reported as mismatching, and can be updated."""
+    expect.settings.snapshot_update = True
+    expect(iter([{"a": 1}, {"a": 2}])).to_match_snapshot()
+    expect.settings.snapshot_path.write_bytes(b'{"a":1}\n{"a":\n')
+    expect.settings.snapshot_update = False
+    with pytest.raises(AssertionError, match=r"Mismatched record indices: \[1\]"):
+        expect(iter([{"a": 1}, {"a": 2}])).to_match_snapshot()
+    expect.settings.snapshot_update = True
+    expect(iter([{"a": 1}, {"a": 2}])).to_match_snapshot()
+    assert expect.settings.snapshot_path.read_bytes() == b'{"a":1}\n{"a":2}\n'
+
+
+@pytest.mark.parametrize("filetype", [
+    "records.jsonl.gz",
+    pytest.param("records.jsonl.zst", marks=pytest.mark.skipif(
+        importlib.util.find_spec("zstandard") is None, reason="zstandard not installed",
+    )),
+])
+def test_compressed_records_are_written_in_chunks(expect: module_on_test.RecordsExpect, filetype: str):
+    """Test that compressed records are compressed as a stream, without serializing all records at once."""
+    with mock.patch.object(module_on_test, "RECORDS_PER_WRITE", 2), mock.patch.object(
+        JsonLinesSerializer, "serialize",
+    ) as serialize_mock:
+        expect(iter(range(5)), filetype=filetype)
+    serialize_mock.assert_not_called()
+    test_results_path = expect.settings.test_results_dir / expect.settings.filename
+    assert list(module_on_test.iter_snapshot_lines(test_results_path)) == [b"0\n", b"1\n", b"2\n", b"3\n", b"4\n"]
@@ -0,0 +1,117 @@
+"""Test cases for only running tests with changed inputs."""
+import json
+import pathlib
+import pytest
+from pytest import Pytester
+from snappylapy._impact import InputDigester
+from snappylapy.models import DependingSettings, Settings
+
+TEST_CODE = """
+    import pathlib
+    from snappylapy import Expect, LoadSnapshot, configure_snappylapy
+
+    @configure_snappylapy(foreach_folder_in="cases")
+    def test_case(test_directory: pathlib.Path, expect: Expect):
+        expect.string((test_directory / "input.txt").read_text()).to_match_snapshot()
+
+    @configure_snappylapy(depends=[test_case])
+    def test_depending_case(load_snapshot: LoadSnapshot, expect: Expect):
+        expect.string(load_snapshot.string().upper()).to_match_snapshot()
+"""
+
+
+def test_changed_only_runs_tests_with_changed_inputs(pytester: Pytester):
+    """Test that tests are deselected until their case folder changes."""
+    for case in ("case1", "case2"):
+        (pytester.path / "cases" / case).mkdir(parents=True)
+        (pytester.path / "cases" / case / "input.txt").write_text(case)
+    pytester.makepyfile(test_code=TEST_CODE)
+    result = pytester.runpytest("--snappylapy-changed", "--snapshot-update")
+    result.assert_outcomes(passed=4)
+    result = pytester.runpytest("--snappylapy-changed")
+    result.assert_outcomes(deselected=4)
+    (pytester.path / "cases" / "case1" / "input.txt").write_text("changed")
+    result = pytester.runpytest("-v", "--snappylapy-changed", "--snapshot-update")
+    result.assert_outcomes(passed=3, deselected=1)
+    result.stdout.fnmatch_lines(["*test_case?case1? PASSED*"])
+    result = pytester.runpytest("--snappylapy-changed")
+    result.assert_outcomes(deselected=4)
+
+
+def test_test_digest_changes_with_snapshots(tmp_path: pathlib.Path):
+    """Test that the digest changes with the own snapshots and the snapshots depended on, and only those."""
+    source_path = tmp_path / "test_module.py"
+    source_path.write_text("source")
+    settings = Settings(test_filename="module", test_function="test_a", snapshots_base_dir=tmp_path)
+    settings.depending_tests.append(
+        DependingSettings(test_filename="module", test_function="test_b", snapshots_base_dir=tmp_path),
+    )
+    settings.snapshot_dir.mkdir()
+    digester = InputDigester({})
+    digests = [digester.test_digest(settings, source_path, None)]
+    (settings.snapshot_dir / "[module][test_other].txt").write_text("other")
+    digests.append(digester.test_digest(settings, source_path, None))
+    (settings.snapshot_dir / "[module][test_a].txt").write_text("own")
+    digests.append(digester.test_digest(settings, source_path, None))
+    (settings.snapshot_dir / "[module][test_b].txt").write_text("upstream")
+    digests.append(digester.test_digest(settings, source_path, None))
+    assert digests[0] == digests[1]
+    assert len(set(digests[1:])) == 3
+
+
+def test_reuse_upstream_skips_unchanged_upstream_tests(pytester: Pytester):
+    """Test that upstream tests are skipped until their case folder or code changes, and downstream tests still run."""
+    for case in ("case1", "case2"):
+        (pytester.path / "cases" / case).mkdir(parents=True)
+        (pytester.path / "cases" / case / "input.txt").write_text(case)
+    pytester.makepyfile(test_code=TEST_CODE)
+    result = pytester.runpytest("--snappylapy-reuse-upstream", "--snapshot-update")
+    result.assert_outcomes(passed=4)
+    result = pytester.runpytest("-v", "--snappylapy-reuse-upstream")
+    result.assert_outcomes(passed=2, skipped=2)
+    result.stdout.fnmatch_lines(["*test_depending_case?case1? PASSED*"])
+    (pytester.path / "cases" / "case1" / "input.txt").write_text("changed")
+    result = pytester.runpytest("-v", "--snappylapy-reuse-upstream", "--snapshot-update")
+    result.assert_outcomes(passed=3, skipped=1)
+    result.stdout.fnmatch_lines(["*test_case?case1? PASSED*"])
+    pytester.makepyfile(test_code=TEST_CODE.replace(".read_text())", ".read_text().strip())"))
+    result = pytester.runpytest("--snappylapy-reuse-upstream")
+    result.assert_outcomes(passed=4)
+
+
+def test_reuse_upstream_runs_upstream_tests_again_when_helpers_change(pytester: Pytester):
+    """Test that upstream tests run again when a helper in their module changes, not only the test function."""
+    (pytester.path / "cases" / "case1").mkdir(parents=True)
+    (pytester.path / "cases" / "case1" / "input.txt").write_text("case1")
+    test_code = TEST_CODE.replace(
+        "expect.string((test_directory / \"input.txt\").read_text())",
+        "expect.string(read_input(test_directory))",
+    ) + """
+    def read_input(test_directory):
+        return (test_directory / "input.txt").read_text()
+    """
+    pytester.makepyfile(test_code=test_code)
+    result = pytester.runpytest("--snappylapy-reuse-upstream", "--snapshot-update")
+    result.assert_outcomes(passed=2)
+    result = pytester.runpytest("--snappylapy-reuse-upstream")
+    result.assert_outcomes(passed=1, skipped=1)
+    pytester.makepyfile(test_code=test_code.replace(".read_text()\n", ".read_text().upper()\n"))
+    result = pytester.runpytest("-v", "--snappylapy-reuse-upstream")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*test_case?case1? FAILED*"])
+
+
+def test_changed_records_digests_from_all_workers(pytester: Pytester):
+    """Test that the digests recorded by all pytest-xdist workers are stored, so no test is run again."""
+    pytest.importorskip("xdist")
+    for case in ("case1", "case2"):
+        (pytester.path / "cases" / case).mkdir(parents=True)
+        (pytester.path / "cases" / case / "input.txt").write_text(case)
+    pytester.makepyfile(test_code=TEST_CODE)
+    result = pytester.runpytest_subprocess("-p", "xdist", "-n", "2", "--dist", "loadgroup", "--snappylapy-changed", "--snapshot-update")
+    result.assert_outcomes(passed=4)
+    result = pytester.runpytest_subprocess("-p", "xdist", "-n", "2", "--dist", "loadgroup", "--snappylapy-changed")
+    # The workers deselect the tests, which the main process does not count
+    result.assert_outcomes()
+    digests = json.loads((pytester.path / ".pytest_cache" / "v" / "snappylapy" / "changed" / "test_digests").read_text())
+    assert len(digests) == 4
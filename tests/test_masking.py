@@ -0,0 +1,125 @@
+"""Test cases for masking volatile values in json snapshots."""
+import dataclasses
+import json
+import pathlib
+import uuid
+import pytest
+from datetime import datetime
+from snappylapy._path_mask import PathMask, split_path
+from snappylapy.expectation_classes import DictExpect
+from snappylapy.models import Settings
+from snappylapy.serialization import JsonPickleSerializer
+from unittest import mock
+
+
+@dataclasses.dataclass
+class Run:
+    run_id: str
+    value: int
+
+
+def is_uuid(value: str) -> bool:
+    return len(value) == 36
+
+
+@pytest.fixture
+def expect(tmp_path: pathlib.Path) -> DictExpect:
+    return DictExpect(
+        settings=Settings(
+            test_filename="test_file",
+            test_function="test_function",
+            snapshots_base_dir=tmp_path,
+            snapshot_update=True,
+        ),
+        snappylapy_session=mock.MagicMock(),
+    )
+
+
+def serialize_masked(data, exclude_paths=(), matchers=None) -> dict:
+    serializer = JsonPickleSerializer(mask=PathMask(exclude_paths, matchers))
+    return json.loads(serializer.serialize(data))
+
+
+@pytest.mark.parametrize(
+    ("path", "keys"),
+    [
+        ("a.b", ["a", "b"]),
+        ("items[0].id", ["items", "0", "id"]),
+        ("items[*].id", ["items", "*", "id"]),
+        ("**.created_at", ["**", "created_at"]),
+    ],
+)
+def test_split_path(path: str, keys: list[str]):
+    """Test that paths are split into keys, with list indices as keys."""
+    assert split_path(path) == keys
+
+
+@pytest.mark.parametrize("path", ["", "a..b", "a."])
+def test_split_path_invalid(path: str):
+    """Test that invalid paths are rejected."""
+    with pytest.raises(ValueError, match="Invalid path"):
+        split_path(path)
+
+
+def test_exclude_paths_with_wildcards():
+    """Test that exact paths, wildcards and recursive wildcards exclude the values they reach."""
+    data = {
+        "meta": {"created_at": "now", "name": "run"},
+        "items": [{"id": 1, "value": "a"}, {"id": 2, "value": "b"}],
+        "nested": {"deep": {"uuid": "x", "keep": True}},
+    }
+    masked = serialize_masked(data, ["meta.created_at", "items[*].id", "**.uuid"])
+    assert masked == {
+        "meta": {"name": "run"},
+        "items": [{"value": "a"}, {"value": "b"}],
+        "nested": {"deep": {"keep": True}},
+    }
+    assert "created_at" in data["meta"]
+
+
+def test_matchers_write_placeholders():
+    """Test that matched values are checked and written as a placeholder, also inside dataclasses and tuples."""
+    data = {"started": datetime(2024, 1, 1), "runs": (Run(run_id=str(uuid.uuid4()), value=1),)}
+    masked = serialize_masked(data, matchers={"started": datetime, "runs[*].run_id": is_uuid})
+    assert masked == {"started": "<datetime>", "runs": {"py/tuple": [{"run_id": "<is_uuid>", "value": 1}]}}
+
+
+def test_matcher_mismatch_raises():
+    """Test that a value not matching the matcher fails with the path in the message."""
+    with pytest.raises(AssertionError, match="Value at path 'started' does not match <datetime>"):
+        serialize_masked({"started": "2024-01-01"}, matchers={"started": datetime})
+
+
+def test_unmasked_parts_are_written_as_without_mask():
+    """Test that data not reached by any path is written the same way as without a mask."""
+    data = {"tuple": (1, 2), "set": {3}, "keys": {1: "a"}, "ignored": "x"}
+    unmasked_data = {key: value for key, value in data.items() if key != "ignored"}
+    expected = json.loads(JsonPickleSerializer().serialize(unmasked_data))
+    assert serialize_masked(data, ["ignored"]) == expected
+
+
+def test_to_match_snapshot_masks_test_results(expect: DictExpect):
+    """Test that snapshots with different volatile values match when the values are masked."""
+    expect({"id": str(uuid.uuid4()), "at": datetime.now(), "value": 1}).to_match_snapshot(
+        exclude_paths=["id"],
+        matchers={"at": datetime},
+    )
+    expect.settings.snapshot_update = False
+    expect({"id": str(uuid.uuid4()), "at": datetime.now(), "value": 1}).to_match_snapshot(
+        exclude_paths=["id"],
+        matchers={"at": datetime},
+    )
+    snapshot = json.loads((expect.settings.snapshot_dir / expect.settings.filename).read_bytes())
+    assert snapshot == {"at": "<datetime>", "value": 1}
+    with pytest.raises(AssertionError):
+        expect({"id": "not masked"}).to_match_snapshot()
+    test_results = json.loads((expect.settings.test_results_dir / expect.settings.filename).read_bytes())
+    assert test_results == {"id": "not masked"}
+
+
+def test_masked_test_results_are_serialized_once(expect: DictExpect):
+    """Test that the test results are serialized and written once, with the values masked."""
+    with mock.patch.object(JsonPickleSerializer, "serialize", autospec=True, return_value=b"{}") as serialize_mock:
+        expect({"id": str(uuid.uuid4())}).to_match_snapshot(exclude_paths=["id"])
+    serialize_mock.assert_called_once()
+    assert serialize_mock.call_args.args[0].mask is not None
@@ -0,0 +1,58 @@
+"""Test cases for the settings models."""
+import pathlib
+import pytest
+from snappylapy.models import DependingSettings, Settings
+
+
+def test_settings_are_slotted():
+    """Test that settings do not have an instance dictionary."""
+    settings = Settings(test_filename="module", test_function="test_a")
+    assert not hasattr(settings, "__dict__")
+    with pytest.raises(AttributeError):
+        settings.unknown_setting = True  # type: ignore[attr-defined]
+
+
+def test_settings_paths_are_cached_until_fields_change(tmp_path: pathlib.Path):
+    """Test that the cached filename and paths are rebuilt when a field they are built from is set."""
+    settings = Settings(test_filename="module", test_function="test_a", snapshots_base_dir=tmp_path)
+    snapshot_path = settings.snapshot_path
+    assert settings.snapshot_path is snapshot_path
+    assert snapshot_path == tmp_path / "__snapshots__" / "[module][test_a].txt"
+    settings.custom_name = "case1"
+    settings.filename_extension = "dict.json"
+    assert settings.filename == "[module][test_a][case1].dict.json"
+    assert settings.test_results_path == tmp_path / "__test_results__" / "[module][test_a][case1].dict.json"
+    settings.snapshots_base_dir = tmp_path / "other"
+    assert settings.snapshot_path == tmp_path / "other" / "__snapshots__" / "[module][test_a][case1].dict.json"
+
+
+def test_settings_equality_ignores_caches():
+    """Test that settings with and without cached paths are equal."""
+    settings = Settings(test_filename="module", test_function="test_a")
+    assert settings.filename
+    assert settings == Settings(test_filename="module", test_function="test_a")
+
+
+def test_depending_settings_snapshot_path(tmp_path: pathlib.Path):
+    """Test that the snapshot path of a dependency follows its filename extension."""
+    depending = DependingSettings(test_filename="module", test_function="test_b", snapshots_base_dir=tmp_path)
+    with pytest.raises(ValueError, match="Missing depending snapshot filename extension"):
+        _ = depending.snapshot_path
+    depending.filename_extension = "string.txt"
+    assert depending.snapshot_path == tmp_path / "__snapshots__" / "[module][test_b].string.txt"
+    depending.filename_extension = "dict.json"
+    assert depending.snapshot_path.name == "[module][test_b].dict.json"
+
+
+def test_settings_copy_is_independent(tmp_path: pathlib.Path):
+    """Test that changing a copy of the settings, or its depending settings, leaves the original unchanged."""
+    settings = Settings(test_filename="module", test_function="test_a", snapshots_base_dir=tmp_path)
+    settings.depending_tests.append(
+        DependingSettings(test_filename="module", test_function="test_b", snapshots_base_dir=tmp_path),
+    )
+    copied = settings.copy()
+    assert copied == settings
+    copied.filename_extension = "dict.json"
+    copied.depending_tests[0].filename_extension = "dict.json"
+    assert settings.filename_extension == "txt"
+    assert settings.depending_tests[0].filename_extension is None
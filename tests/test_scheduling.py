@@ -0,0 +1,108 @@
+"""Test cases for grouping and ordering dependency chains when running with xdist."""
+import json
+import pytest
+from pytest import Pytester
+from snappylapy import _scheduling as module_on_test
+
+TEST_CODE = """
+    import pathlib
+    from snappylapy import configure_snappylapy
+
+    def test_standalone():
+        pass
+
+    def test_upstream():
+        pass
+
+    @configure_snappylapy(depends=[test_upstream])
+    def test_downstream():
+        pass
+
+    @configure_snappylapy(foreach_folder_in="cases")
+    def test_case(test_directory: pathlib.Path):
+        pass
+
+    @configure_snappylapy(depends=[test_case])
+    def test_depending_case(test_directory: pathlib.Path):
+        pass
+"""
+
+
+@pytest.fixture
+def items(pytester: Pytester) -> list[pytest.Item]:
+    for case in ("case1", "case2"):
+        (pytester.path / "cases" / case).mkdir(parents=True)
+    return pytester.getitems(TEST_CODE)
+
+
+def names(chain: list[pytest.Item]) -> list[str]:
+    return [item.name for item in chain]
+
+
+def test_find_dependency_chains(items: list[pytest.Item]):
+    """Test that tests are chained with their dependencies, and case folders are chained separately."""
+    chains = module_on_test.find_dependency_chains(items)
+    assert sorted(map(names, chains)) == [
+        ["test_case[case1]", "test_depending_case[case1]"],
+        ["test_case[case2]", "test_depending_case[case2]"],
+        ["test_upstream", "test_downstream"],
+    ]
+
+
+def test_order_by_chain_duration(items: list[pytest.Item]):
+    """Test that the longest chains are first, followed by the tests not in a chain in their original order."""
+    chains = module_on_test.find_dependency_chains(items)
+    slow_chain = next(chain for chain in chains if chain[0].name == "test_case[case2]")
+    durations = {module_on_test.get_test_key(slow_chain[1]): 10.0}
+    ordered = module_on_test.order_by_chain_duration(items, chains, durations)
+    assert names(ordered[:2]) == ["test_case[case2]", "test_depending_case[case2]"]
+    assert names(ordered[-1:]) == ["test_standalone"]
+    assert sorted(names(ordered)) == sorted(names(items))
+
+
+def test_chain_group_name_is_stable(items: list[pytest.Item]):
+    """Test that the group name does not depend on the xdist group suffix of the node id."""
+    chain = module_on_test.find_dependency_chains(items)[0]
+    name = module_on_test.get_chain_group_name(chain)
+    chain[0]._nodeid = f"{chain[0].nodeid}@{name}"
+    assert module_on_test.get_chain_group_name(chain) == name
+
+
+def test_dependency_chains_run_on_one_worker(pytester: Pytester):
+    """Test that each dependency chain is sent to one worker with `--dist loadgroup`."""
+    pytest.importorskip("xdist")
+    for case in ("case1", "case2"):
+        (pytester.path / "cases" / case).mkdir(parents=True)
+    pytester.makepyfile(test_code=TEST_CODE)
+    result = pytester.runpytest_subprocess("-p", "xdist", "-n", "2", "--dist", "loadgroup", "-v")
+    result.assert_outcomes(passed=7)
+    workers_by_test: dict[str, str] = {}
+    for line in result.outlines:
+        if "PASSED" in line:
+            worker, node_id = line.split()[0], line.split()[-1]
+            workers_by_test[node_id.removeprefix("test_code.py::")] = worker
+    assert workers_by_test["test_downstream@snappylapy:test_code.py::test_upstream"] == (
+        workers_by_test["test_upstream@snappylapy:test_code.py::test_upstream"]
+    )
+    for case in ("case1", "case2"):
+        group = f"snappylapy:test_code.py::test_case_{case}_"
+        assert workers_by_test[f"test_depending_case[{case}]@{group}"] == workers_by_test[f"test_case[{case}]@{group}"]
+
+
+def test_durations_recorded_from_all_workers(pytester: Pytester):
+    """Test that the durations recorded by the workers are all stored in the cache by the main process."""
+    pytest.importorskip("xdist")
+    for case in ("case1", "case2"):
+        (pytester.path / "cases" / case).mkdir(parents=True)
+    pytester.makepyfile(test_code=TEST_CODE)
+    result = pytester.runpytest_subprocess("-p", "xdist", "-n", "2", "--dist", "loadgroup")
+    result.assert_outcomes(passed=7)
+    durations = json.loads((pytester.path / ".pytest_cache" / "v" / "snappylapy" / "test_durations").read_text())
+    assert sorted(durations) == [
+        "test_code.py::test_case[case1]",
+        "test_code.py::test_case[case2]",
+        "test_code.py::test_depending_case[case1]",
+        "test_code.py::test_depending_case[case2]",
+        "test_code.py::test_downstream",
+        "test_code.py::test_upstream",
+    ]
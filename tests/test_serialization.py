@@ -1,7 +1,19 @@
 """Test cases for serialization module."""
-from snappylapy.serialization import StringSerializer, JsonSerializer, JsonPickleSerializer
+from snappylapy import serialization
+from snappylapy.serialization import StringSerializer, JsonSerializer, JsonPickleSerializer, PandasSeriesCsvSerializer
 from datetime import datetime
+from typing import NamedTuple
+import dataclasses
+import json
+import jsonpickle
 import pytest
+import types
+from unittest import mock
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 def test_string_serializer_serialize():
     """Test serialization of a string."""
@@ -126,4 +138,219 @@ def test_jsonpickle_serializer_custom_object():
     assert isinstance(deserialized_data["obj"], CustomObject)
     assert deserialized_data["obj"].name == "test"
     assert deserialized_data["obj"].value == 123
-    assert deserialized_data["obj"].get_string() == "test - 123 - 234"
\ No newline at end of file
+    assert deserialized_data["obj"].get_string() == "test - 123 - 234"
+
+@pytest.mark.skipif(pd is None, reason="pandas is not installed")
+def test_pandas_series_serializer_round_trip():
+    """Test round-trip serialization of series keeps the values, dtype and name."""
+    serializer = PandasSeriesCsvSerializer()
+    for data in [
+        pd.Series([1.5, 2.0, None], name="x"),
+        pd.Series([1, 2], dtype="int32", name=3, index=["a", "b"]),
+        pd.Series(["x", "y"], dtype="category"),
+        pd.Series([1, 2], name=("a", "b")),
+        pd.Series(["1", "2", "0.5"], name="codes"),
+        pd.Series(["007", None], dtype="string"),
+        pd.Series([1, 2], index=pd.MultiIndex.from_tuples([("a", 1), ("b", 2)], names=["key", None])),
+    ]:
+        deserialized_data = serializer.deserialize(serializer.serialize(data))
+        pd.testing.assert_series_equal(deserialized_data, data, check_index_type=False)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"a": [1, 2.5, None, True, "æ\n"], "b": {"c": {}}, "e": [], "g": 10**30},
+        [{"a": 1}, {"a": 1}],
+        "text",
+        1.0,
+    ],
+)
+def test_jsonpickle_serializer_plain_data_matches_jsonpickle(data):
+    """Test that the fast path for plain json data gives the same output as jsonpickle."""
+    expected = jsonpickle.encode(data, indent=2).encode()
+    assert JsonPickleSerializer().serialize(data) == expected
+
+
+SHARED_LIST = [1]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"a": (1, 2)},
+        {1: "a"},
+        {"py/object": "a"},
+        {"x": SHARED_LIST, "y": SHARED_LIST},
+        CustomObject(name="test", value=123),
+    ],
+)
+def test_jsonpickle_serializer_falls_back_to_jsonpickle(data):
+    """Test that data jsonpickle writes differently than plain json is written with jsonpickle."""
+    expected = jsonpickle.encode(data, indent=2).encode()
+    assert JsonPickleSerializer().serialize(data) == expected
+
+
+@dataclasses.dataclass(slots=True)
+class SlottedPoint:
+    x: int
+    y: list[int]
+
+
+class NamedPoint(NamedTuple):
+    x: int
+    y: int
+
+
+class FakePydanticModel:
+    """Stand-in for a pydantic model, which is detected by `model_fields` and `model_dump`."""
+
+    model_fields = {"name": None}
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.private = "not a field"
+
+    def model_dump(self) -> dict:
+        return {"name": self.name}
+
+
+class FakeAttrsClass:
+    """Stand-in for an attrs class, which is detected by `__attrs_attrs__`."""
+
+    __attrs_attrs__ = (types.SimpleNamespace(name="value"),)
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+def test_jsonpickle_serializer_known_classes_as_plain_dicts():
+    """Test that dataclasses, NamedTuples, pydantic models and attrs classes are written as plain dictionaries."""
+    data = [SlottedPoint(1, [2]), NamedPoint(3, 4), FakePydanticModel("a"), FakeAttrsClass(5)]
+    serialized_data = JsonPickleSerializer().serialize(data)
+    assert b"py/" not in serialized_data
+    assert JsonPickleSerializer().deserialize(serialized_data) == [
+        {"x": 1, "y": [2]},
+        {"x": 3, "y": 4},
+        {"name": "a"},
+        {"value": 5},
+    ]
+
+
+class StatefulObject:
+    def __init__(self) -> None:
+        self.value = 1
+
+    def __getstate__(self) -> dict:
+        return {"state": self.value}
+
+
+SHARED_OBJECT = CustomObject(name="shared", value=1)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [CustomObject(name="a", value=1), {"nested": CustomObject(name="b", value=[1, {"c": None}])}],
+        [SHARED_OBJECT, SHARED_OBJECT],
+        [StatefulObject()],
+    ],
+)
+def test_jsonpickle_serializer_objects_match_jsonpickle(data):
+    """Test that simple objects are written the same way as jsonpickle, with a fall back for the rest."""
+    expected = jsonpickle.encode(data, indent=2).encode()
+    assert JsonPickleSerializer().serialize(data) == expected
+    assert isinstance(JsonPickleSerializer().deserialize(expected)[0], type(data[0]))
+
+
+def test_jsonpickle_serializer_plan_is_cached_per_class():
+    """Test that the plan for a class is only built once for many instances."""
+    data = [CustomObject(name=str(index), value=index) for index in range(100)]
+    serialization._class_plans.pop(CustomObject, None)
+    with mock.patch.object(serialization, "_build_class_plan", wraps=serialization._build_class_plan) as build_mock:
+        JsonPickleSerializer().serialize(data)
+    build_mock.assert_called_once_with(CustomObject)
+
+
+class Money:
+    def __init__(self, amount: int, currency: str) -> None:
+        self.amount = amount
+        self.currency = currency
+
+
+def test_register_reducer():
+    """Test that a registered reducer is used both with and without the fall back to jsonpickle."""
+    serialization.register_reducer(Money, lambda money: f"{money.amount} {money.currency}")
+    serializer = JsonPickleSerializer()
+    assert serializer.deserialize(serializer.serialize({"price": Money(5, "EUR")})) == {"price": "5 EUR"}
+    assert serializer.deserialize(serializer.serialize({"price": Money(5, "EUR"), "tuple": (1,)})) == {
+        "price": "5 EUR",
+        "tuple": (1,),
+    }
+
+
+class Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+
+@dataclasses.dataclass
+class Shape:
+    name: str
+    origin: Point
+
+
+def test_register_reducer_returning_new_lists():
+    """Test that many instances reduced to new lists are written as plain json, not taken for repeated references."""
+    serialization.register_reducer(Point, lambda point: [point.x, point.y])
+    data = [Shape(name=str(index), origin=Point(index, -index)) for index in range(1000)]
+    serialized = JsonPickleSerializer().serialize(data)
+    assert b"py/" not in serialized
+    assert json.loads(serialized) == [{"name": str(index), "origin": [index, -index]} for index in range(1000)]
+
+
+class Temperature:
+    def __init__(self, degrees: float) -> None:
+        self.degrees = degrees
+
+
+class TemperatureHandler(jsonpickle.handlers.BaseHandler):
+    def flatten(self, obj, data):
+        data["celsius"] = obj.degrees
+        return data
+
+    def restore(self, obj):
+        return Temperature(obj["celsius"])
+
+
+def test_jsonpickle_handler_registered_after_plan_is_cached():
+    """Test that a jsonpickle handler registered after serializing the class once is used."""
+    serializer = JsonPickleSerializer()
+    assert b"celsius" not in serializer.serialize([Temperature(20.5)])
+    jsonpickle.handlers.register(Temperature, TemperatureHandler)
+    try:
+        serialized = serializer.serialize([Temperature(20.5)])
+        assert b"celsius" in serialized
+        assert serializer.deserialize(serialized)[0].degrees == 20.5
+    finally:
+        jsonpickle.handlers.unregister(Temperature)
+
+
+def test_jsonpickle_serializer_canonical_sorts_keys_and_sets():
+    """Test that canonical mode sorts keys and set members, and can be decoded again."""
+    serializer = JsonPickleSerializer(canonical=True)
+    first = serializer.serialize({"z": {3, 1, 2}, "a": CustomObject(name="x", value=1.0000000000000002)})
+    second = serializer.serialize({"a": CustomObject(name="x", value=1.0), "z": {2, 3, 1}})
+    assert first == second
+    decoded = serializer.deserialize(first)
+    assert decoded["z"] == {1, 2, 3}
+    assert isinstance(decoded["a"], CustomObject)
+
+
+def test_jsonpickle_serializer_canonical_writes_shared_references_in_full():
+    """Test that repeated objects are written in full, since references depend on the order of the keys."""
+    serializer = JsonPickleSerializer(canonical=True)
+    decoded = serializer.deserialize(serializer.serialize({"b": SHARED_LIST, "a": SHARED_LIST, "t": (1, 2)}))
+    assert decoded == {"a": SHARED_LIST, "b": SHARED_LIST, "t": (1, 2)}
+    assert b"py/id" not in serializer.serialize([SHARED_OBJECT, SHARED_OBJECT])
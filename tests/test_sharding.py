@@ -0,0 +1,124 @@
+"""Test cases for splitting the case folders of foreach_folder_in tests in shards."""
+import argparse
+import pathlib
+import pytest
+from pytest import Pytester
+from snappylapy import _sharding as module_on_test
+from snappylapy._sharding import Shard
+from snappylapy.session import SnapshotSession
+
+
+CASES = [pathlib.Path("cases") / f"case{index}" for index in range(50)]
+
+
+@pytest.mark.parametrize(("value", "shard"), [("1/1", Shard(1, 1)), ("2/4", Shard(2, 4))])
+def test_parse_shard(value: str, shard: Shard):
+    """Test parsing the value of the shard option."""
+    assert module_on_test.parse_shard(value) == shard
+
+
+@pytest.mark.parametrize("value", ["0/4", "5/4", "1", "a/b", "1/0"])
+def test_parse_shard_invalid(value: str):
+    """Test that shards outside the range are rejected."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        module_on_test.parse_shard(value)
+
+
+@pytest.mark.parametrize("durations", [None, {"cases/case0": 10.0, "cases/case1": 5.0}])
+def test_select_shard_partitions_cases(durations: dict[str, float] | None):
+    """Test that every case is selected by exactly one shard, keeping the original order."""
+    selected = [module_on_test.select_shard(CASES, Shard(index, 3), durations) for index in range(1, 4)]
+    assert sorted(case for shard_cases in selected for case in shard_cases) == sorted(CASES)
+    assert all(shard_cases == [case for case in CASES if case in shard_cases] for shard_cases in selected)
+    assert module_on_test.select_shard(CASES, Shard(2, 3), durations) == selected[1]
+
+
+def test_select_shard_by_duration_balances_shards():
+    """Test that the shards are balanced by the recorded durations."""
+    durations = {"cases/case0": 100.0, **{f"cases/case{index}": 1.0 for index in range(1, 50)}}
+    slow_shard = module_on_test.select_shard(CASES, Shard(1, 2), durations)
+    assert slow_shard == [pathlib.Path("cases/case0")]
+
+
+def test_shards_run_all_case_folders_once(pytester: Pytester):
+    """Test that each shard runs its own case folders, also for tests depending on the case folders."""
+    for index in range(6):
+        (pytester.path / "cases" / f"case{index}").mkdir(parents=True)
+    pytester.makepyfile(test_code="""
+        import pathlib
+        from snappylapy import configure_snappylapy
+
+        @configure_snappylapy(foreach_folder_in="cases")
+        def test_case(test_directory: pathlib.Path):
+            pass
+
+        @configure_snappylapy(depends=[test_case])
+        def test_depending(test_directory: pathlib.Path):
+            pass
+    """)
+    passed: list[str] = []
+    for shard in ("1/2", "2/2"):
+        result = pytester.runpytest("-v", f"--snappylapy-shard={shard}")
+        outcomes = result.parseoutcomes()
+        assert outcomes.get("passed", 0) > 0, "\n".join(result.outlines)
+        passed.extend(line.split("::")[1].split()[0] for line in result.outlines if "PASSED" in line)
+    assert sorted(passed) == sorted(f"{test}[case{index}]" for test in ("test_case", "test_depending") for index in range(6))
+    assert pytester.runpytest("--snappylapy-shard=3/2").ret != 0
+
+
+def test_unvisited_snapshots_ignore_other_shards(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that snapshots of case folders run by other shards are not reported as unvisited."""
+    monkeypatch.chdir(tmp_path)
+    for case in ("case1", "case2"):
+        snapshot_dir = tmp_path / "cases" / case / "__snapshots__"
+        snapshot_dir.mkdir(parents=True)
+        (snapshot_dir / f"[test_code][test_case][{case}].txt").write_text("data")
+    session = SnapshotSession(shard=Shard(1, 2))
+    session.add_case_directories_in_other_shards([pathlib.Path("cases/case2")])
+    assert session._get_unvisited_snapshots() == {"[test_code][test_case][case1].txt"}
+
+
+def test_cache_provider_disabled(pytester: Pytester):
+    """Test that the options reading and recording in the pytest cache work without the cacheprovider plugin."""
+    (pytester.path / "cases" / "case1").mkdir(parents=True)
+    pytester.makepyfile(test_code="""
+        import pathlib
+        from snappylapy import configure_snappylapy
+
+        @configure_snappylapy(foreach_folder_in="cases")
+        def test_case(test_directory: pathlib.Path):
+            pass
+
+        @configure_snappylapy(depends=[test_case])
+        def test_depending(test_directory: pathlib.Path):
+            pass
+    """)
+    result = pytester.runpytest(
+        "-p",
+        "no:cacheprovider",
+        "--snappylapy-shard=1/1",
+        "--snappylapy-shard-by-duration",
+        "--snappylapy-changed",
+        "--snappylapy-reuse-upstream",
+    )
+    result.assert_outcomes(passed=2)
+
+
+def test_summary_reports_unvisited_snapshots_of_this_shard_only(pytester: Pytester):
+    """Test that the summary reports snapshots no test visited, but not the snapshots of case folders of other shards."""
+    for index in range(4):
+        (pytester.path / "cases" / f"case{index}").mkdir(parents=True)
+    pytester.makepyfile(test_code="""
+        import pathlib
+        from snappylapy import Expect, configure_snappylapy
+
+        @configure_snappylapy(foreach_folder_in="cases")
+        def test_case(test_directory: pathlib.Path, expect: Expect):
+            expect.string(test_directory.name).to_match_snapshot()
+    """)
+    pytester.runpytest("--snapshot-update").assert_outcomes(passed=4)
+    (pytester.path / "__snapshots__").mkdir()
+    (pytester.path / "__snapshots__" / "[test_code][test_removed].string.txt").write_text("orphan")
+    result = pytester.runpytest("--snappylapy-shard=1/2")
+    assert result.parseoutcomes()["passed"] < 4
+    result.stdout.fnmatch_lines(["Found 1 unvisited snapshots:", "  [[]test_code[]][[]test_removed[]].string.txt"])
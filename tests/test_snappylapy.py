@@ -355,3 +355,151 @@ def test_load_snapshot_from_file_test_in_seperate_module(pytester: Pytester):
     pytester.makepyfile(test_a_load_snapshot=load_snapshot_test_code)
     result = pytester.runpytest('-v', '--snapshot-update')
     assert result.ret == 0, "\n".join(result.outlines)
+
+
+def test_snapshot_compressed_dict(pytester: Pytester):
+    """Test snapshot stored gzip compressed and loaded again by a depending test."""
+    test_code = """
+    import pytest
+    from snappylapy import Expect, LoadSnapshot
+
+    def test_snapshot_dict(expect: Expect):
+        expect.dict({"name": "John Doe", "age": 31}, filetype="dict.json.gz").to_match_snapshot()
+
+    @pytest.mark.snappylapy(depends=[test_snapshot_dict])
+    def test_load_snapshot(load_snapshot: LoadSnapshot):
+        assert load_snapshot.dict() == {"name": "John Doe", "age": 31}
+    """
+    pytester.makepyfile(test_code)
+    result = pytester.runpytest('-v', '--snapshot-update')
+    assert result.ret == 0, "\n".join(result.outlines)
+    assert (pytester.path / "__snapshots__" / "[test_snapshot_compressed_dict][test_snapshot_dict].dict.json.gz").exists()
+    result = pytester.runpytest('-v')
+    assert result.ret == 0, "\n".join(result.outlines)
+
+
+def test_snapshot_deduplicated(pytester: Pytester):
+    """Test identical payloads of parametrized tests and case folders are stored once in the shared blob store."""
+    for case in ("case1", "case2"):
+        (pytester.path / "cases" / case).mkdir(parents=True)
+    test_code = """
+    import pathlib
+    import pytest
+    from snappylapy import Expect, configure_snappylapy
+
+    @pytest.mark.parametrize("case", ["case1", "case2", "case3"])
+    def test_snapshot_dict(case: str, expect: Expect):
+        expect.dict({"name": "John Doe", "age": 31}).to_match_snapshot()
+
+    @configure_snappylapy(foreach_folder_in="cases")
+    def test_case_folder(test_directory: pathlib.Path, expect: Expect):
+        expect.dict({"name": "John Doe", "age": 31}).to_match_snapshot()
+    """
+    pytester.makepyfile(test_code)
+    result = pytester.runpytest('-v', '--snapshot-update', '--snapshot-deduplicate')
+    assert result.ret == 0, "\n".join(result.outlines)
+    assert len(list((pytester.path / "__blobs__").iterdir())) == 1
+    assert not list(pytester.path.rglob("__snapshots__/__blobs__"))
+    result = pytester.runpytest('-v')
+    assert result.ret == 0, "\n".join(result.outlines)
+    assert "unvisited" not in result.stdout.str()
+
+
+def test_settings_from_collection(pytester: Pytester):
+    """Test that the settings created at collection are copied for each test, with the marker configuration."""
+    test_code = """
+    import pathlib
+    import pytest
+    from snappylapy import configure_snappylapy
+    from snappylapy.models import Settings
+
+    @configure_snappylapy(output_dir="out")
+    def test_upstream():
+        pass
+
+    @configure_snappylapy(depends=[test_upstream], canonical_json=True)
+    @pytest.mark.parametrize("case", ["case1", "case2"])
+    def test_downstream(case: str, snappylapy_settings: Settings):
+        assert snappylapy_settings.custom_name == case
+        assert snappylapy_settings.snapshot_canonical_json
+        depending = snappylapy_settings.depending_tests[0]
+        assert depending.filename_prefix == f"[test_code][test_upstream][{case}]"
+        assert depending.snapshots_base_dir == pathlib.Path("out")
+        assert depending.filename_extension is None
+        depending.filename_extension = "string.txt"
+    """
+    pytester.makepyfile(test_code=test_code)
+    result = pytester.runpytest('-v')
+    result.assert_outcomes(passed=3)
+
+
+def test_test_results_namespaced_per_worker(pytester: Pytester):
+    """Test that a pytest-xdist worker writes to its own namespace, merged at session end, and keeps other results."""
+    pytester.makeconftest("""
+    def pytest_configure(config):
+        config.workerinput = {"workerid": "gw0"}
+    """)
+    test_code = """
+    from snappylapy import Expect
+
+    def test_snapshot_string(expect: Expect):
+        expect.string("Hello World").to_match_snapshot()
+        assert expect.string.settings.test_results_path.parent.parts[-2:] == ("__workers__", "gw0")
+        assert expect.string.settings.test_results_path.exists()
+    """
+    test_results_dir = pytester.path / "__test_results__"
+    (test_results_dir / "__workers__").mkdir(parents=True)
+    (test_results_dir / "[test_code][test_other_worker].txt").write_text("other worker")
+    pytester.makepyfile(test_code=test_code)
+    result = pytester.runpytest('-v', '--snapshot-update')
+    assert result.ret == 0, "\n".join(result.outlines)
+    assert sorted(path.name for path in test_results_dir.iterdir()) == [
+        "[test_code][test_other_worker].txt",
+        "[test_code][test_snapshot_string].string.txt",
+    ]
+
+
+def test_leftover_worker_test_results_removed(pytester: Pytester):
+    """Test that the main process removes the namespaces left by workers, e.g. a worker that crashed."""
+    namespace_dir = pytester.path / "__test_results__" / "__workers__" / "gw3"
+    namespace_dir.mkdir(parents=True)
+    (namespace_dir / "[test_code][test_crashed].txt").write_text("partial")
+    pytester.makepyfile(test_code="def test_nothing():\n    pass\n")
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+    assert not (pytester.path / "__test_results__" / "__workers__").exists()
+
+
+def test_leftover_temporary_files_removed(pytester: Pytester):
+    """Test that temporary files left by a killed run are removed, and not reported as unvisited snapshots."""
+    snapshot_dir = pytester.path / "__snapshots__"
+    snapshot_dir.mkdir()
+    (snapshot_dir / ".[test_code][test_snapshot_string].string.txt.0123abcd.tmp").write_text("partial")
+    test_code = """
+    from snappylapy import Expect
+
+    def test_snapshot_string(expect: Expect):
+        expect.string("Hello World").to_match_snapshot()
+    """
+    pytester.makepyfile(test_code=test_code)
+    result = pytester.runpytest("--snapshot-update")
+    result.assert_outcomes(passed=1)
+    assert "unvisited snapshots" not in result.stdout.str()
+    assert [path.name for path in snapshot_dir.iterdir()] == ["[test_code][test_snapshot_string].string.txt"]
+
+
+@pytest.mark.parametrize("fsync_policy", ["none", "file", "session"])
+def test_snapshot_fsync_policy(pytester: Pytester, fsync_policy: str):
+    """Test that snapshots are written with each fsync policy, without temporary files left."""
+    test_code = """
+    from snappylapy import Expect
+
+    def test_snapshot_string(expect: Expect):
+        expect.string("Hello World").to_match_snapshot()
+    """
+    pytester.makepyfile(test_code=test_code)
+    result = pytester.runpytest('-v', '--snapshot-update', f'--snapshot-fsync={fsync_policy}')
+    assert result.ret == 0, "\n".join(result.outlines)
+    assert [path.name for path in (pytester.path / "__snapshots__").iterdir()] == [
+        "[test_code][test_snapshot_string].string.txt",
+    ]
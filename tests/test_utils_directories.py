@@ -0,0 +1,83 @@
+"""Test cases for the directory utilities."""
+import os
+import pathlib
+import pytest
+from unittest import mock
+from snappylapy import _utils_directories as module_on_test
+
+
+@pytest.fixture(autouse=True)
+def clear_directory_cache():
+    """Make sure every test starts with an empty cache of known directories."""
+    module_on_test.clear_known_directories()
+    yield
+    module_on_test.clear_known_directories()
+
+
+def test_ensure_directory_exists_creates_directory(tmp_path: pathlib.Path):
+    """Test that missing directories and their parents are created."""
+    directory = tmp_path / "a" / "b"
+    module_on_test.ensure_directory_exists(directory)
+    assert directory.is_dir()
+
+
+def test_ensure_directory_exists_only_calls_mkdir_once(tmp_path: pathlib.Path):
+    """Test that a directory known to exist is not created again."""
+    directory = tmp_path / "snapshots"
+    with mock.patch.object(pathlib.Path, "mkdir") as mkdir_mock:
+        module_on_test.ensure_directory_exists(directory)
+        module_on_test.ensure_directory_exists(directory)
+        module_on_test.ensure_directory_exists(tmp_path / "snapshots" / ".." / "snapshots")
+    mkdir_mock.assert_called_once()
+
+
+def test_clear_known_directories(tmp_path: pathlib.Path):
+    """Test that a deleted directory is created again after the cache is cleared."""
+    directory = tmp_path / "snapshots"
+    module_on_test.ensure_directory_exists(directory)
+    directory.rmdir()
+    module_on_test.clear_known_directories()
+    module_on_test.ensure_directory_exists(directory)
+    assert directory.is_dir()
+
+
+def test_list_case_directories_is_cached_until_modified(tmp_path: pathlib.Path):
+    """Test that subdirectories are listed once, and listed again when the directory changes."""
+    module_on_test.clear_case_directories()
+    (tmp_path / "case1").mkdir()
+    (tmp_path / "file.txt").write_text("not a case")
+    with mock.patch.object(module_on_test.os, "scandir", wraps=module_on_test.os.scandir) as scandir_mock:
+        assert module_on_test.list_case_directories(tmp_path) == [tmp_path / "case1"]
+        assert module_on_test.list_case_directories(str(tmp_path)) == [tmp_path / "case1"]
+        assert scandir_mock.call_count == 1
+        (tmp_path / "case2").mkdir()
+        os.utime(tmp_path, ns=(0, 1))
+        assert sorted(module_on_test.list_case_directories(tmp_path)) == [tmp_path / "case1", tmp_path / "case2"]
+        assert scandir_mock.call_count == 2
+
+
+def test_merge_namespace_directory(tmp_path: pathlib.Path):
+    """Test that the test results of a namespace replace the ones in the test results directory."""
+    test_results_dir = tmp_path / "__test_results__"
+    namespace_gw0 = test_results_dir / "__workers__" / "gw0"
+    namespace_gw1 = test_results_dir / "__workers__" / "gw1"
+    namespace_gw0.mkdir(parents=True)
+    namespace_gw1.mkdir(parents=True)
+    (test_results_dir / "[module][test_a].txt").write_text("old")
+    (namespace_gw0 / "[module][test_a].txt").write_text("new")
+    (namespace_gw1 / "[module][test_b].txt").write_text("other worker")
+    module_on_test.merge_namespace_directory(namespace_gw0)
+    assert (test_results_dir / "[module][test_a].txt").read_text() == "new"
+    assert not namespace_gw0.exists()
+    module_on_test.merge_namespace_directory(namespace_gw1)
+    assert sorted(path.name for path in test_results_dir.iterdir()) == ["[module][test_a].txt", "[module][test_b].txt"]
+
+
+def test_get_file_paths_from_directories_leaves_out_temporary_files(tmp_path: pathlib.Path):
+    """Test that temporary files of interrupted atomic writes are only listed when included."""
+    (tmp_path / "[module][test_a].txt").write_text("data")
+    (tmp_path / ".[module][test_a].txt.0123abcd.tmp").write_text("partial")
+    assert module_on_test.get_file_paths_from_directories([tmp_path]) == [tmp_path / "[module][test_a].txt"]
+    assert len(module_on_test.get_file_paths_from_directories([tmp_path], include_temporary_files=True)) == 2
+    module_on_test.remove_temporary_files([tmp_path])
+    assert list(tmp_path.iterdir()) == [tmp_path / "[module][test_a].txt"]